@@ -1,16 +1,43 @@
 import os
+
+# Under gevent (GEVENT=1), patch sockets before requests/stripe are imported so blocking IO
+# yields to other greenlets; gunicorn's gevent worker also patches before loading the app
+if os.getenv("GEVENT") == "1":
+    from gevent import monkey
+    monkey.patch_all()
+
+import atexit
 import logging
 import stripe
 import requests
-import json
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import base64
 import hashlib
+import hmac
 import time
-from datetime import datetime
-from flask import Flask, jsonify, request
+import random
+import threading
+import queue
+import functools
+import itertools
+import re
+import decimal
+import uuid
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from flask import Flask, Response, jsonify, request, url_for
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
+from pydantic import ValidationError
+from schemas import OrchestrateRequest, CreateCustomerRequest, FaceSwapRequest, ArMaskRequest, UserTestRequest
+from cache import get_generic_cache, set_generic_cache, add_generic_cache, delete_generic_cache
 
 # Load environment variables from parent directory
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
@@ -18,7 +45,43 @@ load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+
+def _json_default(obj):
+    """Encode the types Flask's default provider handles that orjson does not"""
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)"""
+
+    # Naive datetimes are treated as UTC and rendered with a Z suffix
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Write the encoded bytes straight into the response, no intermediate str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_json_default, option=self.OPTIONS), mimetype="application/json"
+        )
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Upper bound on request bodies (base64 images for face swap / AR masks)
+MAX_CONTENT_LENGTH = 10 * 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
 # CORS configuration for production domain
 CORS(app, 
@@ -38,6 +101,11 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 GROK_API_KEY = os.getenv("GROK_API_KEY")
 GROK_API_BASE = os.getenv("GROK_API_BASE", "https://api.x.ai/v1")
 GROK_MODEL = os.getenv("GROK_MODEL", "grok-beta")
+GROK_CHAT_URL = f"{GROK_API_BASE}/chat/completions"
+GROK_HEADERS = MappingProxyType({
+    "Authorization": f"Bearer {GROK_API_KEY}",
+    "Content-Type": "application/json"
+})
 STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY")
 STRIPE_PUBLISHABLE_KEY = os.getenv("STRIPE_PUBLISHABLE_KEY")
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
@@ -46,6 +114,7 @@ N8N_API_KEY = os.getenv("N8N_API_KEY")
 N8N_WEBHOOK_URL = os.getenv("N8N_WEBHOOK_URL", "http://localhost:5678/webhook")
 FLASK_SECRET_KEY = os.getenv("FLASK_SECRET_KEY", "dev-secret-key")
 REPLICATE_API_TOKEN = os.getenv("REPLICATE_API_TOKEN")
+REPLICATE_WEBHOOK_SECRET = os.getenv("REPLICATE_WEBHOOK_SECRET")
 REPLICATE_VERCEL_INTEGRATION_ID = os.getenv("REPLICATE_VERCEL_INTEGRATION_ID")
 REPLICATE_VERCEL_TOKEN = os.getenv("REPLICATE_VERCEL_TOKEN")
 AGORA_APP_ID = os.getenv("AGORA_APP_ID")
@@ -53,117 +122,331 @@ AGORA_APP_CERTIFICATE = os.getenv("AGORA_APP_CERTIFICATE")
 
 app.secret_key = FLASK_SECRET_KEY
 
+
+def _parse_body(model, error_message):
+    """Validate the raw JSON body against a schema model, returning (body, None) or (None, 400 response)"""
+    try:
+        return model.model_validate_json(request.get_data(cache=False) or b'{}'), None
+    except ValidationError as e:
+        if any(err['type'] == 'json_invalid' for err in e.errors()):
+            return None, (jsonify({"error": "Invalid JSON body"}), 400)
+        return None, (jsonify({"error": error_message}), 400)
+
+def _json_body():
+    """Parse the raw body as a JSON object with orjson, returning (dict, None) or (None, 400 response)"""
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}, None
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None, (jsonify({"error": "Invalid JSON body"}), 400)
+    if not isinstance(data, dict):
+        return None, (jsonify({"error": "JSON body must be an object"}), 400)
+    return data, None
+
+def _payload_too_large():
+    """413 response when the declared body size exceeds MAX_CONTENT_LENGTH, else None"""
+    if request.content_length is not None and request.content_length > MAX_CONTENT_LENGTH:
+        return jsonify({"error": f"Payload too large, limit is {MAX_CONTENT_LENGTH} bytes"}), 413
+    return None
+
 # Stripe Price Configuration
 DEFAULT_PRICE_ID = "price_1S7FP0C41pFAbJdXQMMjixCz"  # New Stripe price ID
 STRIPE_DEFAULT_PRICE = os.getenv("STRIPE_DEFAULT_PRICE", DEFAULT_PRICE_ID)
 
+# Cache lifetimes (seconds) for Stripe lookups
+STRIPE_PRICE_CACHE_TTL = 24 * 60 * 60
+STRIPE_SUBSCRIPTIONS_CACHE_TTL = 60
+
 # Initialize Stripe
 stripe.api_key = STRIPE_SECRET_KEY or "sk_test_placeholder"
+
+# Share one pooled session across all Stripe API calls instead of a fresh TLS handshake per call
+_stripe_session = requests.Session()
+_stripe_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+stripe.default_http_client = stripe.RequestsClient(session=_stripe_session, verify_ssl_certs=True)
+atexit.register(_stripe_session.close)
+
+# Keep-alive session for Replicate and Grok calls; the default Retry only replays idempotent GETs
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+)
+HTTP_SESSION.mount('http://', _http_adapter)
+HTTP_SESSION.mount('https://', _http_adapter)
+atexit.register(HTTP_SESSION.close)
+
 if STRIPE_SECRET_KEY and not STRIPE_SECRET_KEY.startswith("sk_"):
     logger.warning("Invalid Stripe API key format in .env")
 else:
     logger.info("Stripe API key configured")
-    logger.info(f"Default Stripe Price ID: {STRIPE_DEFAULT_PRICE}")
+    logger.info("Default Stripe Price ID: %s", STRIPE_DEFAULT_PRICE)
+
+# Background pool for fire-and-forget n8n workflow triggers
+N8N_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="n8n")
+
+# n8n request timeouts (read, with a shorter connect)
+N8N_TRIGGER_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+N8N_API_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+N8N_PING_TIMEOUT = httpx.Timeout(2.0, connect=1.0)
+
+# Retries for transport errors and gateway statuses, with exponential backoff plus jitter
+N8N_MAX_RETRIES = 3
+N8N_RETRY_BACKOFF = 0.3
+N8N_RETRY_STATUSES = frozenset([502, 503, 504])
+
+# n8n workflow that fans a {"batch": [{"name", "data"}, ...]} payload out to child workflows
+N8N_ROUTER_WORKFLOW = "playalter-router"
+
+# Stop calling n8n for a cooldown period after this many consecutive failures
+N8N_BREAKER_THRESHOLD = 5
+N8N_BREAKER_COOLDOWN = 30
 
 class N8NService:
     """Service class for n8n integration"""
     
     def __init__(self, host, api_key=None):
-        self.host = host
+        self.host = host.rstrip('/')
         self.api_key = api_key
+        # Endpoint prefixes built once; the trigger path only appends the workflow name
+        self._webhook_base = self.host + '/webhook/'
+        self._api_base = self.host + '/api/v1/'
+        self._health_url = self.host + '/healthz'
         self.headers = {
             'Content-Type': 'application/json',
             'X-N8N-API-KEY': api_key
         } if api_key else {'Content-Type': 'application/json'}
+
+        # Shared HTTP/2 client: concurrent triggers multiplex over one TLS connection
+        # when n8n sits behind an HTTP/2 proxy (plain http:// stays on pooled HTTP/1.1)
+        self.client = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=N8N_TRIGGER_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+        atexit.register(self.client.close)
+
+        # (checked_at, reachable) for the cached health probe
+        self._ping_cache = (0.0, False)
+
+        # Last successful workflow listing, served while n8n is unreachable
+        self._last_workflows = None
+
+        # Circuit breaker state shared by all n8n calls
+        self._breaker_lock = threading.Lock()
+        self._fail_count = 0
+        self._last_failure_ts = 0.0
+
+    def close(self):
+        """Close the pooled HTTP client"""
+        self.client.close()
+
+    def _request(self, method, url, timeout, **kwargs):
+        """Send a request, retrying transport errors and 502/503/504 responses"""
+        for attempt in range(N8N_MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                response = self.client.request(method, url, timeout=timeout, **kwargs)
+                if response.status_code not in N8N_RETRY_STATUSES or attempt == N8N_MAX_RETRIES:
+                    return response
+                retry_after = response.headers.get('Retry-After')
+            except httpx.TransportError:
+                if attempt == N8N_MAX_RETRIES:
+                    raise
+
+            delay = N8N_RETRY_BACKOFF * (2 ** attempt) + random.uniform(0, 0.1)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            time.sleep(delay)
+
+    def _circuit_open(self):
+        """True while n8n is considered down and calls should be skipped"""
+        with self._breaker_lock:
+            if self._fail_count < N8N_BREAKER_THRESHOLD:
+                return False
+            return time.monotonic() - self._last_failure_ts < N8N_BREAKER_COOLDOWN
+
+    def _record_success(self):
+        with self._breaker_lock:
+            self._fail_count = 0
+
+    def _record_failure(self):
+        with self._breaker_lock:
+            self._fail_count += 1
+            self._last_failure_ts = time.monotonic()
     
-    def trigger_workflow(self, workflow_name, data):
-        """Trigger an n8n workflow"""
+    def trigger_workflow(self, workflow_name, data=None, raw_body=None):
+        """Trigger an n8n workflow, raw_body is an already JSON-encoded payload sent as-is"""
+        if self._circuit_open():
+            logger.warning("n8n circuit open, skipping workflow '%s'", workflow_name)
+            return {"error": "n8n unavailable"}
         try:
-            webhook_url = f"{self.host}/webhook/{workflow_name}"
-            response = requests.post(webhook_url, json=data, headers=self.headers, timeout=30)
+            webhook_url = self._webhook_base + workflow_name
+            if raw_body is not None:
+                # Client headers already carry Content-Type: application/json
+                response = self._request('POST', webhook_url, N8N_TRIGGER_TIMEOUT, content=raw_body)
+            else:
+                response = self._request('POST', webhook_url, N8N_TRIGGER_TIMEOUT, json=data)
             response.raise_for_status()
-            logger.info(f"n8n workflow '{workflow_name}' triggered successfully")
-            return response.json() if response.content else {"status": "triggered"}
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to trigger n8n workflow '{workflow_name}': {str(e)}")
+            self._record_success()
+            logger.info("n8n workflow '%s' triggered successfully", workflow_name)
+            return orjson.loads(response.content) if response.content else {"status": "triggered"}
+        except httpx.HTTPError as e:
+            self._record_failure()
+            logger.error("Failed to trigger n8n workflow '%s': %s", workflow_name, e)
             return {"error": str(e)}
+
+    def trigger_workflow_async(self, workflow_name, data=None, raw_body=None):
+        """Queue an n8n workflow trigger on the background pool and return its future"""
+        future = N8N_EXECUTOR.submit(self.trigger_workflow, workflow_name, data, raw_body)
+        future.add_done_callback(lambda f: self._log_trigger_failure(workflow_name, f))
+        return future
+
+    def trigger_many(self, pairs):
+        """Trigger several (workflow_name, data) pairs in parallel and return their results in order"""
+        return list(N8N_EXECUTOR.map(lambda pair: self.trigger_workflow(*pair), pairs))
+
+    def trigger_workflows_batch(self, items):
+        """Send several (workflow_name, data) triggers as one request to the router workflow"""
+        body = orjson.dumps({"batch": [{"name": name, "data": data} for name, data in items]})
+        return self.trigger_workflow(N8N_ROUTER_WORKFLOW, raw_body=body)
+
+    def flush_triggers_async(self, items):
+        """Queue collected triggers: a single one goes straight to its workflow, several go through the router"""
+        if len(items) == 1:
+            workflow_name, data = items[0]
+            return self.trigger_workflow_async(workflow_name, raw_body=orjson.dumps(data))
+        future = N8N_EXECUTOR.submit(self.trigger_workflows_batch, items)
+        future.add_done_callback(lambda f: self._log_trigger_failure(N8N_ROUTER_WORKFLOW, f))
+        return future
+
+    @staticmethod
+    def _log_trigger_failure(workflow_name, future):
+        """Done-callback for background triggers; request errors are already logged by trigger_workflow"""
+        if future.cancelled():
+            return
+        e = future.exception()
+        if e is not None:
+            logger.error("Background n8n workflow '%s' crashed: %s", workflow_name, e)
+    
+    def ping(self, ttl=15):
+        """Return cached n8n reachability, probing at most once per ttl seconds"""
+        checked_at, reachable = self._ping_cache
+        if time.monotonic() - checked_at < ttl:
+            return reachable
+
+        try:
+            response = self.client.get(self._health_url, timeout=N8N_PING_TIMEOUT)
+            reachable = response.is_success
+        except httpx.HTTPError as e:
+            logger.warning("n8n health probe failed: %s", e)
+            reachable = False
+
+        self._ping_cache = (time.monotonic(), reachable)
+        return reachable
     
     def get_workflows(self):
-        """Get list of available workflows"""
+        """Get list of available workflows, falling back to the last good listing on errors"""
+        if self._circuit_open():
+            return self._last_workflows or {"error": "n8n unavailable"}
         try:
-            response = requests.get(f"{self.host}/api/v1/workflows", headers=self.headers, timeout=10)
+            response = self._request('GET', self._api_base + 'workflows', N8N_API_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch n8n workflows: {str(e)}")
+            self._record_success()
+            self._last_workflows = orjson.loads(response.content)
+            return self._last_workflows
+        except httpx.HTTPError as e:
+            self._record_failure()
+            if self._last_workflows is not None:
+                logger.warning("Failed to fetch n8n workflows, serving last listing: %s", e)
+                return self._last_workflows
+            logger.error("Failed to fetch n8n workflows: %s", e)
             return {"error": str(e)}
     
     def execute_workflow(self, workflow_id, data):
         """Execute a specific workflow by ID"""
+        if self._circuit_open():
+            return {"error": "n8n unavailable"}
         try:
-            response = requests.post(
-                f"{self.host}/api/v1/workflows/{workflow_id}/execute",
-                json=data,
-                headers=self.headers,
-                timeout=30
+            response = self._request(
+                'POST',
+                f"{self._api_base}workflows/{workflow_id}/execute",
+                N8N_TRIGGER_TIMEOUT,
+                json=data
             )
             response.raise_for_status()
-            logger.info(f"n8n workflow {workflow_id} executed successfully")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to execute n8n workflow {workflow_id}: {str(e)}")
+            self._record_success()
+            logger.info("n8n workflow %s executed successfully", workflow_id)
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            self._record_failure()
+            logger.error("Failed to execute n8n workflow %s: %s", workflow_id, e)
             return {"error": str(e)}
 
 # Initialize n8n service
 n8n_service = N8NService(N8N_HOST, N8N_API_KEY)
+# Registered after the client's close hook so queued triggers drain before it runs (atexit is LIFO)
+atexit.register(N8N_EXECUTOR.shutdown, wait=True)
+
+# Agent catalog shared by every AIAgentService, read-only
+_AGENTS = MappingProxyType({
+    "swap": {
+        "name": "Face Swap Agent",
+        "description": "Handles face swap operations using Replicate API",
+        "provider": "replicate",
+        "tasks": ["analyze_faces", "swap_faces", "enhance_output"],
+        "config": {
+            "model": "replicate/face-swap",
+            "cost_per_call": 0.02,
+            "avg_latency_ms": 2500
+        }
+    },
+    "mask": {
+        "name": "AR Mask Agent",
+        "description": "Applies AR masks using MediaPipe",
+        "provider": "mediapipe",
+        "tasks": ["detect_landmarks", "apply_mask", "render_ar"],
+        "config": {
+            "model": "mediapipe/face-mesh",
+            "cost_per_call": 0.001,
+            "avg_latency_ms": 50
+        }
+    },
+    "stream": {
+        "name": "Stream Agent",
+        "description": "Manages live streaming with Agora RTM",
+        "provider": "agora",
+        "tasks": ["init_stream", "manage_rtm", "handle_events"],
+        "config": {
+            "sdk": "agora-rtm",
+            "cost_per_minute": 0.004,
+            "max_concurrent": 10000
+        }
+    }
+})
+
+@functools.lru_cache(maxsize=1)
+def _agent_listing() -> Tuple[Dict[str, Any], ...]:
+    """Flattened agent catalog, built once; callers only read it"""
+    return tuple({"type": k, **v} for k, v in _AGENTS.items())
 
 class AIAgentService:
     """AI Agent Service for CrewAI and LangChain integration"""
 
     def __init__(self):
-        self.agents = {
-            "swap": {
-                "name": "Face Swap Agent",
-                "description": "Handles face swap operations using Replicate API",
-                "provider": "replicate",
-                "tasks": ["analyze_faces", "swap_faces", "enhance_output"],
-                "config": {
-                    "model": "replicate/face-swap",
-                    "cost_per_call": 0.02,
-                    "avg_latency_ms": 2500
-                }
-            },
-            "mask": {
-                "name": "AR Mask Agent",
-                "description": "Applies AR masks using MediaPipe",
-                "provider": "mediapipe",
-                "tasks": ["detect_landmarks", "apply_mask", "render_ar"],
-                "config": {
-                    "model": "mediapipe/face-mesh",
-                    "cost_per_call": 0.001,
-                    "avg_latency_ms": 50
-                }
-            },
-            "stream": {
-                "name": "Stream Agent",
-                "description": "Manages live streaming with Agora RTM",
-                "provider": "agora",
-                "tasks": ["init_stream", "manage_rtm", "handle_events"],
-                "config": {
-                    "sdk": "agora-rtm",
-                    "cost_per_minute": 0.004,
-                    "max_concurrent": 10000
-                }
-            }
-        }
+        self.agents = _AGENTS
 
     def get_agent(self, agent_type: str) -> Dict[str, Any]:
         """Get agent configuration by type"""
         return self.agents.get(agent_type, {})
 
-    def list_agents(self) -> List[Dict[str, Any]]:
+    def list_agents(self) -> Tuple[Dict[str, Any], ...]:
         """List all available agents"""
-        return [{"type": k, **v} for k, v in self.agents.items()]
+        return _agent_listing()
 
     def execute_swap_task(self, source_image: str, target_image: str) -> Dict[str, Any]:
         """Execute face swap task (mock for prototype)"""
@@ -197,13 +480,13 @@ class AIAgentService:
                 }
             }
         except Exception as e:
-            logger.error(f"Face swap task error: {str(e)}")
+            logger.error("Face swap task error: %s", e)
             return {"status": "error", "message": str(e)}
 
     def execute_mask_task(self, image: str, mask_type: str) -> Dict[str, Any]:
         """Execute AR mask task (mock for prototype)"""
         try:
-            logger.info(f"Applying {mask_type} mask with MediaPipe")
+            logger.info("Applying %s mask with MediaPipe", mask_type)
 
             # Mock MediaPipe processing
             return {
@@ -218,13 +501,13 @@ class AIAgentService:
                 }
             }
         except Exception as e:
-            logger.error(f"AR mask task error: {str(e)}")
+            logger.error("AR mask task error: %s", e)
             return {"status": "error", "message": str(e)}
 
     def execute_stream_task(self, channel_id: str, user_id: str) -> Dict[str, Any]:
         """Execute stream management task (mock for prototype)"""
         try:
-            logger.info(f"Initializing stream for channel {channel_id}")
+            logger.info("Initializing stream for channel %s", channel_id)
 
             # Mock Agora RTM initialization
             return {
@@ -241,12 +524,16 @@ class AIAgentService:
                 }
             }
         except Exception as e:
-            logger.error(f"Stream task error: {str(e)}")
+            logger.error("Stream task error: %s", e)
             return {"status": "error", "message": str(e)}
 
 # Initialize AI Agent service
 ai_agent_service = AIAgentService()
 
+def _without_empty(params):
+    """Drop optional Stripe parameters that were not provided"""
+    return {k: v for k, v in params.items() if v}
+
 class StripeService:
     """Enhanced Stripe service with comprehensive functionality"""
     
@@ -254,71 +541,90 @@ class StripeService:
     def create_customer(email, name=None, metadata=None):
         """Create a new Stripe customer"""
         try:
-            customer_data = {"email": email}
-            if name:
-                customer_data["name"] = name
-            if metadata:
-                customer_data["metadata"] = metadata
-            
-            customer = stripe.Customer.create(**customer_data)
-            logger.info(f"Stripe customer created: {customer.id}")
+            customer = stripe.Customer.create(email=email, **_without_empty({"name": name, "metadata": metadata}))
+            logger.info("Stripe customer created: %s", customer.id)
             return customer
         except stripe.StripeError as e:
-            logger.error(f"Failed to create Stripe customer: {str(e)}")
+            logger.error("Failed to create Stripe customer: %s", e)
             raise
     
     @staticmethod
     def create_product(name, description=None, metadata=None):
         """Create a new Stripe product"""
         try:
-            product_data = {"name": name}
-            if description:
-                product_data["description"] = description
-            if metadata:
-                product_data["metadata"] = metadata
-            
-            product = stripe.Product.create(**product_data)
-            logger.info(f"Stripe product created: {product.id}")
+            product = stripe.Product.create(
+                name=name,
+                **_without_empty({"description": description, "metadata": metadata})
+            )
+            logger.info("Stripe product created: %s", product.id)
             return product
         except stripe.StripeError as e:
-            logger.error(f"Failed to create Stripe product: {str(e)}")
+            logger.error("Failed to create Stripe product: %s", e)
             raise
     
     @staticmethod
     def create_price(product_id, unit_amount, currency="usd", recurring=None):
         """Create a new Stripe price"""
         try:
-            price_data = {
-                "product": product_id,
-                "unit_amount": unit_amount,
-                "currency": currency
-            }
-            if recurring:
-                price_data["recurring"] = recurring
-            
-            price = stripe.Price.create(**price_data)
-            logger.info(f"Stripe price created: {price.id}")
+            price = stripe.Price.create(
+                product=product_id,
+                unit_amount=unit_amount,
+                currency=currency,
+                **_without_empty({"recurring": recurring})
+            )
+            logger.info("Stripe price created: %s", price.id)
             return price
         except stripe.StripeError as e:
-            logger.error(f"Failed to create Stripe price: {str(e)}")
+            logger.error("Failed to create Stripe price: %s", e)
             raise
     
     @staticmethod
     def get_customer_subscriptions(customer_id):
-        """Get all subscriptions for a customer"""
+        """Iterate over all subscriptions for a customer as plain dicts, across every page"""
+        try:
+            subscriptions = stripe.Subscription.list(
+                customer=customer_id,
+                limit=100,
+                expand=['data.items.data.price']
+            )
+            return (sub.to_dict_recursive() for sub in subscriptions.auto_paging_iter())
+        except stripe.StripeError as e:
+            logger.error("Failed to fetch subscriptions for customer %s: %s", customer_id, e)
+            raise
+
+    @staticmethod
+    def get_price(price_id):
+        """Get price metadata (with its product), cached for STRIPE_PRICE_CACHE_TTL"""
+        cache_key = f"stripe_price:{price_id}"
+        cached = get_generic_cache(cache_key)
+        if cached:
+            return orjson.loads(cached)
+
         try:
-            subscriptions = stripe.Subscription.list(customer=customer_id)
-            return subscriptions
+            price = stripe.Price.retrieve(price_id, expand=["product"]).to_dict_recursive()
         except stripe.StripeError as e:
-            logger.error(f"Failed to fetch subscriptions for customer {customer_id}: {str(e)}")
+            logger.error("Failed to fetch Stripe price %s: %s", price_id, e)
             raise
 
+        set_generic_cache(cache_key, orjson.dumps(price), STRIPE_PRICE_CACHE_TTL)
+        return price
+
+# Probes hit /health every few seconds per replica, so the encoded response is reused briefly
+HEALTH_CACHE_TTL = 10
+_health_cache = (0.0, None)
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    n8n_status = "connected" if n8n_service.get_workflows().get("error") is None else "disconnected"
+    global _health_cache
+    checked_at, body = _health_cache
+    if body is not None and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+        return Response(body, status=200, mimetype='application/json')
+
+    now = datetime.now(timezone.utc).isoformat()
+    n8n_status = "connected" if n8n_service.ping() else "disconnected"
     
-    return jsonify({
+    body = orjson.dumps({
         "status": "healthy",
         "service": "PLAYALTER Backend",
         "version": "2.0.0",
@@ -328,40 +634,54 @@ def health_check():
             "openai": "configured" if OPENAI_API_KEY else "not_configured",
             "grok": "configured" if GROK_API_KEY else "not_configured"
         },
-        "timestamp": datetime.utcnow().isoformat()
-    }), 200
+        "timestamp": now
+    })
+    _health_cache = (time.monotonic(), body)
+    return Response(body, status=200, mimetype='application/json')
+
+# n8n workflow triggered for each orchestration operation type
+WORKFLOW_MAPPING = {
+    "swap": "face-swap-workflow",
+    "mask": "ar-mask-workflow",
+    "stream": "live-stream-workflow",
+    "payment": "payment-processing-workflow",
+    "general": "general-ai-workflow"
+}
 
 @app.route('/api/orchestrate', methods=['POST'])
 def orchestrate():
     """Enhanced orchestration with n8n integration"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json(silent=True) or {}
-        operation_type = data.get('operation', 'general')
-        user_request = data.get('request', '')
-        user_id = data.get('user_id')
+        # Malformed bodies fall back to a general request, as before
+        try:
+            body = OrchestrateRequest.model_validate_json(request.get_data(cache=False) or b'{}')
+        except ValidationError:
+            body = OrchestrateRequest()
+        operation_type = body.operation
+        user_request = body.request
+        user_id = body.user_id
         
-        logger.info(f"Orchestration request: {operation_type} - {user_request}")
+        # user_request can be large, keep it out of the INFO log
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Orchestration request: %s len=%d", operation_type, len(user_request))
         
         # Prepare data for n8n workflow
         workflow_data = {
             "operation": operation_type,
             "request": user_request,
             "user_id": user_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now,
             "source": "playalter_backend"
         }
         
         # Trigger appropriate n8n workflow based on operation type
-        workflow_mapping = {
-            "swap": "face-swap-workflow",
-            "mask": "ar-mask-workflow", 
-            "stream": "live-stream-workflow",
-            "payment": "payment-processing-workflow",
-            "general": "general-ai-workflow"
-        }
-        
-        workflow_name = workflow_mapping.get(operation_type, "general-ai-workflow")
-        n8n_result = n8n_service.trigger_workflow(workflow_name, workflow_data)
+        workflow_name = WORKFLOW_MAPPING.get(operation_type, "general-ai-workflow")
+        if request.args.get('async', '').lower() in ('1', 'true'):
+            n8n_service.trigger_workflow_async(workflow_name, workflow_data)
+            n8n_result = {"queued": True, "workflow": workflow_name}
+        else:
+            n8n_result = n8n_service.trigger_workflow(workflow_name, workflow_data)
         
         response_data = {
             "status": "success",
@@ -369,39 +689,39 @@ def orchestrate():
             "message": f"Orchestration completed for {operation_type} operation",
             "n8n_response": n8n_result,
             "workflow_triggered": workflow_name,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }
         
         return jsonify(response_data), 200
         
     except Exception as e:
-        logger.error(f"Orchestration error: {str(e)}")
+        logger.error("Orchestration error: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 500
 
 @app.route('/api/customers', methods=['POST'])
 def create_customer():
     """Create a new Stripe customer"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json()
-        email = data.get('email')
-        name = data.get('name')
-        metadata = data.get('metadata', {})
-        
-        if not email:
-            return jsonify({"error": "Email is required"}), 400
+        body, error = _parse_body(CreateCustomerRequest, "Email is required")
+        if error:
+            return error
+        email = body.email
+        name = body.name
+        metadata = body.metadata
         
         customer = StripeService.create_customer(email, name, metadata)
         
         # Trigger n8n workflow for new customer
-        n8n_service.trigger_workflow("new-customer-workflow", {
+        n8n_service.trigger_workflow_async("new-customer-workflow", {
             "customer_id": customer.id,
             "email": email,
             "name": name,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": now
         })
         
         return jsonify({
@@ -416,14 +736,16 @@ def create_customer():
     except stripe.StripeError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error creating customer: {str(e)}")
+        logger.error("Error creating customer: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @app.route('/api/products', methods=['POST'])
 def create_product():
     """Create a new Stripe product"""
     try:
-        data = request.get_json()
+        data, error = _json_body()
+        if error:
+            return error
         name = data.get('name')
         description = data.get('description')
         metadata = data.get('metadata', {})
@@ -445,24 +767,37 @@ def create_product():
     except stripe.StripeError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error creating product: {str(e)}")
+        logger.error("Error creating product: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 @app.route('/api/create-checkout-session', methods=['POST'])
 def create_checkout_session():
     """Enhanced checkout session creation"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json()
+        data, error = _json_body()
+        if error:
+            return error
         price_id = data.get('priceId', STRIPE_DEFAULT_PRICE)  # Use default if not provided
         customer_email = data.get('email')
         success_url = data.get('success_url', 'http://localhost:5173/payment-success')
         cancel_url = data.get('cancel_url', 'http://localhost:5173/payment-cancel')
         mode = data.get('mode', 'subscription')
         
-        logger.info(f"Creating checkout session with price ID: {price_id}")
+        logger.info("Creating checkout session with price ID: %s", price_id)
         
         if not price_id:
             return jsonify({"error": "Price ID is required"}), 400
+
+        # The price is fetched lazily here and then cached for every worker. If the lookup
+        # fails, checkout goes ahead and Stripe itself rejects an inactive price
+        try:
+            price_active = StripeService.get_price(price_id).get("active", True)
+        except Exception as e:
+            logger.warning("Price lookup for %s failed, leaving the check to Stripe: %s", price_id, e)
+            price_active = True
+        if not price_active:
+            return jsonify({"error": f"Price {price_id} is not active"}), 400
         
         session_data = {
             "payment_method_types": ['card'],
@@ -486,15 +821,15 @@ def create_checkout_session():
         session = stripe.checkout.Session.create(**session_data)
         
         # Trigger n8n workflow for checkout session creation
-        n8n_service.trigger_workflow("checkout-session-created", {
+        n8n_service.trigger_workflow_async("checkout-session-created", {
             "session_id": session.id,
             "price_id": price_id,
             "customer_email": customer_email,
             "mode": mode,
-            "created_at": datetime.utcnow().isoformat()
+            "created_at": now
         })
         
-        logger.info(f"Checkout session created: {session.id}")
+        logger.info("Checkout session created: %s", session.id)
         
         return jsonify({
             "status": "success",
@@ -504,232 +839,359 @@ def create_checkout_session():
         }), 200
 
     except stripe.StripeError as e:
-        logger.error(f"Stripe error: {str(e)}")
+        logger.error("Stripe error: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error creating checkout session: {str(e)}")
+        logger.error("Error creating checkout session: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/subscriptions/<customer_id>', methods=['GET'])
 def get_customer_subscriptions(customer_id):
     """Get customer subscriptions"""
     try:
-        subscriptions = StripeService.get_customer_subscriptions(customer_id)
-        
-        return jsonify({
-            "status": "success",
-            "subscriptions": [{
-                "id": sub.id,
-                "status": sub.status,
-                "current_period_start": sub.current_period_start,
-                "current_period_end": sub.current_period_end,
-                "price_id": sub.items.data[0].price.id if sub.items.data else None
-            } for sub in subscriptions.data]
-        }), 200
+        cache_key = f"stripe_subs:{customer_id}"
+        subscriptions_json = get_generic_cache(cache_key)
+        if not subscriptions_json:
+            # Walk every page lazily and encode the summaries once; the bytes are cached as-is
+            subscriptions_json = orjson.dumps([{
+                "id": s["id"],
+                "status": s["status"],
+                "current_period_start": s["current_period_start"],
+                "current_period_end": s["current_period_end"],
+                "price_id": s["items"]["data"][0]["price"]["id"] if s["items"]["data"] else None
+            } for s in StripeService.get_customer_subscriptions(customer_id)])
+            set_generic_cache(cache_key, subscriptions_json, STRIPE_SUBSCRIPTIONS_CACHE_TTL)
+
+        # Splice the encoded list into the envelope rather than decoding and re-encoding it
+        body = b'{"status":"success","subscriptions":' + subscriptions_json + b'}'
+        return Response(body, status=200, mimetype='application/json')
         
     except stripe.StripeError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"Error fetching subscriptions: {str(e)}")
+        logger.error("Error fetching subscriptions: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
+# Stripe event type -> n8n workflow name
+STRIPE_EVENT_TO_WORKFLOW = {
+    'payment_intent.succeeded': 'payment-succeeded',
+    'payment_intent.payment_failed': 'payment-failed',
+    'checkout.session.completed': 'checkout-completed',
+    'customer.subscription.created': 'subscription-created',
+    'customer.subscription.updated': 'subscription-updated',
+    'customer.subscription.deleted': 'subscription-deleted',
+    'invoice.payment_succeeded': 'invoice-paid',
+    'invoice.payment_failed': 'invoice-failed'
+}
+
+# Stripe retries deliveries with the same event id; remember ids for 10 minutes
+STRIPE_EVENT_DEDUP_TTL = 10 * 60
+SEEN_EVENTS = TTLCache(maxsize=10000, ttl=STRIPE_EVENT_DEDUP_TTL)
+_seen_events_lock = threading.Lock()
+
+def is_duplicate_event(event_id):
+    """Record a webhook event id, returning True if it was already handled"""
+    with _seen_events_lock:
+        if event_id in SEEN_EVENTS:
+            return True
+        SEEN_EVENTS[event_id] = True
+    # Other gunicorn workers may have received the earlier delivery
+    return not add_generic_cache(f"stripe_evt:{event_id}", 1, STRIPE_EVENT_DEDUP_TTL)
+
+# Reject webhook signatures older than this many seconds (Stripe's default tolerance)
+STRIPE_WEBHOOK_TOLERANCE = 300
+
+# Keyed once at import; each verification copies it instead of re-deriving the HMAC key
+_STRIPE_WEBHOOK_HMAC = hmac.new(STRIPE_WEBHOOK_SECRET.encode(), digestmod=hashlib.sha256) if STRIPE_WEBHOOK_SECRET else None
+
+def verify_stripe_signature(payload, sig_header, base_mac=_STRIPE_WEBHOOK_HMAC, tolerance=STRIPE_WEBHOOK_TOLERANCE):
+    """Check a Stripe-Signature header against the raw body bytes, raising SignatureVerificationError"""
+    timestamp = None
+    signatures = []
+    for item in (sig_header or '').split(','):
+        key, _, value = item.strip().partition('=')
+        if key == 't':
+            timestamp = value
+        elif key == 'v1':
+            signatures.append(value)
+
+    if not timestamp or not timestamp.isdigit() or not signatures:
+        raise stripe.SignatureVerificationError("Unable to extract timestamp and signatures from header", sig_header, payload)
+
+    mac = base_mac.copy()
+    mac.update(timestamp.encode())
+    mac.update(b'.')
+    mac.update(payload)
+    expected = mac.hexdigest()
+    if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+        raise stripe.SignatureVerificationError("No signatures found matching the expected signature for payload", sig_header, payload)
+    if tolerance and int(timestamp) < time.time() - tolerance:
+        raise stripe.SignatureVerificationError("Timestamp outside the tolerance zone", sig_header, payload)
+
 @app.route('/api/stripe-webhook', methods=['POST'])
 def stripe_webhook():
     """Enhanced Stripe webhook with n8n integration"""
-    payload = request.get_data(as_text=True)
+    now = datetime.now(timezone.utc).isoformat()
+    # Read the raw body once; it is used both for signature verification and parsing
+    payload = request.get_data(cache=False)
     sig_header = request.headers.get('Stripe-Signature')
 
     try:
         if STRIPE_WEBHOOK_SECRET:
-            event = stripe.Webhook.construct_event(payload, sig_header, STRIPE_WEBHOOK_SECRET)
-        else:
-            event = stripe.Event.construct_from(request.get_json(), stripe.api_key)
+            verify_stripe_signature(payload, sig_header)
+        # Only type, id and data are needed, so keep the event as a plain dict
+        event = orjson.loads(payload)
+        event_type = event['type']
+        event_id = event['id']
 
-        logger.info(f"Stripe webhook received: {event.type}")
+        logger.info("Stripe webhook received: %s", event_type)
+
+        if is_duplicate_event(event_id):
+            logger.info("Stripe event %s already handled, skipping", event_id)
+            return jsonify({'status': 'duplicate', 'event_type': event_type, 'timestamp': now}), 200
 
         # Enhanced event handling with n8n integration
         event_data = {
-            "event_type": event.type,
-            "event_id": event.id,
-            "data": event.data,
-            "timestamp": datetime.utcnow().isoformat()
+            "event_type": event_type,
+            "event_id": event_id,
+            "data": event['data'],
+            "timestamp": now
         }
 
-        # Trigger n8n workflow for each event type
-        workflow_triggered = False
-        
-        if event.type == 'payment_intent.succeeded':
-            logger.info("Payment intent succeeded")
-            n8n_service.trigger_workflow("payment-succeeded", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'payment_intent.payment_failed':
-            logger.info("Payment intent failed")
-            n8n_service.trigger_workflow("payment-failed", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'checkout.session.completed':
-            logger.info("Checkout session completed")
-            n8n_service.trigger_workflow("checkout-completed", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'customer.subscription.created':
-            logger.info("Subscription created")
-            n8n_service.trigger_workflow("subscription-created", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'customer.subscription.updated':
-            logger.info("Subscription updated")
-            n8n_service.trigger_workflow("subscription-updated", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'customer.subscription.deleted':
-            logger.info("Subscription deleted")
-            n8n_service.trigger_workflow("subscription-deleted", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'invoice.payment_succeeded':
-            logger.info("Invoice payment succeeded")
-            n8n_service.trigger_workflow("invoice-paid", event_data)
-            workflow_triggered = True
-            
-        elif event.type == 'invoice.payment_failed':
-            logger.info("Invoice payment failed")
-            n8n_service.trigger_workflow("invoice-failed", event_data)
-            workflow_triggered = True
-        else:
-            logger.info(f"Unhandled event type: {event.type}")
-            # Trigger generic webhook workflow for unhandled events
-            n8n_service.trigger_workflow("stripe-webhook-generic", event_data)
-            workflow_triggered = True
+        # Drop cached subscription lists whenever a customer's subscriptions change
+        if event_type in ('checkout.session.completed', 'customer.subscription.created',
+                          'customer.subscription.updated', 'customer.subscription.deleted'):
+            customer_id = event['data']['object'].get('customer')
+            if customer_id:
+                delete_generic_cache(f"stripe_subs:{customer_id}")
+
+        # Drop cached price metadata (checkout is gated on its active flag) when the price
+        # or the product embedded in it changes
+        if event_type in ('price.updated', 'price.deleted'):
+            delete_generic_cache(f"stripe_price:{event['data']['object']['id']}")
+        elif event_type in ('product.updated', 'product.deleted'):
+            default_price = event['data']['object'].get('default_price')
+            if default_price:
+                delete_generic_cache(f"stripe_price:{default_price}")
+
+        # Collect the n8n workflows for this event (generic workflow for unhandled events)
+        # and flush them in one go, batched through the router when there are several
+        workflow_name = STRIPE_EVENT_TO_WORKFLOW.get(event_type, "stripe-webhook-generic")
+        logger.info("Stripe event %s -> n8n workflow '%s'", event_type, workflow_name)
+        triggers = [(workflow_name, event_data)]
+        n8n_service.flush_triggers_async(triggers)
+        workflow_triggered = True
 
         return jsonify({
             'status': 'success',
-            'event_type': event.type,
+            'event_type': event_type,
             'n8n_triggered': workflow_triggered,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': now
         }), 200
 
     except ValueError as e:
-        logger.error(f"Invalid payload: {str(e)}")
+        logger.error("Invalid payload: %s", e)
         return jsonify({'error': 'Invalid payload'}), 400
     except stripe.SignatureVerificationError as e:
-        logger.error(f"Invalid signature: {str(e)}")
+        logger.error("Invalid signature: %s", e)
         return jsonify({'error': 'Invalid signature'}), 400
     except Exception as e:
-        logger.error(f"Webhook error: {str(e)}")
+        logger.error("Webhook error: %s", e)
         return jsonify({'error': 'Internal server error'}), 500
 
+# Encoded /api/n8n/workflows response, shared by all workers through Redis
+N8N_WORKFLOWS_CACHE_KEY = "n8n:workflows:v1"
+N8N_WORKFLOWS_CACHE_TTL = 60
+
 @app.route('/api/n8n/workflows', methods=['GET'])
 def get_n8n_workflows():
     """Get available n8n workflows"""
     try:
+        cached = get_generic_cache(N8N_WORKFLOWS_CACHE_KEY)
+        if cached is not None:
+            return Response(cached, status=200, mimetype='application/json')
+
         workflows = n8n_service.get_workflows()
-        return jsonify({
+        body = orjson.dumps({
             "status": "success",
             "workflows": workflows
-        }), 200
+        })
+        # Only cache real listings, not the error placeholder returned while n8n is down
+        if not (isinstance(workflows, dict) and "error" in workflows):
+            set_generic_cache(N8N_WORKFLOWS_CACHE_KEY, body, N8N_WORKFLOWS_CACHE_TTL)
+        return Response(body, status=200, mimetype='application/json')
     except Exception as e:
-        logger.error(f"Error fetching n8n workflows: {str(e)}")
+        logger.error("Error fetching n8n workflows: %s", e)
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/n8n/workflows/invalidate', methods=['POST'])
+def invalidate_n8n_workflows():
+    """Drop the cached n8n workflow list so the next request refetches it"""
+    delete_generic_cache(N8N_WORKFLOWS_CACHE_KEY)
+    return jsonify({"status": "invalidated"}), 200
+
 @app.route('/api/n8n/trigger/<workflow_name>', methods=['POST'])
 def trigger_n8n_workflow(workflow_name):
     """Manually trigger an n8n workflow"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json() or {}
+        data, error = _json_body()
+        if error:
+            return error
         result = n8n_service.trigger_workflow(workflow_name, data)
         
         return jsonify({
             "status": "success",
             "workflow": workflow_name,
             "result": result,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 200
         
     except Exception as e:
-        logger.error(f"Error triggering n8n workflow {workflow_name}: {str(e)}")
+        logger.error("Error triggering n8n workflow %s: %s", workflow_name, e)
         return jsonify({"error": str(e)}), 500
 
+# Completed Replicate predictions delivered by webhook, read back by the face swap status route
+REPLICATE_RESULT_TTL = 60 * 60
+REPLICATE_WEBHOOK_TOLERANCE = 300
+
+# Inline polling budget before face_swap hands back a prediction id (seconds)
+FACE_SWAP_POLL_BUDGET = 10
+FACE_SWAP_POLL_MAX_INTERVAL = 2
+# Per-request limits on the Replicate calls made from face_swap, so one hung request
+# cannot hold the worker past the poll budget
+FACE_SWAP_CREATE_TIMEOUT = 30
+FACE_SWAP_POLL_TIMEOUT = 10
+
+# Images at least this large (base64 chars) are uploaded to Replicate's Files API
+# and passed by URL instead of being embedded in the prediction JSON
+REPLICATE_INLINE_IMAGE_LIMIT = 64 * 1024
+
+def _replicate_image_input(image):
+    """Return a Replicate input for a client image: URLs and small images as-is, large ones as a file URL"""
+    if len(image) < REPLICATE_INLINE_IMAGE_LIMIT or image.startswith(('http://', 'https://')):
+        return image
+
+    content_type = 'image/jpeg'
+    encoded = image
+    if image.startswith('data:'):
+        header, _, encoded = image.partition(',')
+        content_type = header[5:].split(';', 1)[0] or content_type
+
+    try:
+        response = HTTP_SESSION.post(
+            'https://api.replicate.com/v1/files',
+            headers={'Authorization': f'Token {REPLICATE_API_TOKEN}'},
+            files={'content': ('image', base64.b64decode(encoded), content_type)},
+            timeout=30
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)['urls']['get']
+    except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+        logger.warning("Replicate file upload failed, sending image inline: %s", e)
+        return image
+
+def _face_swap_response(prediction_id, prediction, now):
+    """Map a Replicate prediction to the face swap API response"""
+    status = prediction.get('status')
+    if status == 'succeeded':
+        return jsonify({
+            "status": "success",
+            "swapped_url": prediction.get('output'),
+            "prediction_id": prediction_id,
+            "processing_time": (prediction.get('metrics') or {}).get('predict_time'),
+            "timestamp": now
+        }), 200
+    if status in ('failed', 'canceled'):
+        return jsonify({
+            "status": "error",
+            "message": "Face swap failed",
+            "error": prediction.get('error')
+        }), 500
+    return jsonify({
+        "status": "processing",
+        "prediction_id": prediction_id,
+        "message": "Face swap is still processing"
+    }), 202
+
 @app.route('/api/face-swap', methods=['POST'])
 def face_swap():
     """Face swap operation with Replicate API"""
+    now = datetime.now(timezone.utc).isoformat()
+    # Reject oversized uploads before the body is read into memory
+    too_large = _payload_too_large()
+    if too_large:
+        return too_large
     try:
-        data = request.get_json()
-        source_base64 = data.get('source_base64', data.get('source_image'))
-        target_base64 = data.get('target_base64', data.get('target_image'))
-        user_id = data.get('user_id')
-
-        if not source_base64 or not target_base64:
-            return jsonify({"error": "Both source_base64 and target_base64 are required"}), 400
+        body, error = _parse_body(FaceSwapRequest, "Both source_base64 and target_base64 are required")
+        if error:
+            return error
+        source_base64 = body.source_base64
+        target_base64 = body.target_base64
+        user_id = body.user_id
 
         # Use Replicate API if token is available
-        logger.info(f"REPLICATE_API_TOKEN exists: {bool(REPLICATE_API_TOKEN)}")
+        logger.info("REPLICATE_API_TOKEN exists: %s", bool(REPLICATE_API_TOKEN))
         if REPLICATE_API_TOKEN:
-            logger.info(f"REPLICATE_API_TOKEN length: {len(REPLICATE_API_TOKEN)}")
-            logger.info(f"REPLICATE_API_TOKEN starts with: {REPLICATE_API_TOKEN[:10]}...")
+            logger.info("REPLICATE_API_TOKEN length: %s", len(REPLICATE_API_TOKEN))
         if REPLICATE_API_TOKEN:
             logger.info("Using Replicate API for face swap")
 
+            prediction_request = {
+                'version': 'lucataco/faceswap:9a4298548422074c3f57258c5d544497314ae4112df80d116f0d2109e843d20d',
+                'input': {
+                    'source_image': _replicate_image_input(source_base64),
+                    'target_image': _replicate_image_input(target_base64)
+                }
+            }
+            # Have Replicate push the result to us so clients can pick it up from the status route
+            if REPLICATE_WEBHOOK_SECRET:
+                prediction_request['webhook'] = url_for('replicate_webhook', _external=True)
+                prediction_request['webhook_events_filter'] = ['completed']
+
             # Call Replicate API
-            replicate_response = requests.post(
+            replicate_response = HTTP_SESSION.post(
                 'https://api.replicate.com/v1/predictions',
                 headers={'Authorization': f'Token {REPLICATE_API_TOKEN}'},
-                json={
-                    'version': 'lucataco/faceswap:9a4298548422074c3f57258c5d544497314ae4112df80d116f0d2109e843d20d',
-                    'input': {
-                        'source_image': source_base64,
-                        'target_image': target_base64
-                    }
-                }
+                json=prediction_request,
+                timeout=FACE_SWAP_CREATE_TIMEOUT
             )
 
             if replicate_response.status_code == 201:
-                prediction = replicate_response.json()
+                prediction = orjson.loads(replicate_response.content)
                 prediction_id = prediction.get('id')
 
-                # Poll for completion (in production, use webhooks)
-                max_attempts = 30
-                for attempt in range(max_attempts):
-                    status_response = requests.get(
+                # The webhook delivers the result, so don't hold the worker polling for it
+                if REPLICATE_WEBHOOK_SECRET:
+                    return _face_swap_response(prediction_id, prediction, now)
+
+                # Poll with exponential backoff so fast swaps still return inline,
+                # then hand back the prediction id instead of pinning the worker
+                interval = 0.25
+                deadline = time.monotonic() + FACE_SWAP_POLL_BUDGET
+                while time.monotonic() < deadline:
+                    time.sleep(interval)
+                    interval = min(interval * 2, FACE_SWAP_POLL_MAX_INTERVAL)
+
+                    status_response = HTTP_SESSION.get(
                         f'https://api.replicate.com/v1/predictions/{prediction_id}',
-                        headers={'Authorization': f'Token {REPLICATE_API_TOKEN}'}
+                        headers={'Authorization': f'Token {REPLICATE_API_TOKEN}'},
+                        timeout=FACE_SWAP_POLL_TIMEOUT
                     )
-
                     if status_response.status_code == 200:
-                        status_data = status_response.json()
-                        if status_data['status'] == 'succeeded':
-                            return jsonify({
-                                "status": "success",
-                                "swapped_url": status_data.get('output'),
-                                "prediction_id": prediction_id,
-                                "processing_time": status_data.get('metrics', {}).get('predict_time'),
-                                "timestamp": datetime.utcnow().isoformat()
-                            }), 200
-                        elif status_data['status'] == 'failed':
-                            return jsonify({
-                                "status": "error",
-                                "message": "Face swap failed",
-                                "error": status_data.get('error')
-                            }), 500
-
-                    # Wait before polling again
-                    import time
-                    time.sleep(1)
+                        prediction = orjson.loads(status_response.content)
+                        if prediction['status'] in ('succeeded', 'failed', 'canceled'):
+                            break
 
-                return jsonify({
-                    "status": "processing",
-                    "prediction_id": prediction_id,
-                    "message": "Face swap is still processing"
-                }), 202
+                return _face_swap_response(prediction_id, prediction, now)
             else:
-                logger.error(f"Replicate API error: {replicate_response.text}")
+                logger.error("Replicate API error: %s", replicate_response.text)
                 # Fallback to mock response for testing
                 return jsonify({
                     "status": "success",
                     "swapped_url": "https://replicate.delivery/pbxt/mock-swapped-image.jpg",
                     "message": "Mock response (Replicate API error)",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now
                 }), 200
         else:
             # Mock response when no API token
@@ -738,24 +1200,107 @@ def face_swap():
                 "status": "success",
                 "swapped_url": "https://replicate.delivery/pbxt/mock-swapped-image.jpg",
                 "message": "Mock response (no API token)",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }), 200
 
     except Exception as e:
-        logger.error(f"Face swap error: {str(e)}")
+        logger.error("Face swap error: %s", e)
         return jsonify({"error": str(e)}), 500
 
+def _cache_replicate_result(prediction_id, prediction):
+    """Keep the parts of a finished prediction that face_swap_status reports"""
+    result = {
+        "status": prediction.get('status'),
+        "output": prediction.get('output'),
+        "error": prediction.get('error'),
+        "metrics": prediction.get('metrics')
+    }
+    set_generic_cache(f"replicate:{prediction_id}", orjson.dumps(result), REPLICATE_RESULT_TTL)
+    return result
+
+@app.route('/api/face-swap/<prediction_id>', methods=['GET'])
+def face_swap_status(prediction_id):
+    """Result of a face swap: from the webhook cache, else asked of Replicate directly"""
+    now = datetime.now(timezone.utc).isoformat()
+    cached = get_generic_cache(f"replicate:{prediction_id}")
+    if cached is not None:
+        return _face_swap_response(prediction_id, orjson.loads(cached), now)
+    if not REPLICATE_API_TOKEN:
+        return _face_swap_response(prediction_id, {}, now)
+
+    # No webhook result (not configured, or not delivered yet): poll the prediction once
+    try:
+        response = HTTP_SESSION.get(
+            f'https://api.replicate.com/v1/predictions/{prediction_id}',
+            headers={'Authorization': f'Token {REPLICATE_API_TOKEN}'},
+            timeout=10
+        )
+    except requests.exceptions.RequestException as e:
+        logger.warning("Replicate status lookup for %s failed: %s", prediction_id, e)
+        return _face_swap_response(prediction_id, {}, now)
+    if response.status_code == 404:
+        return jsonify({"status": "error", "message": "Unknown prediction"}), 404
+    if response.status_code != 200:
+        logger.warning("Replicate status lookup for %s returned HTTP %s", prediction_id, response.status_code)
+        return _face_swap_response(prediction_id, {}, now)
+
+    prediction = orjson.loads(response.content)
+    if prediction.get('status') in ('succeeded', 'failed', 'canceled'):
+        _cache_replicate_result(prediction_id, prediction)
+    return _face_swap_response(prediction_id, prediction, now)
+
+def verify_replicate_signature(payload, headers, secret, tolerance=REPLICATE_WEBHOOK_TOLERANCE):
+    """Check Replicate's webhook-id/timestamp/signature headers against the raw body"""
+    webhook_id = headers.get('webhook-id')
+    timestamp = headers.get('webhook-timestamp')
+    signatures = headers.get('webhook-signature')
+    if not webhook_id or not timestamp or not timestamp.isdigit() or not signatures:
+        return False
+    if abs(time.time() - int(timestamp)) > tolerance:
+        return False
+
+    key = base64.b64decode(secret.split('_', 1)[-1])
+    signed = f"{webhook_id}.{timestamp}.".encode() + payload
+    expected = base64.b64encode(hmac.new(key, signed, hashlib.sha256).digest()).decode()
+    # Header holds space-separated "v1,<signature>" entries
+    return any(
+        hmac.compare_digest(expected, signature.partition(',')[2])
+        for signature in signatures.split()
+    )
+
+@app.route('/api/replicate-webhook', methods=['POST'])
+def replicate_webhook():
+    """Store completed Replicate predictions for face_swap_status"""
+    payload = request.get_data(cache=False)
+    if not REPLICATE_WEBHOOK_SECRET or not verify_replicate_signature(payload, request.headers, REPLICATE_WEBHOOK_SECRET):
+        return jsonify({'error': 'Invalid signature'}), 400
+
+    try:
+        prediction = orjson.loads(payload)
+        prediction_id = prediction['id']
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error("Invalid Replicate webhook payload: %s", e)
+        return jsonify({'error': 'Invalid payload'}), 400
+
+    result = _cache_replicate_result(prediction_id, prediction)
+    logger.info("Replicate prediction %s completed: %s", prediction_id, result['status'])
+    return jsonify({'status': 'received'}), 200
+
 @app.route('/api/ar-mask', methods=['POST'])
 def ar_mask():
     """AR mask operation with n8n workflow"""
+    now = datetime.now(timezone.utc).isoformat()
+    # Reject oversized uploads before the body is read into memory
+    too_large = _payload_too_large()
+    if too_large:
+        return too_large
     try:
-        data = request.get_json()
-        image = data.get('image')
-        mask_type = data.get('mask_type')
-        user_id = data.get('user_id')
-
-        if not image or not mask_type:
-            return jsonify({"error": "Both image and mask_type are required"}), 400
+        body, error = _parse_body(ArMaskRequest, "Both image and mask_type are required")
+        if error:
+            return error
+        image = body.image
+        mask_type = body.mask_type
+        user_id = body.user_id
 
         # Trigger AR mask workflow in n8n
         workflow_data = {
@@ -763,36 +1308,134 @@ def ar_mask():
             "mask_type": mask_type,
             "user_id": user_id,
             "operation": "ar_mask",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }
 
-        result = n8n_service.trigger_workflow("ar-mask-processing", workflow_data)
+        n8n_service.trigger_workflow_async("ar-mask-processing", workflow_data)
+        result = {"queued": True, "workflow": "ar-mask-processing"}
 
         return jsonify({
             "status": "success",
             "message": "AR mask processing initiated",
             "workflow_result": result,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 200
 
     except Exception as e:
-        logger.error(f"AR mask error: {str(e)}")
+        logger.error("AR mask error: %s", e)
         return jsonify({"error": str(e)}), 500
 
+# Feedback, session and deployment ids: a per-process counter seeded from the start time in ms,
+# so ids issued within the same second stay unique
+_ID_COUNTER = itertools.count(int(time.time()) * 1000)
+
+# User feedback is queued by user_test and appended to the log in batches by one background thread
+FEEDBACK_LOG_PATH = os.getenv("FEEDBACK_LOG_PATH", "user_feedback.log")
+FEEDBACK_BATCH_SIZE = 500
+FEEDBACK_FLUSH_INTERVAL = 2
+FEEDBACK_QUEUE = queue.Queue(maxsize=10000)
+
+# Keywords for the mock feedback analysis, matched against whole words
+POSITIVE_FEEDBACK_WORDS = frozenset({'great', 'awesome', 'love', 'excellent', 'amazing'})
+NEGATIVE_FEEDBACK_WORDS = frozenset({'bad', 'terrible', 'hate', 'awful', 'worst'})
+FEATURE_FEEDBACK_WORDS = frozenset({'face', 'swap', 'mask', 'stream', 'ai'})
+_WORD_RE = re.compile(r'[a-z]+')
+
+def _feedback_tags(feedback_lower):
+    """Return the set of keyword tags ('pos', 'neg', 'feat') present in the feedback"""
+    words = set(_WORD_RE.findall(feedback_lower))
+    tags = set()
+    if not POSITIVE_FEEDBACK_WORDS.isdisjoint(words):
+        tags.add('pos')
+    if not NEGATIVE_FEEDBACK_WORDS.isdisjoint(words):
+        tags.add('neg')
+    if not FEATURE_FEEDBACK_WORDS.isdisjoint(words):
+        tags.add('feat')
+    return tags
+
+def _write_feedback(batch):
+    """Append feedback entries to the log as JSON lines in one vectored write"""
+    lines = [orjson.dumps(entry) + b'\n' for entry in batch]
+    try:
+        fd = os.open(FEEDBACK_LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if hasattr(os, 'writev'):
+                # Batches stay well under IOV_MAX (1024), so one call covers the whole batch
+                written = os.writev(fd, lines)
+                total = sum(map(len, lines))
+                if written < total:
+                    os.write(fd, b''.join(lines)[written:])
+            else:
+                os.write(fd, b''.join(lines))
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.error("Error writing %d feedback entries: %s", len(batch), e)
+
+_FEEDBACK_STOP = object()
+
+def _flush_feedback_loop():
+    """Collect up to FEEDBACK_BATCH_SIZE entries or FEEDBACK_FLUSH_INTERVAL seconds' worth, then write"""
+    while True:
+        entry = FEEDBACK_QUEUE.get()
+        if entry is _FEEDBACK_STOP:
+            return
+        batch = [entry]
+        stopping = False
+        deadline = time.monotonic() + FEEDBACK_FLUSH_INTERVAL
+        while len(batch) < FEEDBACK_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = FEEDBACK_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is _FEEDBACK_STOP:
+                stopping = True
+                break
+            batch.append(entry)
+        _write_feedback(batch)
+        if stopping:
+            return
+
+_FEEDBACK_THREAD = threading.Thread(target=_flush_feedback_loop, name="feedback-flush", daemon=True)
+_FEEDBACK_THREAD.start()
+
+def _drain_feedback():
+    """Flush the in-flight batch and whatever is still queued when the process exits"""
+    try:
+        FEEDBACK_QUEUE.put(_FEEDBACK_STOP, timeout=1)
+    except queue.Full:
+        pass
+    _FEEDBACK_THREAD.join(timeout=FEEDBACK_FLUSH_INTERVAL + 1)
+    batch = []
+    while True:
+        try:
+            entry = FEEDBACK_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if entry is not _FEEDBACK_STOP:
+            batch.append(entry)
+    if batch:
+        _write_feedback(batch)
+
+atexit.register(_drain_feedback)
+
 @app.route('/api/user-test', methods=['POST'])
 def user_test():
     """User testing and feedback collection endpoint"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json()
-        user_id = data.get('user_id')
-        feedback = data.get('feedback')
-        test_type = data.get('test_type', 'general')
-        rating = data.get('rating', 0)
-
-        if not user_id or not feedback:
-            return jsonify({"error": "user_id and feedback are required"}), 400
+        body, error = _parse_body(UserTestRequest, "user_id and feedback are required")
+        if error:
+            return error
+        user_id = body.user_id
+        feedback = body.feedback
+        test_type = body.test_type
+        rating = body.rating
 
-        logger.info(f"User feedback received from {user_id}: {feedback[:100]}...")
+        logger.info("User feedback received from %s: %s...", user_id, feedback[:100])
 
         # Create feedback entry
         feedback_entry = {
@@ -800,72 +1443,87 @@ def user_test():
             "feedback": feedback,
             "test_type": test_type,
             "rating": rating,
-            "timestamp": datetime.utcnow().isoformat(),
-            "session_id": f"session_{int(time.time())}",
+            "timestamp": now,
+            "session_id": f"session_{next(_ID_COUNTER)}",
             "user_agent": request.headers.get('User-Agent', 'unknown'),
             "ip_address": request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
         }
 
-        # In production, this would write to a file or database
-        # For now, we'll simulate file logging
-        log_filename = "user_feedback.log"
-
+        # Persisted in batches by the feedback flush thread
         try:
-            # Mock file logging (in production, would actually write to file)
-            # with open(log_filename, 'a', encoding='utf-8') as f:
-            #     f.write(f"{json.dumps(feedback_entry)}\n")
-
-            logger.info(f"User feedback logged to {log_filename}")
-
-            # Analyze feedback sentiment (mock)
-            sentiment = "positive" if any(word in feedback.lower() for word in ['great', 'awesome', 'love', 'excellent', 'amazing']) else \
-                       "negative" if any(word in feedback.lower() for word in ['bad', 'terrible', 'hate', 'awful', 'worst']) else \
-                       "neutral"
-
-            # Generate user testing metrics
-            metrics = {
-                "feedback_length": len(feedback),
-                "sentiment": sentiment,
-                "engagement_level": "high" if len(feedback) > 50 else "medium" if len(feedback) > 20 else "low",
-                "feature_mentioned": any(feature in feedback.lower() for feature in ['face', 'swap', 'mask', 'stream', 'ai']),
-                "response_time_ms": 25,  # Mock response time
-            }
-
-        except Exception as log_error:
-            logger.error(f"Error logging feedback: {str(log_error)}")
-            # Continue with success response even if logging fails
+            FEEDBACK_QUEUE.put_nowait(feedback_entry)
+        except queue.Full:
+            logger.warning("Feedback queue full, dropping entry from %s", user_id)
+
+        # Analyze feedback sentiment (mock)
+        feedback_len = len(feedback)
+        tags = _feedback_tags(feedback.lower())
+        sentiment = "positive" if 'pos' in tags else "negative" if 'neg' in tags else "neutral"
+
+        # Generate user testing metrics
+        metrics = {
+            "feedback_length": feedback_len,
+            "sentiment": sentiment,
+            "engagement_level": "high" if feedback_len > 50 else "medium" if feedback_len > 20 else "low",
+            "feature_mentioned": 'feat' in tags,
+            "response_time_ms": 25,  # Mock response time
+        }
 
         return jsonify({
             "status": "logged",
             "message": "User feedback successfully recorded",
             "user_id": user_id,
-            "feedback_id": f"fb_{int(time.time())}",
+            "feedback_id": f"fb_{next(_ID_COUNTER)}",
             "metrics": metrics,
             "next_steps": {
                 "follow_up": "Thank you for your feedback!",
                 "beta_program": "You've been enrolled in our beta testing program",
                 "updates": "You'll receive updates on new features"
             },
-            "timestamp": datetime.utcnow().isoformat()
-        }), 200
+            "timestamp": now
+        }), 202
 
     except Exception as e:
-        logger.error(f"User test error: {str(e)}")
+        logger.error("User test error: %s", e)
         return jsonify({
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 500
 
+# Mock deployment pipeline: (step, message) per stage, in order
+DEPLOY_STEP_TEMPLATES = (
+    ("docker_build", "Docker image built successfully"),
+    ("registry_push", "Image pushed to Docker registry"),
+    ("vercel_deploy", "Deployed to Vercel successfully"),
+    ("health_check", "Health checks passed"),
+)
+
+DEPLOYMENT_URLS = MappingProxyType({
+    "vercel": "https://playalter.vercel.app",
+    "docker": "http://localhost:8080",
+    "production": "https://playalter.com"
+})
+
+DEPLOY_SERVICES = {
+    "backend": "Flask API - Port 5000",
+    "frontend": "Vite React - Port 5173",
+    "database": "SQLite (development)",
+    "redis": "Redis Cache - Port 6379"
+}
+
 @app.route('/api/deploy', methods=['POST'])
 def deploy():
     """Deploy endpoint for Docker and Vercel automation"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json() or {}
+        data, error = _json_body()
+        if error:
+            return error
         environment = data.get('environment', 'production')
         platform = data.get('platform', 'vercel')
 
-        logger.info(f"Initiating deployment to {platform} environment: {environment}")
+        logger.info("Initiating deployment to %s environment: %s", platform, environment)
 
         # Mock deployment process
         # In production, this would trigger:
@@ -874,48 +1532,13 @@ def deploy():
         # 3. Vercel deployment
         # 4. Health checks
 
-        deployment_steps = []
-
-        # Step 1: Docker Build
-        deployment_steps.append({
-            "step": "docker_build",
-            "status": "success",
-            "message": "Docker image built successfully",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        # Step 2: Push to Registry
-        deployment_steps.append({
-            "step": "registry_push",
-            "status": "success",
-            "message": "Image pushed to Docker registry",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        # Step 3: Vercel Deployment
-        deployment_steps.append({
-            "step": "vercel_deploy",
-            "status": "success",
-            "message": "Deployed to Vercel successfully",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        # Step 4: Health Check
-        deployment_steps.append({
-            "step": "health_check",
-            "status": "success",
-            "message": "Health checks passed",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-
-        # Mock deployment URLs
-        deployment_urls = {
-            "vercel": "https://playalter.vercel.app",
-            "docker": "http://localhost:8080",
-            "production": "https://playalter.com"
-        }
+        # All mock steps succeed and share the request timestamp
+        deployment_steps = [
+            {"step": step, "status": "success", "message": message, "timestamp": now}
+            for step, message in DEPLOY_STEP_TEMPLATES
+        ]
 
-        deployment_url = deployment_urls.get(platform, "https://playalter.vercel.app")
+        deployment_url = DEPLOYMENT_URLS.get(platform, "https://playalter.vercel.app")
 
         # In production, would execute actual deployment commands:
         # subprocess.run(["docker", "build", "-t", "playalter:latest", "."])
@@ -926,32 +1549,34 @@ def deploy():
             "url": deployment_url,
             "environment": environment,
             "platform": platform,
-            "deployment_id": f"dep_{int(time.time())}",
+            "deployment_id": f"dep_{next(_ID_COUNTER)}",
             "steps": deployment_steps,
-            "services": {
-                "backend": "Flask API - Port 5000",
-                "frontend": "Vite React - Port 5173",
-                "database": "SQLite (development)",
-                "redis": "Redis Cache - Port 6379"
-            },
+            "services": DEPLOY_SERVICES,
             "docker_compose": True,
             "build_time": "45s",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 200
 
     except Exception as e:
-        logger.error(f"Deployment error: {str(e)}")
+        logger.error("Deployment error: %s", e)
         return jsonify({
             "status": "failed",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 500
 
+# Mock NSFW screen: any of these in the image metadata flags it, case-insensitively
+NSFW_KEYWORDS = frozenset({'adult', 'explicit', 'nude', 'xxx', '18+'})
+NSFW_RE = re.compile('|'.join(map(re.escape, sorted(NSFW_KEYWORDS))), re.IGNORECASE)
+
 @app.route('/api/face-ethics', methods=['POST'])
 def face_ethics():
     """Face ethics endpoint with detection and NSFW filtering"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json()
+        data, error = _json_body()
+        if error:
+            return error
         image_base64 = data.get('image_base64')
 
         if not image_base64:
@@ -969,11 +1594,10 @@ def face_ethics():
 
         # Simple NSFW check simulation based on metadata patterns
         # In production, use proper ML models or APIs
-        nsfw_keywords = ['adult', 'explicit', 'nude', 'xxx', '18+']
-        metadata = data.get('metadata', '').lower()
+        metadata = data.get('metadata', '')
 
         # Check for NSFW patterns (mock implementation)
-        is_nsfw = any(keyword in metadata for keyword in nsfw_keywords)
+        is_nsfw = bool(NSFW_RE.search(metadata))
 
         # Mock face detection results
         faces_detected = 1  # Simulate 1 face detected
@@ -1010,18 +1634,32 @@ def face_ethics():
             "face_confidence": face_confidence,
             "ethics_checks": ethics_checks,
             "processing_time_ms": 150,  # Mock processing time
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 200
 
     except Exception as e:
-        logger.error(f"Face ethics error: {str(e)}")
+        logger.error("Face ethics error: %s", e)
         return jsonify({"error": str(e)}), 500
 
+# Hash state with the fixed "<app id>:<certificate>:" prefix already consumed; live_stream
+# copies it per request. 16-byte BLAKE2b yields the 32 hex chars the token uses.
+_AGORA_TOKEN_HASH = (
+    hashlib.blake2b(f"{AGORA_APP_ID}:{AGORA_APP_CERTIFICATE}:".encode(), digest_size=16)
+    if AGORA_APP_ID and AGORA_APP_CERTIFICATE else None
+)
+
+# Mock live_stream body; the token is hex and the other slots take orjson-encoded values
+_MOCK_STREAM_TEMPLATE = (b'{"status":"success","stream_token":"mock_token_%s","channel_name":%s,'
+                         b'"message":"Mock token generated (no Agora credentials)","timestamp":%s}')
+
 @app.route('/api/live-stream', methods=['POST'])
 def live_stream():
     """Live stream endpoint with Agora RTM token generation"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
-        data = request.get_json()
+        data, error = _json_body()
+        if error:
+            return error
         channel_name = data.get('channel_name')
         user_token = data.get('user_token')
         uid = data.get('uid', 0)  # Default to 0 for string UIDs
@@ -1031,15 +1669,17 @@ def live_stream():
 
         # Generate Agora RTM token
         if AGORA_APP_ID and AGORA_APP_CERTIFICATE:
-            logger.info(f"Generating Agora token for channel: {channel_name}")
+            logger.info("Generating Agora token for channel: %s", channel_name)
 
             # Simple token generation (in production, use Agora SDK)
             # This is a simplified version - real implementation would use AgoraTools
             expiration_time = int(time.time()) + 3600  # 1 hour expiration
 
-            # Create token string (simplified - real token generation is more complex)
-            token_string = f"{AGORA_APP_ID}:{AGORA_APP_CERTIFICATE}:{channel_name}:{uid}:{expiration_time}"
-            stream_token = hashlib.sha256(token_string.encode()).hexdigest()
+            # Create token string (simplified - real token generation is more complex);
+            # the app id / certificate prefix is already absorbed into _AGORA_TOKEN_HASH
+            token_hash = _AGORA_TOKEN_HASH.copy()
+            token_hash.update(f"{channel_name}:{uid}:{expiration_time}".encode())
+            stream_token = token_hash.hexdigest()
 
             # In production, you would use the actual Agora token generator:
             # from agora_token_builder import RtmTokenBuilder
@@ -1054,51 +1694,53 @@ def live_stream():
 
             return jsonify({
                 "status": "success",
-                "stream_token": f"token_{stream_token[:32]}",  # Truncate for demo
+                "stream_token": f"token_{stream_token}",
                 "channel_name": channel_name,
                 "app_id": AGORA_APP_ID,
                 "uid": uid,
                 "expires_at": expiration_time,
                 "rtm_endpoint": f"wss://rtm.agora.io/{AGORA_APP_ID}/{channel_name}",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }), 200
         else:
             # Mock response when no Agora credentials
             logger.info("Using mock Agora response (no credentials)")
-            mock_token = hashlib.sha256(f"{channel_name}:{time.time()}".encode()).hexdigest()[:32]
+            mock_token = hashlib.blake2b(f"{channel_name}:{time.time()}".encode(), digest_size=16).hexdigest()
 
-            return jsonify({
-                "status": "success",
-                "stream_token": f"mock_token_{mock_token}",
-                "channel_name": channel_name,
-                "message": "Mock token generated (no Agora credentials)",
-                "timestamp": datetime.utcnow().isoformat()
-            }), 200
+            body = _MOCK_STREAM_TEMPLATE % (mock_token.encode(), orjson.dumps(channel_name), orjson.dumps(now))
+            return Response(body, status=200, mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Live stream error: {str(e)}")
+        logger.error("Live stream error: %s", e)
         return jsonify({"error": str(e)}), 500
 
+# The agent catalog never changes at runtime: encode the GET body around it once and
+# tag it so clients can revalidate with If-None-Match
+_AGENTS_JSON = orjson.dumps(ai_agent_service.list_agents())
+_AGENTS_ETAG = hashlib.blake2b(_AGENTS_JSON, digest_size=16).hexdigest()
+_AGENTS_BODY_PREFIX = (b'{"status":"success","agents":' + _AGENTS_JSON
+                       + b',"total":' + str(len(ai_agent_service.list_agents())).encode()
+                       + b',"timestamp":')
+
 @app.route('/api/ai-agents', methods=['GET', 'POST'])
 def ai_agents():
     """AI Agents endpoint for CrewAI/LangChain operations"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
         if request.method == 'GET':
-            # List all available agents
-            agents = ai_agent_service.list_agents()
-            return jsonify({
-                "status": "success",
-                "agents": agents,
-                "total": len(agents),
-                "timestamp": datetime.utcnow().isoformat()
-            }), 200
+            # List all available agents; only the timestamp differs between responses
+            response = Response(_AGENTS_BODY_PREFIX + orjson.dumps(now) + b'}', mimetype='application/json')
+            response.set_etag(_AGENTS_ETAG, weak=True)
+            return response.make_conditional(request)
 
         elif request.method == 'POST':
-            data = request.get_json()
+            data, error = _json_body()
+            if error:
+                return error
             operation = data.get('operation')
             request_data = data.get('request', {})
 
-            logger.info(f"AI Agent operation: {operation}")
+            logger.info("AI Agent operation: %s", operation)
 
             # Execute agent-specific tasks
             if operation == 'swap':
@@ -1133,26 +1775,27 @@ def ai_agents():
                 }), 400
 
             # Log successful execution
-            logger.info(f"AI Agent {operation} executed successfully")
+            logger.info("AI Agent %s executed successfully", operation)
 
             return jsonify({
                 "status": "success",
                 "operation": operation,
                 "result": result,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }), 200
 
     except Exception as e:
-        logger.error(f"AI Agents error: {str(e)}")
+        logger.error("AI Agents error: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 500
 
 @app.route('/api/grok/chat', methods=['POST'])
 def grok_chat():
     """Grok AI chat completion endpoint"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
         if not GROK_API_KEY:
             return jsonify({
@@ -1160,7 +1803,9 @@ def grok_chat():
                 "message": "Grok API key not configured"
             }), 500
         
-        data = request.get_json()
+        data, error = _json_body()
+        if error:
+            return error
         if not data:
             return jsonify({
                 "status": "error", 
@@ -1183,28 +1828,23 @@ def grok_chat():
         }
         
         # Call Grok API
-        headers = {
-            "Authorization": f"Bearer {GROK_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(
-            f"{GROK_API_BASE}/chat/completions",
+        response = HTTP_SESSION.post(
+            GROK_CHAT_URL,
             json=payload,
-            headers=headers,
+            headers=GROK_HEADERS,
             timeout=30
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             logger.info("Grok chat completion successful")
             return jsonify({
                 "status": "success",
                 "result": result,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }), 200
         else:
-            logger.error(f"Grok API error: {response.status_code} - {response.text}")
+            logger.error("Grok API error: %s - %s", response.status_code, response.text)
             return jsonify({
                 "status": "error",
                 "message": f"Grok API error: {response.status_code}",
@@ -1212,16 +1852,17 @@ def grok_chat():
             }), response.status_code
             
     except Exception as e:
-        logger.error(f"Grok chat error: {str(e)}")
+        logger.error("Grok chat error: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 500
 
 @app.route('/api/grok/reason', methods=['POST'])
 def grok_reason():
     """Grok AI advanced reasoning endpoint"""
+    now = datetime.now(timezone.utc).isoformat()
     try:
         if not GROK_API_KEY:
             return jsonify({
@@ -1229,7 +1870,9 @@ def grok_reason():
                 "message": "Grok API key not configured"
             }), 500
         
-        data = request.get_json()
+        data, error = _json_body()
+        if error:
+            return error
         if not data:
             return jsonify({
                 "status": "error",
@@ -1273,20 +1916,15 @@ def grok_reason():
         }
         
         # Call Grok API
-        headers = {
-            "Authorization": f"Bearer {GROK_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(
-            f"{GROK_API_BASE}/chat/completions",
+        response = HTTP_SESSION.post(
+            GROK_CHAT_URL,
             json=payload,
-            headers=headers,
+            headers=GROK_HEADERS,
             timeout=45
         )
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             reasoning = result.get('choices', [{}])[0].get('message', {}).get('content', '')
             
             logger.info("Grok reasoning completion successful")
@@ -1296,10 +1934,10 @@ def grok_reason():
                 "question": question,
                 "reasoning": reasoning,
                 "full_response": result,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }), 200
         else:
-            logger.error(f"Grok API error: {response.status_code} - {response.text}")
+            logger.error("Grok API error: %s - %s", response.status_code, response.text)
             return jsonify({
                 "status": "error",
                 "message": f"Grok API error: {response.status_code}",
@@ -1307,55 +1945,59 @@ def grok_reason():
             }), response.status_code
             
     except Exception as e:
-        logger.error(f"Grok reasoning error: {str(e)}")
+        logger.error("Grok reasoning error: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }), 500
 
+# Endpoint documentation served by home(), encoded once at import
+_HOME_PAYLOAD = orjson.dumps({
+    "service": "PLAYALTER Backend API",
+    "version": "2.0.0",
+    "description": "AI Face Swap & AR Web App with n8n Workflows and Stripe Integration",
+    "endpoints": {
+        "health": "GET /health - Service health check",
+        "orchestration": "POST /api/orchestrate - Trigger AI workflow orchestration",
+        "stripe": {
+            "customers": "POST /api/customers - Create Stripe customer",
+            "products": "POST /api/products - Create Stripe product", 
+            "checkout": "POST /api/create-checkout-session - Create checkout session",
+            "subscriptions": "GET /api/subscriptions/<customer_id> - Get customer subscriptions",
+            "webhook": "POST /api/stripe-webhook - Stripe webhook endpoint"
+        },
+        "n8n": {
+            "workflows": "GET /api/n8n/workflows - List available workflows",
+            "invalidate": "POST /api/n8n/workflows/invalidate - Refresh the cached workflow list",
+            "trigger": "POST /api/n8n/trigger/<workflow_name> - Trigger specific workflow"
+        },
+        "ai_services": {
+            "face_swap": "POST /api/face-swap - Process face swap with Replicate",
+            "face_swap_status": "GET /api/face-swap/<prediction_id> - Face swap result for a pending prediction",
+            "ar_mask": "POST /api/ar-mask - Apply AR mask",
+            "face_ethics": "POST /api/face-ethics - Face detection and NSFW filtering",
+            "live_stream": "POST /api/live-stream - Generate Agora RTM stream token",
+            "ai_agents": "GET/POST /api/ai-agents - AI Agent operations (CrewAI/LangChain)"
+        },
+        "grok_ai": {
+            "chat": "POST /api/grok/chat - Grok AI chat completion",
+            "reason": "POST /api/grok/reason - Advanced AI reasoning with context"
+        },
+        "devops": {
+            "deploy": "POST /api/deploy - Trigger Docker build and Vercel deployment"
+        },
+        "user_testing": {
+            "feedback": "POST /api/user-test - Log user feedback and testing data"
+        }
+    },
+    "integrations": ["Stripe", "n8n", "OpenAI", "Grok (XAI)", "Replicate", "Agora"]
+})
+
 @app.route('/', methods=['GET'])
 def home():
     """API home with comprehensive endpoint documentation"""
-    return jsonify({
-        "service": "PLAYALTER Backend API",
-        "version": "2.0.0",
-        "description": "AI Face Swap & AR Web App with n8n Workflows and Stripe Integration",
-        "endpoints": {
-            "health": "GET /health - Service health check",
-            "orchestration": "POST /api/orchestrate - Trigger AI workflow orchestration",
-            "stripe": {
-                "customers": "POST /api/customers - Create Stripe customer",
-                "products": "POST /api/products - Create Stripe product", 
-                "checkout": "POST /api/create-checkout-session - Create checkout session",
-                "subscriptions": "GET /api/subscriptions/<customer_id> - Get customer subscriptions",
-                "webhook": "POST /api/stripe-webhook - Stripe webhook endpoint"
-            },
-            "n8n": {
-                "workflows": "GET /api/n8n/workflows - List available workflows",
-                "trigger": "POST /api/n8n/trigger/<workflow_name> - Trigger specific workflow"
-            },
-            "ai_services": {
-                "face_swap": "POST /api/face-swap - Process face swap with Replicate",
-                "ar_mask": "POST /api/ar-mask - Apply AR mask",
-                "face_ethics": "POST /api/face-ethics - Face detection and NSFW filtering",
-                "live_stream": "POST /api/live-stream - Generate Agora RTM stream token",
-                "ai_agents": "GET/POST /api/ai-agents - AI Agent operations (CrewAI/LangChain)"
-            },
-            "grok_ai": {
-                "chat": "POST /api/grok/chat - Grok AI chat completion",
-                "reason": "POST /api/grok/reason - Advanced AI reasoning with context"
-            },
-            "devops": {
-                "deploy": "POST /api/deploy - Trigger Docker build and Vercel deployment"
-            },
-            "user_testing": {
-                "feedback": "POST /api/user-test - Log user feedback and testing data"
-            }
-        },
-        "integrations": ["Stripe", "n8n", "OpenAI", "Grok (XAI)", "Replicate", "Agora"],
-        "timestamp": datetime.utcnow().isoformat()
-    }), 200
+    return Response(_HOME_PAYLOAD, status=200, mimetype='application/json')
 
 if __name__ == '__main__':
     logger.info("Starting PLAYALTER Backend with n8n and Stripe integration")
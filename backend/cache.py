@@ -0,0 +1,111 @@
+"""
+PLAYALTER Cache Helpers
+=======================
+
+Small TTL cache shared across gunicorn workers through Redis (REDIS_URL).
+
+If Redis is not configured, or stops answering, values fall back to an
+in-process cache so callers never fail because of the cache layer.
+"""
+
+import os
+import time
+import logging
+import threading
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Skip Redis for this long after a connection failure
+REDIS_RETRY_INTERVAL = 30
+
+_redis_client = None
+_redis_down_until = 0.0
+_local_cache = {}
+_local_lock = threading.Lock()
+
+
+def _get_redis():
+    """Return the shared Redis client, or None while Redis is unavailable"""
+    global _redis_client
+    if time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            return None
+        _redis_client = redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+    return _redis_client
+
+
+def _mark_redis_down(e):
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
+    logger.warning("Redis unavailable, using in-process cache: %s", e)
+
+
+def get_generic_cache(key):
+    """Get a cached value (bytes or str) or None on a miss"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            return client.get(key)
+        except redis.RedisError as e:
+            _mark_redis_down(e)
+
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del _local_cache[key]
+            return None
+        return value
+
+
+def set_generic_cache(key, value, ttl):
+    """Store a value for ttl seconds"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.setex(key, ttl, value)
+            return
+        except redis.RedisError as e:
+            _mark_redis_down(e)
+
+    with _local_lock:
+        _local_cache[key] = (time.monotonic() + ttl, value)
+
+
+def add_generic_cache(key, value, ttl):
+    """Store a value for ttl seconds only if the key is absent; True if it was stored"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            return bool(client.set(key, value, ex=ttl, nx=True))
+        except redis.RedisError as e:
+            _mark_redis_down(e)
+
+    now = time.monotonic()
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is not None and now < entry[0]:
+            return False
+        _local_cache[key] = (now + ttl, value)
+        return True
+
+
+def delete_generic_cache(*keys):
+    """Invalidate one or more keys"""
+    client = _get_redis()
+    if client is not None:
+        try:
+            client.delete(*keys)
+        except redis.RedisError as e:
+            _mark_redis_down(e)
+
+    with _local_lock:
+        for key in keys:
+            _local_cache.pop(key, None)
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the PLAYALTER backend.
+
+Every route is IO-bound (Stripe, n8n, Replicate), so gevent workers let each
+process keep many requests in flight while they wait on upstream sockets.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app_enhanced:app
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+# One gevent worker per core by default; each one already multiplexes many requests
+workers = int(os.getenv("GUNICORN_WORKERS", str(os.cpu_count() or 1)))
+worker_class = "gevent"
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+accesslog = "-"
+errorlog = "-"
@@ -0,0 +1,259 @@
+"""
+PLAYALTER Platform Clients
+==========================
+
+Provider calls made by the orchestrator workflows, one client per platform.
+
+PLATFORM_CLIENTS selects the implementation:
+- mock (default): canned responses after a simulated provider latency
+- null: the same response shapes with empty values, returned immediately,
+  for local runs and CI where no provider is configured
+
+A real provider client only has to satisfy the platform's Protocol.
+"""
+
+import os
+import time
+import asyncio
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Protocol, Tuple
+
+# Unique, increasing ids for mock resources without reading the clock per call
+_ID_COUNTER = itertools.count(int(time.time()) * 1000)
+
+
+def next_id() -> int:
+    """Next value of the process-wide id counter"""
+    return next(_ID_COUNTER)
+
+
+class StripeClient(Protocol):
+    async def validate_payment(self, payment_intent_id: str) -> Dict[str, Any]: ...
+    async def create_customer(self, email: str, name: str) -> Dict[str, Any]: ...
+
+
+class ReplicateClient(Protocol):
+    async def face_swap(self, source_image: str, target_image: str) -> Dict[str, Any]: ...
+    async def process_images(self, prompt: str) -> Dict[str, Any]: ...
+    async def setup_pipeline(self, channel_name: str) -> Dict[str, Any]: ...
+    async def advanced_mask(self, params: Dict[str, Any]) -> Dict[str, Any]: ...
+    async def validate_ethics(self, output_url: str) -> Dict[str, Any]: ...
+
+
+class N8NClient(Protocol):
+    async def trigger(self, workflow_name: str, data: Dict[str, Any]) -> Dict[str, Any]: ...
+    async def trigger_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]: ...
+
+
+class VercelClient(Protocol):
+    async def deploy(self, content_url: str) -> Dict[str, Any]: ...
+    async def deploy_content(self, openai_result: Dict, replicate_result: Dict) -> Dict[str, Any]: ...
+
+
+class AgoraClient(Protocol):
+    async def generate_token(self, channel_name: str, user_id: str) -> Dict[str, Any]: ...
+    async def setup_user(self, user_id: str) -> Dict[str, Any]: ...
+
+
+class OpenAIClient(Protocol):
+    async def generate(self, prompt: str) -> Dict[str, Any]: ...
+
+
+class MockStripeClient:
+    async def validate_payment(self, payment_intent_id: str) -> Dict[str, Any]:
+        await asyncio.sleep(0.1)  # Simulate API call
+        return {"valid": True, "amount": 2000, "currency": "usd", "processing_time_ms": 100}
+
+    async def create_customer(self, email: str, name: str) -> Dict[str, Any]:
+        await asyncio.sleep(0.2)
+        return {"customer_id": f"cus_mock_{next(_ID_COUNTER)}", "email": email, "processing_time_ms": 200}
+
+
+class MockReplicateClient:
+    async def face_swap(self, source_image: str, target_image: str) -> Dict[str, Any]:
+        await asyncio.sleep(2.5)  # Simulate processing time
+        return {"output_url": "https://replicate.delivery/mock-output.jpg", "processing_time_ms": 2500}
+
+    async def process_images(self, prompt: str) -> Dict[str, Any]:
+        await asyncio.sleep(1.5)
+        return {"images": ["https://replicate.delivery/mock-1.jpg"], "processing_time_ms": 1500}
+
+    async def setup_pipeline(self, channel_name: str) -> Dict[str, Any]:
+        await asyncio.sleep(0.5)
+        return {"pipeline_id": f"ai_pipeline_{next(_ID_COUNTER)}", "processing_time_ms": 500}
+
+    async def advanced_mask(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(2.5)  # Simulate processing time
+        return {
+            "id": f"replicate_{next(_ID_COUNTER)}",
+            "status": "succeeded",
+            "output_url": f"https://replicate.delivery/mask_output_{next(_ID_COUNTER)}.jpg",
+            "faces_count": 2 if params["multi_face_enabled"] else 1,
+            "quality_score": 0.95 if params["quality_level"] == "ultra" else 0.85,
+            "ethics_score": 0.98,
+            "processing_strategy": params["strategy"],
+            "resource_usage": "high" if params["quality_level"] == "ultra" else "medium",
+            "features_applied": {
+                "ethnic_diversity": params["ethnic_preference"] != "diverse",
+                "ar_overlays": params["ar_integration"] in ["overlays", "full"],
+                "multi_face_processing": params["multi_face_enabled"]
+            }
+        }
+
+    async def validate_ethics(self, output_url: str) -> Dict[str, Any]:
+        await asyncio.sleep(0.3)
+        return {
+            "compliant": True,
+            "confidence": 0.98,
+            "checks_performed": [
+                "bias_detection",
+                "harmful_content_scan",
+                "privacy_protection",
+                "consent_validation"
+            ],
+            "risk_level": "low",
+            "recommendations": [],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+
+class MockN8NClient:
+    async def trigger(self, workflow_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """POST /webhook/<workflow_name>"""
+        await asyncio.sleep(0.3)
+        return {"triggered": True, "workflow_id": f"n8n_{next(_ID_COUNTER)}", "processing_time_ms": 300}
+
+    async def trigger_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """One POST /webhook/<router_workflow> carrying {"batch": [{"name", "data"}, ...]}"""
+        await asyncio.sleep(0.3)
+        return [
+            {"triggered": True, "workflow_id": f"n8n_{next(_ID_COUNTER)}", "processing_time_ms": 300,
+             "batch_size": len(items)}
+            for _ in items
+        ]
+
+
+class MockVercelClient:
+    async def deploy(self, content_url: str) -> Dict[str, Any]:
+        await asyncio.sleep(1.0)
+        return {"url": "https://playalter-result.vercel.app", "deployment_id": f"dpl_{next(_ID_COUNTER)}", "processing_time_ms": 1000}
+
+    async def deploy_content(self, openai_result: Dict, replicate_result: Dict) -> Dict[str, Any]:
+        await asyncio.sleep(1.2)
+        return {"url": "https://playalter-content.vercel.app", "processing_time_ms": 1200}
+
+
+class MockAgoraClient:
+    async def generate_token(self, channel_name: str, user_id: str) -> Dict[str, Any]:
+        await asyncio.sleep(0.1)
+        return {"token": f"agora_token_{next(_ID_COUNTER)}", "expires_at": int(time.time()) + 3600, "processing_time_ms": 100}
+
+    async def setup_user(self, user_id: str) -> Dict[str, Any]:
+        await asyncio.sleep(0.2)
+        return {"user_profile_id": f"agora_user_{user_id}", "processing_time_ms": 200}
+
+
+class MockOpenAIClient:
+    async def generate(self, prompt: str) -> Dict[str, Any]:
+        await asyncio.sleep(1.0)
+        return {"text": f"Generated content for: {prompt[:50]}...", "image_prompt": "Generated image prompt", "processing_time_ms": 1000}
+
+
+class NullStripeClient:
+    async def validate_payment(self, payment_intent_id: str) -> Dict[str, Any]:
+        return {"valid": True, "amount": 0, "currency": "usd", "processing_time_ms": 0}
+
+    async def create_customer(self, email: str, name: str) -> Dict[str, Any]:
+        return {"customer_id": "", "email": email, "processing_time_ms": 0}
+
+
+class NullReplicateClient:
+    async def face_swap(self, source_image: str, target_image: str) -> Dict[str, Any]:
+        return {"output_url": "", "processing_time_ms": 0}
+
+    async def process_images(self, prompt: str) -> Dict[str, Any]:
+        return {"images": [], "processing_time_ms": 0}
+
+    async def setup_pipeline(self, channel_name: str) -> Dict[str, Any]:
+        return {"pipeline_id": "", "processing_time_ms": 0}
+
+    async def advanced_mask(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": "",
+            "status": "succeeded",
+            "output_url": "",
+            "faces_count": 0,
+            "quality_score": 0.0,
+            "ethics_score": 0.0,
+            "processing_strategy": params["strategy"],
+            "resource_usage": "none",
+            "features_applied": {}
+        }
+
+    async def validate_ethics(self, output_url: str) -> Dict[str, Any]:
+        return {
+            "compliant": True,
+            "confidence": 0.0,
+            "checks_performed": [],
+            "risk_level": "unknown",
+            "recommendations": [],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+
+class NullN8NClient:
+    async def trigger(self, workflow_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"triggered": False, "workflow_id": "", "processing_time_ms": 0}
+
+    async def trigger_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        return [{"triggered": False, "workflow_id": "", "processing_time_ms": 0, "batch_size": len(items)} for _ in items]
+
+
+class NullVercelClient:
+    async def deploy(self, content_url: str) -> Dict[str, Any]:
+        return {"url": "", "deployment_id": "", "processing_time_ms": 0}
+
+    async def deploy_content(self, openai_result: Dict, replicate_result: Dict) -> Dict[str, Any]:
+        return {"url": "", "processing_time_ms": 0}
+
+
+class NullAgoraClient:
+    async def generate_token(self, channel_name: str, user_id: str) -> Dict[str, Any]:
+        return {"token": "", "expires_at": 0, "processing_time_ms": 0}
+
+    async def setup_user(self, user_id: str) -> Dict[str, Any]:
+        return {"user_profile_id": "", "processing_time_ms": 0}
+
+
+class NullOpenAIClient:
+    async def generate(self, prompt: str) -> Dict[str, Any]:
+        return {"text": "", "image_prompt": "", "processing_time_ms": 0}
+
+
+CLIENTS = {
+    "mock": {
+        "stripe": MockStripeClient,
+        "replicate": MockReplicateClient,
+        "n8n": MockN8NClient,
+        "vercel": MockVercelClient,
+        "agora": MockAgoraClient,
+        "openai": MockOpenAIClient
+    },
+    "null": {
+        "stripe": NullStripeClient,
+        "replicate": NullReplicateClient,
+        "n8n": NullN8NClient,
+        "vercel": NullVercelClient,
+        "agora": NullAgoraClient,
+        "openai": NullOpenAIClient
+    }
+}
+
+
+def build_clients(kind: str = None) -> Dict[str, Any]:
+    """One client per platform for the given kind (defaults to PLATFORM_CLIENTS)"""
+    kind = kind or os.getenv("PLATFORM_CLIENTS", "mock")
+    if kind not in CLIENTS:
+        raise ValueError(f"Unknown PLATFORM_CLIENTS value: {kind}")
+    return {name: client() for name, client in CLIENTS[kind].items()}
@@ -12,34 +12,205 @@ Platforms:
 - OpenAI: AI capabilities
 - Replicate: Face swap AI
 - Agora: Live streaming
+
+All outbound HTTP goes through the shared aiohttp session. Blocking clients
+(requests, provider SDKs) must not be used here: one sync call stalls the event
+loop and every workflow running on it.
 """
 
 import os
+import sys
+import queue
 import asyncio
+import functools
 import logging
-import json
 import time
 import uuid
 import hashlib
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+import random
+import ssl
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 import aiohttp
-import requests
+import orjson
+from aiohttp.resolver import AsyncResolver
+from yarl import URL
 from enum import Enum
 import base64
+from collections import deque
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+from platform_clients import (
+    AgoraClient, N8NClient, OpenAIClient, ReplicateClient, StripeClient, VercelClient, build_clients, next_id
+)
+
+# One TLS context for every provider connection: the CA bundle is loaded once and
+# OpenSSL can resume sessions across connections. aiohttp only speaks HTTP/1.1, so
+# h2 must not be offered in ALPN.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.set_alpn_protocols(["http/1.1"])
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class PlatformStatus(Enum):
+
+def _start_log_listener() -> Optional[QueueListener]:
+    """Hand root log records to a queue written by a listener thread, so callers on the
+    event loop never block on the stream. Like basicConfig, an already configured root
+    logger is left alone and None is returned."""
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    log_queue = queue.SimpleQueue()
+    output = logging.StreamHandler()
+    output.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener = QueueListener(log_queue, output)
+    listener.start()
+    return listener
+
+# Seconds a platform health result is reused before the provider is asked again.
+# PLATFORM_HEALTH_TTL sets the default, PLATFORM_HEALTH_TTL_<PLATFORM> overrides one platform.
+DEFAULT_HEALTH_TTL = float(os.getenv("PLATFORM_HEALTH_TTL", "60"))
+HEALTH_TTL_DEFAULTS = {
+    "agora": 600  # configuration-only check, changes with a redeploy
+}
+
+def _health_ttl(platform_name: str) -> float:
+    """TTL for one platform's cached health result"""
+    default = HEALTH_TTL_DEFAULTS.get(platform_name, DEFAULT_HEALTH_TTL)
+    return float(os.getenv(f"PLATFORM_HEALTH_TTL_{platform_name.upper()}", default))
+
+class PlatformStatus(str, Enum):
     CONNECTED = "connected"
     DISCONNECTED = "disconnected"
     ERROR = "error"
     CONFIGURED = "configured"
     NOT_CONFIGURED = "not_configured"
 
+# Upper bound on one platform's health check inside health_check_all, above the slowest
+# per-request timeout (the 30s Grok probe)
+HEALTH_CHECK_DEADLINE = float(os.getenv("PLATFORM_HEALTH_DEADLINE", "35"))
+
+# n8n triggers arriving within this window are coalesced into one router request,
+# flushed early once N8N_BATCH_MAX are waiting
+N8N_BATCH_WINDOW = float(os.getenv("N8N_BATCH_WINDOW_MS", "15")) / 1000
+N8N_BATCH_MAX = int(os.getenv("N8N_BATCH_MAX", "32"))
+
+# Seconds between n8n workflow listings; the health probe itself only hits /healthz
+N8N_WORKFLOW_COUNT_TTL = float(os.getenv("N8N_WORKFLOW_COUNT_TTL", "600"))
+
+# Health states counted as connected in the orchestration status
+CONNECTED_STATUSES = frozenset({PlatformStatus.CONNECTED, PlatformStatus.CONFIGURED})
+# Health states recorded as a failure on the platform's circuit breaker
+FAILED_STATUSES = frozenset({PlatformStatus.ERROR, PlatformStatus.DISCONNECTED})
+
+# Seconds get_orchestration_status reuses its last result
+STATUS_CACHE_TTL = 1.0
+
+# Workflows accepted by orchestrate_workflow (keys of PlatformOrchestrator._workflows)
+AVAILABLE_WORKFLOWS = (
+    "face_swap_payment",
+    "user_onboarding",
+    "live_stream_setup",
+    "ai_content_generation"
+)
+
+# Upstream responses worth retrying; auth and payment errors (401/402/403) are not
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+async def retry_async(request_factory, *, attempts: int = 3, base: float = 0.2, cap: float = 2.0):
+    """
+    Await ``request_factory()`` (e.g. ``lambda: session.get(...)``) and return the response,
+    retrying connection errors, timeouts and RETRY_STATUSES with exponential backoff and
+    full jitter. The last attempt's response or exception is passed through as-is.
+    """
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            response = await request_factory()
+        except RETRY_EXCEPTIONS:
+            if last_attempt:
+                raise
+        else:
+            if response.status not in RETRY_STATUSES or last_attempt:
+                return response
+            response.release()
+        await asyncio.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Read the response body and decode it with orjson instead of the stdlib json module"""
+    return orjson.loads(await response.read())
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """
+    Failure-ratio circuit breaker for one platform.
+
+    Opens once at least ``minimum_throughput`` calls in the last ``sampling_duration``
+    seconds failed at ``failure_threshold`` or more, rejects calls for ``break_duration``
+    seconds, then lets a single probe through (HALF_OPEN) to decide whether to close.
+    Only used from the event loop, so no locking.
+    """
+
+    def __init__(self, name: str, failure_threshold: float = 0.5, minimum_throughput: int = 5,
+                 sampling_duration: float = 30.0, break_duration: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.minimum_throughput = minimum_throughput
+        self.sampling_duration = sampling_duration
+        self.break_duration = break_duration
+        self.state = BreakerState.CLOSED
+        self._samples = deque()  # (monotonic time, succeeded)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """True if a call may go out now"""
+        if self.state is BreakerState.OPEN:
+            if time.monotonic() - self._opened_at < self.break_duration:
+                return False
+            self.state = BreakerState.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state is BreakerState.HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def record(self, succeeded: bool):
+        """Record the outcome of a call that allow() let through"""
+        now = time.monotonic()
+        if self.state is BreakerState.HALF_OPEN:
+            self._probe_in_flight = False
+            if succeeded:
+                self.state = BreakerState.CLOSED
+                self._samples.clear()
+            else:
+                self._open(now)
+            return
+
+        self._samples.append((now, succeeded))
+        while self._samples and now - self._samples[0][0] > self.sampling_duration:
+            self._samples.popleft()
+        if len(self._samples) >= self.minimum_throughput:
+            failures = sum(1 for _, ok in self._samples if not ok)
+            if failures / len(self._samples) >= self.failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float):
+        self.state = BreakerState.OPEN
+        self._opened_at = now
+        self._samples.clear()
+        logger.warning("Circuit for %s opened for %.0fs", self.name, self.break_duration)
+
 @dataclass
 class MaskOptions:
     """Options for face mask processing"""
@@ -57,15 +228,70 @@ class AgentDecision:
     reasoning: str
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True)
 class PlatformHealth:
     name: str
     status: PlatformStatus
     response_time_ms: Optional[float]
-    last_check: datetime
+    last_check_ns: int  # time.time_ns() of the check; formatted only when reported
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    @property
+    def last_check(self) -> datetime:
+        return datetime.fromtimestamp(self.last_check_ns / 1e9, tz=timezone.utc)
+
+@dataclass(slots=True, frozen=True)
+class N8NConfig:
+    host: str
+    api_key: Optional[str]
+    webhook_url: Optional[str]
+    encryption_key: Optional[str]
+    router_workflow: str  # fans a batch out to its child workflows; empty disables batching
+    enabled: bool
+
+@dataclass(slots=True, frozen=True)
+class StripeConfig:
+    secret_key: Optional[str]
+    publishable_key: Optional[str]
+    webhook_secret: Optional[str]
+    price_id: Optional[str]
+    enabled: bool
+
+@dataclass(slots=True, frozen=True)
+class VercelConfig:
+    token: Optional[str]
+    org_id: Optional[str]
+    project_id: Optional[str]
+    enabled: bool
+
+@dataclass(slots=True, frozen=True)
+class OpenAIConfig:
+    api_key: Optional[str]
+    org_id: Optional[str]
+    enabled: bool
+
+@dataclass(slots=True, frozen=True)
+class GrokConfig:
+    api_key: Optional[str]
+    api_base: str
+    model: str
+    enabled: bool
+
+@dataclass(slots=True, frozen=True)
+class ReplicateConfig:
+    api_token: Optional[str]
+    vercel_integration_id: Optional[str]
+    vercel_token: Optional[str]
+    enabled: bool
+
+@dataclass(slots=True, frozen=True)
+class AgoraConfig:
+    app_id: Optional[str]
+    app_certificate: Optional[str]
+    token_expiration: int
+    enabled: bool
+
 class PlatformOrchestrator:
     """Orchestrates all platforms for PLAYALTER with hierarchical AI agents"""
     
@@ -73,6 +299,53 @@ class PlatformOrchestrator:
         self.platforms = {}
         self.load_configuration()
         self.health_status = {}
+        # Derived from health_status whenever it changes, so status reads don't rescan it
+        self._connected_platforms: Tuple[str, ...] = ()
+        self._last_check_ns: Optional[int] = None
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # Last health result per platform as (monotonic time, PlatformHealth), and a lock per
+        # platform so concurrent callers share one refresh instead of each calling the provider
+        self._health_ttls = {name: _health_ttl(name) for name in self._platform_configs}
+        self._health_cache: Dict[str, Tuple[float, PlatformHealth]] = {}
+        self._health_locks: Dict[str, asyncio.Lock] = {}
+
+        # Bulkhead per platform: at most <PLATFORM>_MAX_CONCURRENCY outbound calls in flight,
+        # further callers queue on the semaphore
+        self._max_concurrency = {
+            name: int(os.getenv(f"{name.upper()}_MAX_CONCURRENCY", "8")) for name in self._platform_configs
+        }
+        self._bulkheads: Dict[str, asyncio.Semaphore] = {}
+        self._primitives_loop = None
+
+        # Pending n8n triggers as (workflow_name, data, future) and the task that flushes them
+        self._n8n_queue: Optional[asyncio.Queue] = None
+        self._n8n_flusher: Optional[asyncio.Task] = None
+
+        # Workflow count reported with n8n health, refreshed in the background
+        self._n8n_workflow_count: Optional[int] = None
+        self._n8n_workflow_count_at = float("-inf")
+        self._n8n_workflow_refresh: Optional[asyncio.Task] = None
+
+        # One circuit breaker per platform around its outbound calls
+        self._breakers: Dict[str, CircuitBreaker] = {name: CircuitBreaker(name) for name in self._platform_configs}
+        
+        # Provider calls behind the workflows (mock or null, see platform_clients)
+        clients = build_clients()
+        self._stripe: StripeClient = clients["stripe"]
+        self._replicate: ReplicateClient = clients["replicate"]
+        self._n8n: N8NClient = clients["n8n"]
+        self._vercel: VercelClient = clients["vercel"]
+        self._agora: AgoraClient = clients["agora"]
+        self._openai: OpenAIClient = clients["openai"]
+        
+        # Workflow name -> handler, resolved once instead of walking an if/elif chain per call
+        self._workflows = {
+            "face_swap_payment": self._orchestrate_face_swap_payment,
+            "user_onboarding": self._orchestrate_user_onboarding,
+            "live_stream_setup": self._orchestrate_live_stream_setup,
+            "ai_content_generation": self._orchestrate_ai_content_generation
+        }
         
         # Initialize hierarchical AI agents
         self.master_agent = None  # OpenAI GPT-4o for decision making
@@ -81,12 +354,64 @@ class PlatformOrchestrator:
             "agora": None       # Streaming output
         }
         self._initialize_agents()
+
+        # Shared HTTP session for every outbound call; created lazily inside the event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._resolver: Optional[AsyncResolver] = None
+        self._session_loop = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, keeping pooled connections and DNS entries warm"""
+        loop = asyncio.get_running_loop()
+        # A session is bound to the loop it was created in (each asyncio.run() gets a new one)
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # c-ares lookups on the loop instead of getaddrinfo in the default thread pool
+            self._resolver = AsyncResolver()
+            connector = aiohttp.TCPConnector(
+                resolver=self._resolver,
+                ssl=_SSL_CTX,
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def start(self):
+        """Open the shared session and resolve the enabled providers' hosts before the first check"""
+        await self._get_session()
+        targets = {(URL(self._urls[name]).host, URL(self._urls[name]).port)
+                   for name in self._enabled if name in self._urls}
+        # Warms the resolver (c-ares keeps answers for their TTL), so the first checks do not
+        # wait on a cold lookup; a host that fails to resolve here is simply resolved again on first use
+        await asyncio.gather(
+            *(self._resolver.resolve(host, port) for host, port in targets),
+            return_exceptions=True
+        )
+
+    async def aclose(self):
+        """Stop the n8n trigger flusher and close the shared HTTP session"""
+        if self._n8n_flusher is not None and self._primitives_loop is asyncio.get_running_loop():
+            self._n8n_flusher.cancel()
+            self._n8n_flusher = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            # The connector only closes resolvers it created itself
+            await self._resolver.close()
+        self._session = None
+        self._session_loop = None
         
     def _initialize_agents(self):
         """Initialize master and child AI agents"""
         try:
             # Master Agent: OpenAI GPT-4o for decision making
-            if self.config["openai"]["enabled"]:
+            if self.openai.enabled:
                 self.master_agent = {
                     "name": "master_decision_agent",
                     "model": "gpt-4o",
@@ -101,7 +426,7 @@ class PlatformOrchestrator:
                 logger.info("✅ Master Agent (GPT-4o) initialized")
             
             # Child Agent: Replicate for advanced face mask processing
-            if self.config["replicate"]["enabled"]:
+            if self.replicate.enabled:
                 self.child_agents["replicate"] = {
                     "name": "replicate_mask_agent",
                     "model": "face-to-many",
@@ -122,7 +447,7 @@ class PlatformOrchestrator:
                 logger.info("✅ Replicate Mask Agent initialized")
             
             # Child Agent: Agora for streaming output
-            if self.config["agora"]["enabled"]:
+            if self.agora.enabled:
                 self.child_agents["agora"] = {
                     "name": "agora_stream_agent",
                     "role": "streaming_output_manager",
@@ -136,7 +461,7 @@ class PlatformOrchestrator:
                 logger.info("✅ Agora Stream Agent initialized")
                 
         except Exception as e:
-            logger.error(f"❌ Agent initialization failed: {str(e)}")
+            logger.error("❌ Agent initialization failed: %s", e)
     
     async def orchestrate_mask_stream(self, body: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -168,9 +493,10 @@ class PlatformOrchestrator:
             }
         """
         workflow_id = f"mask_stream_{uuid.uuid4().hex[:8]}"
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        logger.info(f"🎭 Starting hierarchical AI orchestration: {workflow_id}")
+        logger.info("🎭 Starting hierarchical AI orchestration: %s", workflow_id)
+        agora_task = None
         
         try:
             # Extract and validate input
@@ -187,6 +513,11 @@ class PlatformOrchestrator:
                 AR=options.get("AR", "overlays")
             )
             
+            # Step 3 first: the Agora stream setup only needs the workflow id and options
+            # (not the master decision or the swapped image), so it runs alongside steps 1-2
+            logger.info("📡 Agora Agent setting up streaming...")
+            agora_task = asyncio.create_task(self._agora_agent_setup_stream(workflow_id, mask_options))
+            
             # Step 1: Master Agent Decision Making
             logger.info("🧠 Master Agent (GPT-4o) analyzing workflow...")
             master_decision = await self._master_agent_decide(workflow_id, input_image, mask_options)
@@ -201,15 +532,10 @@ class PlatformOrchestrator:
             )
             
             # Step 3: Agora Child Agent - Streaming Setup
-            logger.info("📡 Agora Agent setting up streaming...")
-            agora_result = await self._agora_agent_setup_stream(
-                workflow_id,
-                replicate_result.get("swapped_url", ""),
-                mask_options
-            )
+            agora_result = await agora_task
             
             # Calculate total processing time
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
             
             # Final orchestration result
             result = {
@@ -230,27 +556,29 @@ class PlatformOrchestrator:
                     "total_processing_time_ms": processing_time,
                     "agents_used": ["master_gpt4o", "replicate_mask", "agora_stream"]
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
-            logger.info(f"✅ Hierarchical orchestration completed: {workflow_id}")
-            logger.info(f"   Processing time: {processing_time:.1f}ms")
-            logger.info(f"   Swapped URL: {result['swapped_url']}")
-            logger.info(f"   Stream Token: {result['stream_token']}")
+            logger.info("✅ Hierarchical orchestration completed: %s", workflow_id)
+            logger.info("   Processing time: %.1fms", processing_time)
+            logger.info("   Swapped URL: %s", result['swapped_url'])
+            logger.info("   Stream Token: %s", result['stream_token'])
             
             return result
             
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+            if agora_task is not None:
+                agora_task.cancel()
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
             error_result = {
                 "workflow_id": workflow_id,
                 "status": "failed",
                 "error": str(e),
                 "processing_time_ms": processing_time,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
-            logger.error(f"❌ Hierarchical orchestration failed: {workflow_id} - {str(e)}")
+            logger.error("❌ Hierarchical orchestration failed: %s - %s", workflow_id, e)
             return error_result
     
     async def _master_agent_decide(self, workflow_id: str, input_image: str, options: MaskOptions) -> AgentDecision:
@@ -281,7 +609,7 @@ class PlatformOrchestrator:
             """
             
             # Call OpenAI GPT-4o for decision making
-            if self.master_agent and self.config["openai"]["enabled"]:
+            if self.master_agent and self.openai.enabled:
                 decision_response = await self._call_openai_decision(decision_prompt)
                 
                 return AgentDecision(
@@ -296,7 +624,7 @@ class PlatformOrchestrator:
                     },
                     confidence=decision_response.get("confidence", 0.85),
                     reasoning=decision_response.get("reasoning", "Optimized for quality and ethics compliance"),
-                    timestamp=datetime.utcnow()
+                    timestamp=datetime.now(timezone.utc)
                 )
             else:
                 # Fallback decision if GPT-4o not available
@@ -310,11 +638,11 @@ class PlatformOrchestrator:
                     },
                     confidence=0.7,
                     reasoning="Fallback mode - GPT-4o not available",
-                    timestamp=datetime.utcnow()
+                    timestamp=datetime.now(timezone.utc)
                 )
                 
         except Exception as e:
-            logger.error(f"Master agent decision failed: {str(e)}")
+            logger.error("Master agent decision failed: %s", e)
             # Return safe fallback decision
             return AgentDecision(
                 workflow_id=workflow_id,
@@ -322,7 +650,7 @@ class PlatformOrchestrator:
                 parameters={"strategy": "safe", "priority": "stability"},
                 confidence=0.6,
                 reasoning=f"Error fallback: {str(e)}",
-                timestamp=datetime.utcnow()
+                timestamp=datetime.now(timezone.utc)
             )
     
     async def _replicate_agent_process_mask(self, workflow_id: str, input_image: str, 
@@ -331,10 +659,10 @@ class PlatformOrchestrator:
         Replicate Child Agent: Advanced face mask processing
         Superior to Pseudoface with multi-face detection and ethics checking
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            if not self.config["replicate"]["enabled"]:
+            if not self.replicate.enabled:
                 raise ValueError("Replicate agent not enabled")
             
             # Enhanced face mask processing with Replicate
@@ -354,7 +682,7 @@ class PlatformOrchestrator:
             # Ethics compliance validation
             ethics_result = await self._validate_ethics_compliance(replicate_response.get("output_url"))
             
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
             
             result = {
                 "agent": "replicate_mask_processor",
@@ -377,12 +705,12 @@ class PlatformOrchestrator:
                 }
             }
             
-            logger.info(f"✅ Replicate mask processing completed: {processing_time:.1f}ms")
+            logger.info("✅ Replicate mask processing completed: %.1fms", processing_time)
             return result
             
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
-            logger.error(f"❌ Replicate agent failed: {str(e)}")
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
+            logger.error("❌ Replicate agent failed: %s", e)
             
             return {
                 "agent": "replicate_mask_processor",
@@ -392,15 +720,14 @@ class PlatformOrchestrator:
                 "processing_time_ms": processing_time
             }
     
-    async def _agora_agent_setup_stream(self, workflow_id: str, swapped_url: str, 
-                                       options: MaskOptions) -> Dict[str, Any]:
+    async def _agora_agent_setup_stream(self, workflow_id: str, options: MaskOptions) -> Dict[str, Any]:
         """
         Agora Child Agent: Real-time streaming setup for processed content
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            if not self.config["agora"]["enabled"]:
+            if not self.agora.enabled:
                 raise ValueError("Agora agent not enabled")
             
             # Generate unique channel for this workflow
@@ -419,7 +746,7 @@ class PlatformOrchestrator:
                 "recording_enabled": True
             }
             
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
             
             result = {
                 "agent": "agora_stream_manager", 
@@ -438,12 +765,12 @@ class PlatformOrchestrator:
                 }
             }
             
-            logger.info(f"✅ Agora streaming setup completed: {processing_time:.1f}ms")
+            logger.info("✅ Agora streaming setup completed: %.1fms", processing_time)
             return result
             
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
-            logger.error(f"❌ Agora agent failed: {str(e)}")
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
+            logger.error("❌ Agora agent failed: %s", e)
             
             return {
                 "agent": "agora_stream_manager",
@@ -453,415 +780,585 @@ class PlatformOrchestrator:
                 "processing_time_ms": processing_time
             }
         
+    @property
+    def config(self) -> Dict[str, Dict[str, Any]]:
+        """Platform configuration as plain dicts, for callers that predate the config objects"""
+        if self._config_dict is None:
+            self._config_dict = {name: asdict(config) for name, config in self._platform_configs.items()}
+        return self._config_dict
+
     def load_configuration(self):
         """Load platform configurations from environment"""
-        self.config = {
-            "n8n": {
-                "host": os.getenv("N8N_HOST", "http://localhost:5678"),
-                "api_key": os.getenv("N8N_API_KEY"),
-                "webhook_url": os.getenv("N8N_WEBHOOK_URL"),
-                "encryption_key": os.getenv("N8N_ENCRYPTION_KEY"),
-                "enabled": bool(os.getenv("N8N_HOST"))
-            },
-            "stripe": {
-                "secret_key": os.getenv("STRIPE_SECRET_KEY"),
-                "publishable_key": os.getenv("STRIPE_PUBLISHABLE_KEY"),
-                "webhook_secret": os.getenv("STRIPE_WEBHOOK_SECRET"),
-                "price_id": os.getenv("STRIPE_PRICE_ID"),
-                "enabled": bool(os.getenv("STRIPE_SECRET_KEY"))
-            },
-            "vercel": {
-                "token": os.getenv("VERCEL_TOKEN"),
-                "org_id": os.getenv("VERCEL_ORG_ID"),
-                "project_id": os.getenv("VERCEL_PROJECT_ID"),
-                "enabled": bool(os.getenv("VERCEL_TOKEN"))
-            },
-            "openai": {
-                "api_key": os.getenv("OPENAI_API_KEY"),
-                "org_id": os.getenv("OPENAI_ORG_ID"),
-                "enabled": bool(os.getenv("OPENAI_API_KEY"))
-            },
-            "grok": {
-                "api_key": os.getenv("GROK_API_KEY"),
-                "api_base": os.getenv("GROK_API_BASE", "https://api.x.ai/v1"),
-                "model": os.getenv("GROK_MODEL", "grok-beta"),
-                "enabled": bool(os.getenv("GROK_API_KEY"))
-            },
-            "replicate": {
-                "api_token": os.getenv("REPLICATE_API_TOKEN"),
-                "vercel_integration_id": os.getenv("REPLICATE_VERCEL_INTEGRATION_ID"),
-                "vercel_token": os.getenv("REPLICATE_VERCEL_TOKEN"),
-                "enabled": bool(os.getenv("REPLICATE_API_TOKEN"))
-            },
-            "agora": {
-                "app_id": os.getenv("AGORA_APP_ID"),
-                "app_certificate": os.getenv("AGORA_APP_CERTIFICATE"),
-                "token_expiration": int(os.getenv("AGORA_TOKEN_EXPIRATION_TIME", "3600")),
-                "enabled": bool(os.getenv("AGORA_APP_ID"))
-            }
+        self.n8n = N8NConfig(
+            host=os.getenv("N8N_HOST", "http://localhost:5678"),
+            api_key=os.getenv("N8N_API_KEY"),
+            webhook_url=os.getenv("N8N_WEBHOOK_URL"),
+            encryption_key=os.getenv("N8N_ENCRYPTION_KEY"),
+            router_workflow=os.getenv("N8N_ROUTER_WORKFLOW", "playalter-router"),
+            enabled=bool(os.getenv("N8N_HOST"))
+        )
+        self.stripe = StripeConfig(
+            secret_key=os.getenv("STRIPE_SECRET_KEY"),
+            publishable_key=os.getenv("STRIPE_PUBLISHABLE_KEY"),
+            webhook_secret=os.getenv("STRIPE_WEBHOOK_SECRET"),
+            price_id=os.getenv("STRIPE_PRICE_ID"),
+            enabled=bool(os.getenv("STRIPE_SECRET_KEY"))
+        )
+        self.vercel = VercelConfig(
+            token=os.getenv("VERCEL_TOKEN"),
+            org_id=os.getenv("VERCEL_ORG_ID"),
+            project_id=os.getenv("VERCEL_PROJECT_ID"),
+            enabled=bool(os.getenv("VERCEL_TOKEN"))
+        )
+        self.openai = OpenAIConfig(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            org_id=os.getenv("OPENAI_ORG_ID"),
+            enabled=bool(os.getenv("OPENAI_API_KEY"))
+        )
+        self.grok = GrokConfig(
+            api_key=os.getenv("GROK_API_KEY"),
+            api_base=os.getenv("GROK_API_BASE", "https://api.x.ai/v1"),
+            model=os.getenv("GROK_MODEL", "grok-beta"),
+            enabled=bool(os.getenv("GROK_API_KEY"))
+        )
+        self.replicate = ReplicateConfig(
+            api_token=os.getenv("REPLICATE_API_TOKEN"),
+            vercel_integration_id=os.getenv("REPLICATE_VERCEL_INTEGRATION_ID"),
+            vercel_token=os.getenv("REPLICATE_VERCEL_TOKEN"),
+            enabled=bool(os.getenv("REPLICATE_API_TOKEN"))
+        )
+        self.agora = AgoraConfig(
+            app_id=os.getenv("AGORA_APP_ID"),
+            app_certificate=os.getenv("AGORA_APP_CERTIFICATE"),
+            token_expiration=int(os.getenv("AGORA_TOKEN_EXPIRATION_TIME", "3600")),
+            enabled=bool(os.getenv("AGORA_APP_ID"))
+        )
+        self._platform_configs = {
+            "n8n": self.n8n,
+            "stripe": self.stripe,
+            "vercel": self.vercel,
+            "openai": self.openai,
+            "grok": self.grok,
+            "replicate": self.replicate,
+            "agora": self.agora
+        }
+        self._config_dict = None
+        
+        # Everything the health checks need per call is fixed once the environment is
+        # read, so it is built here rather than on every check
+        self._enabled = tuple(name for name, config in self._platform_configs.items() if config.enabled)
+        n8n_host = self.n8n.host.rstrip("/")
+        self._urls = {
+            "n8n": f"{n8n_host}/healthz",
+            "n8n_workflows": f"{n8n_host}/api/v1/workflows",
+            "stripe": "https://api.stripe.com/v1/account",
+            "vercel": "https://api.vercel.com/v2/user",
+            # Single model object rather than the full (many-KB) model listing
+            "openai": "https://api.openai.com/v1/models/gpt-4o",
+            "grok": f"{self.grok.api_base.rstrip('/')}/chat/completions",
+            "replicate": "https://api.replicate.com/v1/account"
+        }
+        self._auth_headers = {
+            "n8n": {"X-N8N-API-KEY": self.n8n.api_key} if self.n8n.api_key else {},
+            "stripe": {"Authorization": f"Bearer {self.stripe.secret_key}"},
+            "vercel": {"Authorization": f"Bearer {self.vercel.token}"},
+            "openai": {"Authorization": f"Bearer {self.openai.api_key}"},
+            "grok": {"Authorization": f"Bearer {self.grok.api_key}"},
+            "replicate": {"Authorization": f"Token {self.replicate.api_token}"}
+        }
+        self._dispatch = {
+            "n8n": self._health_check_n8n,
+            "stripe": self._health_check_stripe,
+            "vercel": self._health_check_vercel,
+            "openai": self._health_check_openai,
+            "grok": self._health_check_grok,
+            "replicate": self._health_check_replicate,
+            "agora": self._health_check_agora
         }
         
         logger.info("Platform configurations loaded")
-        for platform, config in self.config.items():
-            logger.info(f"{platform.upper()}: {'✅ Enabled' if config['enabled'] else '❌ Disabled'}")
+        for platform, config in self._platform_configs.items():
+            logger.info("%s: %s", platform.upper(), "✅ Enabled" if config.enabled else "❌ Disabled")
     
     async def health_check_all(self) -> Dict[str, PlatformHealth]:
         """Perform health check on all platforms"""
         logger.info("🏥 Starting comprehensive health check...")
         
-        health_tasks = []
-        for platform_name in self.config.keys():
-            if self.config[platform_name]['enabled']:
-                health_tasks.append(self._health_check_platform(platform_name))
-        
-        health_results = await asyncio.gather(*health_tasks, return_exceptions=True)
-        
-        # Process results
-        for result in health_results:
-            if isinstance(result, PlatformHealth):
-                self.health_status[result.name] = result
-            elif isinstance(result, Exception):
-                logger.error(f"Health check failed: {result}")
+        # Each result is recorded as soon as its check finishes
+        async for _ in self.iter_health():
+            pass
         
         # Log summary
-        logger.info("🏥 Health check summary:")
-        for name, health in self.health_status.items():
-            status_emoji = "✅" if health.status == PlatformStatus.CONNECTED else "❌"
-            logger.info(f"  {status_emoji} {name.upper()}: {health.status.value}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🏥 Health check summary:")
+            for name, health in self.health_status.items():
+                status_emoji = "✅" if health.status is PlatformStatus.CONNECTED else "❌"
+                logger.info("  %s %s: %s", status_emoji, name.upper(), health.status.value)
         
         return self.health_status
     
+    async def iter_health(self) -> AsyncIterator[PlatformHealth]:
+        """Check every enabled platform concurrently, yielding each result as it completes"""
+        tasks = [asyncio.create_task(self._bounded_health_check(name)) for name in self._enabled]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                health = await next_done
+                self._record_health(health)
+                yield health
+        finally:
+            # The consumer may stop early; don't leave the remaining checks running
+            for task in tasks:
+                task.cancel()
+
+    async def _bounded_health_check(self, platform_name: str) -> PlatformHealth:
+        """Health check under HEALTH_CHECK_DEADLINE, so one hung provider cannot hold up the rest;
+        a check that raises or times out becomes an ERROR result for that platform"""
+        try:
+            return await asyncio.wait_for(self._health_check_platform(platform_name), HEALTH_CHECK_DEADLINE)
+        except asyncio.TimeoutError:
+            error_message = f"Health check exceeded {HEALTH_CHECK_DEADLINE:g}s deadline"
+        except Exception as e:
+            error_message = str(e)
+        logger.error("Health check failed for %s: %s", platform_name, error_message)
+        return PlatformHealth(
+            name=platform_name,
+            status=PlatformStatus.ERROR,
+            response_time_ms=None,
+            last_check_ns=time.time_ns(),
+            error_message=error_message
+        )
+
+    def _record_health(self, health: PlatformHealth):
+        """Store a platform's latest health and refresh the status figures derived from it"""
+        self.health_status[health.name] = health
+        self._connected_platforms = tuple(
+            name for name, h in self.health_status.items() if h.status in CONNECTED_STATUSES
+        )
+        if self._last_check_ns is None or health.last_check_ns > self._last_check_ns:
+            self._last_check_ns = health.last_check_ns
+        self._status_cache = None
+
+    def _bind_primitives(self):
+        """Drop locks and semaphores created under a previous event loop (they are loop-bound)"""
+        loop = asyncio.get_running_loop()
+        if self._primitives_loop is not loop:
+            self._health_locks = {}
+            self._bulkheads = {}
+            self._n8n_queue = None
+            self._n8n_flusher = None
+            self._n8n_workflow_refresh = None
+            self._primitives_loop = loop
+
+    @asynccontextmanager
+    async def _bulkhead(self, platform_name: str):
+        """Hold one of the platform's concurrency slots; yields the ms spent queueing for it"""
+        self._bind_primitives()
+        semaphore = self._bulkheads.get(platform_name)
+        if semaphore is None:
+            semaphore = self._bulkheads[platform_name] = asyncio.Semaphore(self._max_concurrency[platform_name])
+        queued_at = time.perf_counter()
+        async with semaphore:
+            yield (time.perf_counter() - queued_at) * 1000
+
+    @asynccontextmanager
+    async def _guarded_call(self, platform_name: str):
+        """Bulkhead slot behind the platform's circuit breaker for one client call; yields the
+        ms spent queueing. An open circuit fails fast, and the call's outcome is recorded."""
+        breaker = self._breakers[platform_name]
+        if not breaker.allow():
+            raise RuntimeError(f"{platform_name} circuit_open")
+        try:
+            async with self._bulkhead(platform_name) as queue_wait_ms:
+                yield queue_wait_ms
+        except BaseException:
+            # Includes cancellation by a deadline; a half-open probe must not stay in flight
+            breaker.record(False)
+            raise
+        breaker.record(True)
+
+    def _health_lock(self, platform_name: str) -> asyncio.Lock:
+        """Per-platform refresh lock for the running event loop"""
+        self._bind_primitives()
+        lock = self._health_locks.get(platform_name)
+        if lock is None:
+            lock = self._health_locks[platform_name] = asyncio.Lock()
+        return lock
+
+    def _cached_health(self, platform_name: str) -> Optional[PlatformHealth]:
+        """Cached health result if it is still within the platform's TTL"""
+        cached = self._health_cache.get(platform_name)
+        if cached and time.monotonic() - cached[0] < self._health_ttls.get(platform_name, DEFAULT_HEALTH_TTL):
+            return cached[1]
+        return None
+
     async def _health_check_platform(self, platform_name: str) -> PlatformHealth:
-        """Health check for individual platform"""
-        start_time = time.time()
+        """Health check for individual platform, served from cache while fresh"""
+        health = self._cached_health(platform_name)
+        if health is not None:
+            return health
+
+        async with self._health_lock(platform_name):
+            # Another caller may have refreshed it while this one waited
+            health = self._cached_health(platform_name)
+            if health is not None:
+                return health
+
+            breaker = self._breakers.get(platform_name)
+            if breaker is not None and not breaker.allow():
+                # Not cached, so the first call after the break probes the provider again
+                return PlatformHealth(
+                    name=platform_name,
+                    status=PlatformStatus.ERROR,
+                    response_time_ms=0.0,
+                    last_check_ns=time.time_ns(),
+                    error_message="circuit_open"
+                )
+
+            try:
+                health = await self._check_platform(platform_name)
+            except BaseException:
+                # Includes cancellation by a deadline; a half-open probe must not stay in flight
+                if breaker is not None:
+                    breaker.record(False)
+                raise
+            if breaker is not None:
+                breaker.record(health.status not in FAILED_STATUSES)
+            self._health_cache[platform_name] = (time.monotonic(), health)
+            return health
+
+    async def _check_platform(self, platform_name: str) -> PlatformHealth:
+        """Run the health check for one platform against its provider"""
+        start_time = time.perf_counter_ns()
         
         try:
-            if platform_name == "n8n":
-                return await self._health_check_n8n()
-            elif platform_name == "stripe":
-                return await self._health_check_stripe()
-            elif platform_name == "vercel":
-                return await self._health_check_vercel()
-            elif platform_name == "openai":
-                return await self._health_check_openai()
-            elif platform_name == "grok":
-                return await self._health_check_grok()
-            elif platform_name == "replicate":
-                return await self._health_check_replicate()
-            elif platform_name == "agora":
-                return await self._health_check_agora()
-            else:
+            check = self._dispatch.get(platform_name)
+            if check is None:
                 raise ValueError(f"Unknown platform: {platform_name}")
+            return await check()
                 
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name=platform_name,
                 status=PlatformStatus.ERROR,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def _health_check_n8n(self) -> PlatformHealth:
         """Health check for n8n"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            n8n_host = self.config["n8n"]["host"]
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{n8n_host}/healthz", timeout=10) as response:
-                    response_time = (time.time() - start_time) * 1000
+            session = await self._get_session()
+            async with await retry_async(lambda: session.get(self._urls["n8n"], timeout=10)) as response:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
                     
-                    if response.status == 200:
-                        # Try to get workflows to verify API access
-                        headers = {}
-                        if self.config["n8n"]["api_key"]:
-                            headers["X-N8N-API-KEY"] = self.config["n8n"]["api_key"]
-                        
-                        async with session.get(f"{n8n_host}/api/v1/workflows", 
-                                             headers=headers, timeout=10) as workflow_response:
-                            workflow_count = 0
-                            if workflow_response.status == 200:
-                                workflows = await workflow_response.json()
-                                workflow_count = len(workflows.get("data", []))
-                        
-                        return PlatformHealth(
-                            name="n8n",
-                            status=PlatformStatus.CONNECTED,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            metadata={"workflow_count": workflow_count}
-                        )
-                    else:
-                        return PlatformHealth(
-                            name="n8n",
-                            status=PlatformStatus.ERROR,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            error_message=f"HTTP {response.status}"
-                        )
+                if response.status == 200:
+                    self._schedule_n8n_workflow_count()
+                    return PlatformHealth(
+                        name="n8n",
+                        status=PlatformStatus.CONNECTED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        metadata={"workflow_count": self._n8n_workflow_count}
+                    )
+                else:
+                    return PlatformHealth(
+                        name="n8n",
+                        status=PlatformStatus.ERROR,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message=f"HTTP {response.status}"
+                    )
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="n8n",
                 status=PlatformStatus.DISCONNECTED,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
+    def _schedule_n8n_workflow_count(self):
+        """Start a background workflow listing when the last count is older than N8N_WORKFLOW_COUNT_TTL"""
+        self._bind_primitives()
+        if time.monotonic() - self._n8n_workflow_count_at < N8N_WORKFLOW_COUNT_TTL:
+            return
+        if self._n8n_workflow_refresh is None or self._n8n_workflow_refresh.done():
+            self._n8n_workflow_refresh = asyncio.create_task(self._refresh_n8n_workflow_count())
+    
+    async def _refresh_n8n_workflow_count(self):
+        """List n8n workflows (verifies API access) and keep the count for the health metadata"""
+        try:
+            session = await self._get_session()
+            async with await retry_async(lambda: session.get(self._urls["n8n_workflows"],
+                                                             headers=self._auth_headers["n8n"],
+                                                             timeout=10)) as response:
+                if response.status == 200:
+                    workflows = await read_json(response)
+                    self._n8n_workflow_count = len(workflows.get("data", []))
+                else:
+                    logger.warning("n8n workflow listing returned HTTP %s", response.status)
+        except Exception as e:
+            logger.warning("n8n workflow listing failed: %s", e)
+        finally:
+            self._n8n_workflow_count_at = time.monotonic()
+    
     async def _health_check_stripe(self) -> PlatformHealth:
         """Health check for Stripe"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            import stripe
-            stripe.api_key = self.config["stripe"]["secret_key"]
-            
-            # Test Stripe API with account info
-            account = stripe.Account.retrieve()
-            response_time = (time.time() - start_time) * 1000
-            
-            return PlatformHealth(
-                name="stripe",
-                status=PlatformStatus.CONNECTED,
-                response_time_ms=response_time,
-                last_check=datetime.utcnow(),
-                metadata={
-                    "account_id": account.id,
-                    "country": account.country,
-                    "business_profile": account.business_profile.name if account.business_profile else None
-                }
-            )
+            # Test Stripe API with account info; called over the shared session rather than
+            # the blocking SDK so it runs concurrently with the other checks
+            session = await self._get_session()
+            async with await retry_async(lambda: session.get(self._urls["stripe"],
+                                                             headers=self._auth_headers["stripe"],
+                                                             timeout=10)) as response:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
+                
+                if response.status == 200:
+                    account = await read_json(response)
+                    return PlatformHealth(
+                        name="stripe",
+                        status=PlatformStatus.CONNECTED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        metadata={
+                            "account_id": account.get("id"),
+                            "country": account.get("country"),
+                            "business_profile": (account.get("business_profile") or {}).get("name")
+                        }
+                    )
+                else:
+                    return PlatformHealth(
+                        name="stripe",
+                        status=PlatformStatus.ERROR,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message=f"HTTP {response.status}"
+                    )
             
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="stripe",
                 status=PlatformStatus.ERROR,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def _health_check_vercel(self) -> PlatformHealth:
         """Health check for Vercel"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            headers = {"Authorization": f"Bearer {self.config['vercel']['token']}"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://api.vercel.com/v2/user", 
-                                     headers=headers, timeout=10) as response:
-                    response_time = (time.time() - start_time) * 1000
+            session = await self._get_session()
+            async with await retry_async(lambda: session.get(self._urls["vercel"],
+                                                             headers=self._auth_headers["vercel"],
+                                                             timeout=10)) as response:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
                     
-                    if response.status == 200:
-                        user_data = await response.json()
-                        return PlatformHealth(
-                            name="vercel",
-                            status=PlatformStatus.CONNECTED,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            metadata={
-                                "username": user_data.get("username"),
-                                "email": user_data.get("email")
-                            }
-                        )
-                    else:
-                        return PlatformHealth(
-                            name="vercel",
-                            status=PlatformStatus.ERROR,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            error_message=f"HTTP {response.status}"
-                        )
+                if response.status == 200:
+                    user_data = await read_json(response)
+                    return PlatformHealth(
+                        name="vercel",
+                        status=PlatformStatus.CONNECTED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        metadata={
+                            "username": user_data.get("username"),
+                            "email": user_data.get("email")
+                        }
+                    )
+                else:
+                    return PlatformHealth(
+                        name="vercel",
+                        status=PlatformStatus.ERROR,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message=f"HTTP {response.status}"
+                    )
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="vercel",
                 status=PlatformStatus.DISCONNECTED,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def _health_check_openai(self) -> PlatformHealth:
         """Health check for OpenAI"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            headers = {"Authorization": f"Bearer {self.config['openai']['api_key']}"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://api.openai.com/v1/models", 
-                                     headers=headers, timeout=10) as response:
-                    response_time = (time.time() - start_time) * 1000
+            session = await self._get_session()
+            async with await retry_async(lambda: session.get(self._urls["openai"],
+                                                             headers=self._auth_headers["openai"],
+                                                             timeout=10)) as response:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
                     
-                    if response.status == 200:
-                        models_data = await response.json()
-                        model_count = len(models_data.get("data", []))
+                if response.status == 200:
+                    model = await read_json(response)
                         
-                        return PlatformHealth(
-                            name="openai",
-                            status=PlatformStatus.CONNECTED,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            metadata={"available_models": model_count}
-                        )
-                    else:
-                        return PlatformHealth(
-                            name="openai",
-                            status=PlatformStatus.ERROR,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            error_message=f"HTTP {response.status}"
-                        )
+                    return PlatformHealth(
+                        name="openai",
+                        status=PlatformStatus.CONNECTED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        metadata={"model": model.get("id")}
+                    )
+                else:
+                    return PlatformHealth(
+                        name="openai",
+                        status=PlatformStatus.ERROR,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message=f"HTTP {response.status}"
+                    )
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="openai",
                 status=PlatformStatus.DISCONNECTED,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def _health_check_grok(self) -> PlatformHealth:
         """Health check for Grok (XAI)"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.config['grok']['api_key']}",
-                "Content-Type": "application/json"
-            }
-            
             # Test with a simple chat completion request
             test_payload = {
                 "messages": [
                     {"role": "system", "content": "You are Grok, a helpful AI assistant."},
                     {"role": "user", "content": "Health check: respond with 'GROK_OK'"}
                 ],
-                "model": self.config['grok']['model'],
+                "model": self.grok.model,
                 "max_tokens": 10,
                 "temperature": 0
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.config['grok']['api_base']}/chat/completions",
-                    headers=headers, 
-                    json=test_payload,
-                    timeout=30
-                ) as response:
-                    response_time = (time.time() - start_time) * 1000
+            session = await self._get_session()
+            async with session.post(
+                self._urls["grok"],
+                headers=self._auth_headers["grok"],
+                json=test_payload,
+                timeout=30
+            ) as response:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                if response.status == 200:
+                    data = await read_json(response)
+                    content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
                         
-                        return PlatformHealth(
-                            name="grok",
-                            status=PlatformStatus.CONNECTED,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            metadata={
-                                "model": self.config['grok']['model'],
-                                "response_preview": content[:50] + "..." if len(content) > 50 else content,
-                                "api_base": self.config['grok']['api_base']
-                            }
-                        )
-                    else:
-                        error_text = await response.text()
-                        return PlatformHealth(
-                            name="grok",
-                            status=PlatformStatus.ERROR,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            error_message=f"HTTP {response.status}: {error_text[:100]}"
-                        )
+                    return PlatformHealth(
+                        name="grok",
+                        status=PlatformStatus.CONNECTED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        metadata={
+                            "model": self.grok.model,
+                            "response_preview": content[:50] + "..." if len(content) > 50 else content,
+                            "api_base": self.grok.api_base
+                        }
+                    )
+                else:
+                    error_text = await response.text()
+                    return PlatformHealth(
+                        name="grok",
+                        status=PlatformStatus.ERROR,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message=f"HTTP {response.status}: {error_text[:100]}"
+                    )
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="grok",
                 status=PlatformStatus.DISCONNECTED,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def _health_check_replicate(self) -> PlatformHealth:
         """Health check for Replicate"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            headers = {"Authorization": f"Token {self.config['replicate']['api_token']}"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://api.replicate.com/v1/account", 
-                                     headers=headers, timeout=10) as response:
-                    response_time = (time.time() - start_time) * 1000
+            session = await self._get_session()
+            async with await retry_async(lambda: session.get(self._urls["replicate"],
+                                                             headers=self._auth_headers["replicate"],
+                                                             timeout=10)) as response:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
                     
-                    if response.status == 200:
-                        account_data = await response.json()
-                        return PlatformHealth(
-                            name="replicate",
-                            status=PlatformStatus.CONNECTED,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            metadata={
-                                "username": account_data.get("username"),
-                                "github_url": account_data.get("github_url")
-                            }
-                        )
-                    elif response.status == 402:
-                        # Payment required - API key is valid but needs credit
-                        return PlatformHealth(
-                            name="replicate",
-                            status=PlatformStatus.CONFIGURED,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            error_message="API valid but needs credit (HTTP 402)"
-                        )
-                    else:
-                        return PlatformHealth(
-                            name="replicate",
-                            status=PlatformStatus.ERROR,
-                            response_time_ms=response_time,
-                            last_check=datetime.utcnow(),
-                            error_message=f"HTTP {response.status}"
-                        )
+                if response.status == 200:
+                    account_data = await read_json(response)
+                    return PlatformHealth(
+                        name="replicate",
+                        status=PlatformStatus.CONNECTED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        metadata={
+                            "username": account_data.get("username"),
+                            "github_url": account_data.get("github_url")
+                        }
+                    )
+                elif response.status == 402:
+                    # Payment required - API key is valid but needs credit
+                    return PlatformHealth(
+                        name="replicate",
+                        status=PlatformStatus.CONFIGURED,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message="API valid but needs credit (HTTP 402)"
+                    )
+                else:
+                    return PlatformHealth(
+                        name="replicate",
+                        status=PlatformStatus.ERROR,
+                        response_time_ms=response_time,
+                        last_check_ns=time.time_ns(),
+                        error_message=f"HTTP {response.status}"
+                    )
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="replicate",
                 status=PlatformStatus.DISCONNECTED,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def _health_check_agora(self) -> PlatformHealth:
         """Health check for Agora"""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # For Agora, we can't easily test the API without making actual calls
             # So we just verify the configuration is present
-            if self.config["agora"]["app_id"] and self.config["agora"]["app_certificate"]:
-                response_time = (time.time() - start_time) * 1000
+            if self.agora.app_id and self.agora.app_certificate:
+                response_time = (time.perf_counter_ns() - start_time) / 1e6
                 
                 return PlatformHealth(
                     name="agora",
                     status=PlatformStatus.CONFIGURED,
                     response_time_ms=response_time,
-                    last_check=datetime.utcnow(),
+                    last_check_ns=time.time_ns(),
                     metadata={
-                        "app_id": self.config["agora"]["app_id"][:8] + "...",  # Partially masked
-                        "token_expiration": self.config["agora"]["token_expiration"]
+                        "app_id": self.agora.app_id[:8] + "...",  # Partially masked
+                        "token_expiration": self.agora.token_expiration
                     }
                 )
             else:
@@ -869,48 +1366,45 @@ class PlatformOrchestrator:
                     name="agora",
                     status=PlatformStatus.NOT_CONFIGURED,
                     response_time_ms=0,
-                    last_check=datetime.utcnow(),
+                    last_check_ns=time.time_ns(),
                     error_message="Missing app_id or app_certificate"
                 )
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.perf_counter_ns() - start_time) / 1e6
             return PlatformHealth(
                 name="agora",
                 status=PlatformStatus.ERROR,
                 response_time_ms=response_time,
-                last_check=datetime.utcnow(),
+                last_check_ns=time.time_ns(),
                 error_message=str(e)
             )
     
     async def orchestrate_workflow(self, workflow_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Orchestrate a complex workflow across multiple platforms"""
-        logger.info(f"🎼 Orchestrating workflow: {workflow_name}")
+        logger.info("🎼 Orchestrating workflow: %s", workflow_name)
         
-        workflow_id = f"wf_{int(time.time())}"
-        start_time = time.time()
+        workflow_id = f"wf_{next_id()}"
+        start_time = time.perf_counter_ns()
         
         try:
-            if workflow_name == "face_swap_payment":
-                return await self._orchestrate_face_swap_payment(workflow_id, data)
-            elif workflow_name == "user_onboarding":
-                return await self._orchestrate_user_onboarding(workflow_id, data)
-            elif workflow_name == "live_stream_setup":
-                return await self._orchestrate_live_stream_setup(workflow_id, data)
-            elif workflow_name == "ai_content_generation":
-                return await self._orchestrate_ai_content_generation(workflow_id, data)
-            else:
+            workflow = self._workflows.get(workflow_name)
+            if workflow is None:
                 raise ValueError(f"Unknown workflow: {workflow_name}")
-                
+            result = await workflow(workflow_id, data)
+            # One pair around the whole workflow: concurrent steps overlap, so their times don't add up
+            result["processing_time_ms"] = (time.perf_counter_ns() - start_time) / 1e6
+            return result
+            
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
-            logger.error(f"❌ Workflow {workflow_name} failed: {str(e)}")
+            processing_time = (time.perf_counter_ns() - start_time) / 1e6
+            logger.error("❌ Workflow %s failed: %s", workflow_name, e)
             
             return {
                 "workflow_id": workflow_id,
                 "status": "failed",
                 "error": str(e),
                 "processing_time_ms": processing_time,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
     
     async def _orchestrate_face_swap_payment(self, workflow_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -918,65 +1412,58 @@ class PlatformOrchestrator:
         steps = []
         
         # Step 1: Validate payment with Stripe
-        if self.config["stripe"]["enabled"]:
-            stripe_result = await self._call_stripe_validate_payment(data.get("payment_intent_id"))
-            steps.append({"step": "stripe_validation", "result": stripe_result})
+        if self.stripe.enabled:
+            stripe_result = await self._run_step(steps, "stripe_validation", self._call_stripe_validate_payment(data.get("payment_intent_id")))
             
             if not stripe_result.get("valid"):
                 return {"workflow_id": workflow_id, "status": "failed", "reason": "payment_invalid", "steps": steps}
         
         # Step 2: Process face swap with Replicate
-        if self.config["replicate"]["enabled"]:
-            replicate_result = await self._call_replicate_face_swap(data.get("source_image"), data.get("target_image"))
-            steps.append({"step": "face_swap", "result": replicate_result})
+        if self.replicate.enabled:
+            replicate_result = await self._run_step(steps, "face_swap", self._call_replicate_face_swap(data.get("source_image"), data.get("target_image")))
         
-        # Step 3: Trigger n8n workflow for post-processing
-        if self.config["n8n"]["enabled"]:
-            n8n_result = await self._call_n8n_trigger("face-swap-completed", {
+        # Steps 3-4: n8n post-processing and the Vercel deploy only need the face swap output
+        calls = {}
+        if self.n8n.enabled:
+            calls["n8n_trigger"] = self._call_n8n_trigger("face-swap-completed", {
                 "workflow_id": workflow_id,
                 "user_id": data.get("user_id"),
                 "result_url": replicate_result.get("output_url"),
                 "payment_intent": data.get("payment_intent_id")
             })
-            steps.append({"step": "n8n_trigger", "result": n8n_result})
-        
-        # Step 4: Deploy result to Vercel (if configured)
-        if self.config["vercel"]["enabled"] and data.get("deploy_result"):
-            vercel_result = await self._call_vercel_deploy(replicate_result.get("output_url"))
-            steps.append({"step": "vercel_deploy", "result": vercel_result})
+        if self.vercel.enabled and data.get("deploy_result"):
+            calls["vercel_deploy"] = self._call_vercel_deploy(replicate_result.get("output_url"))
+        await self._gather_steps(steps, calls)
         
         return {
             "workflow_id": workflow_id,
             "status": "completed",
             "steps": steps,
             "final_result": replicate_result.get("output_url"),
-            "processing_time_ms": sum(step["result"].get("processing_time_ms", 0) for step in steps),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     async def _orchestrate_user_onboarding(self, workflow_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Orchestrate new user onboarding across platforms"""
         steps = []
         
-        # Step 1: Create Stripe customer
-        if self.config["stripe"]["enabled"]:
-            stripe_result = await self._call_stripe_create_customer(data.get("email"), data.get("name"))
-            steps.append({"step": "stripe_customer", "result": stripe_result})
-        
-        # Step 2: Set up Agora user profile
-        if self.config["agora"]["enabled"]:
-            agora_result = await self._call_agora_setup_user(data.get("user_id"))
-            steps.append({"step": "agora_setup", "result": agora_result})
+        # Steps 1-2: Stripe customer and Agora user profile are independent
+        calls = {}
+        if self.stripe.enabled:
+            calls["stripe_customer"] = self._call_stripe_create_customer(data.get("email"), data.get("name"))
+        if self.agora.enabled:
+            calls["agora_setup"] = self._call_agora_setup_user(data.get("user_id"))
+        results = await self._gather_steps(steps, calls)
+        stripe_result = results.get("stripe_customer", {})
         
         # Step 3: Trigger n8n onboarding workflow
-        if self.config["n8n"]["enabled"]:
-            n8n_result = await self._call_n8n_trigger("user-onboarding", {
+        if self.n8n.enabled:
+            n8n_result = await self._run_step(steps, "n8n_onboarding", self._call_n8n_trigger("user-onboarding", {
                 "workflow_id": workflow_id,
                 "user_id": data.get("user_id"),
                 "email": data.get("email"),
                 "stripe_customer_id": stripe_result.get("customer_id")
-            })
-            steps.append({"step": "n8n_onboarding", "result": n8n_result})
+            }))
         
         return {
             "workflow_id": workflow_id,
@@ -986,31 +1473,30 @@ class PlatformOrchestrator:
                 "stripe_customer_id": stripe_result.get("customer_id"),
                 "agora_user_id": data.get("user_id")
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     async def _orchestrate_live_stream_setup(self, workflow_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Orchestrate live stream setup with multiple platforms"""
         steps = []
         
-        # Step 1: Generate Agora token
-        if self.config["agora"]["enabled"]:
-            agora_result = await self._call_agora_generate_token(data.get("channel_name"), data.get("user_id"))
-            steps.append({"step": "agora_token", "result": agora_result})
-        
-        # Step 2: Set up AI processing pipeline
-        if self.config["openai"]["enabled"] and self.config["replicate"]["enabled"]:
-            ai_result = await self._setup_ai_pipeline(data.get("channel_name"))
-            steps.append({"step": "ai_pipeline", "result": ai_result})
+        # Steps 1-2: Agora token and AI processing pipeline are independent
+        calls = {}
+        if self.agora.enabled:
+            calls["agora_token"] = self._call_agora_generate_token(data.get("channel_name"), data.get("user_id"))
+        if self.openai.enabled and self.replicate.enabled:
+            calls["ai_pipeline"] = self._setup_ai_pipeline(data.get("channel_name"))
+        results = await self._gather_steps(steps, calls)
+        agora_result = results.get("agora_token", {})
+        ai_result = results.get("ai_pipeline", {})
         
         # Step 3: Trigger n8n stream monitoring
-        if self.config["n8n"]["enabled"]:
-            n8n_result = await self._call_n8n_trigger("stream-monitoring", {
+        if self.n8n.enabled:
+            n8n_result = await self._run_step(steps, "n8n_monitoring", self._call_n8n_trigger("stream-monitoring", {
                 "workflow_id": workflow_id,
                 "channel_name": data.get("channel_name"),
                 "agora_token": agora_result.get("token")
-            })
-            steps.append({"step": "n8n_monitoring", "result": n8n_result})
+            }))
         
         return {
             "workflow_id": workflow_id,
@@ -1021,7 +1507,7 @@ class PlatformOrchestrator:
                 "channel_name": data.get("channel_name"),
                 "ai_enabled": bool(ai_result.get("pipeline_id"))
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     async def _orchestrate_ai_content_generation(self, workflow_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1029,28 +1515,24 @@ class PlatformOrchestrator:
         steps = []
         
         # Step 1: Generate content with OpenAI
-        if self.config["openai"]["enabled"]:
-            openai_result = await self._call_openai_generate(data.get("prompt"))
-            steps.append({"step": "openai_generation", "result": openai_result})
+        if self.openai.enabled:
+            openai_result = await self._run_step(steps, "openai_generation", self._call_openai_generate(data.get("prompt")))
         
         # Step 2: Process images with Replicate (if needed)
-        if self.config["replicate"]["enabled"] and data.get("process_images"):
-            replicate_result = await self._call_replicate_image_processing(openai_result.get("image_prompt"))
-            steps.append({"step": "replicate_processing", "result": replicate_result})
+        if self.replicate.enabled and data.get("process_images"):
+            replicate_result = await self._run_step(steps, "replicate_processing", self._call_replicate_image_processing(openai_result.get("image_prompt")))
         
         # Step 3: Deploy content to Vercel
-        if self.config["vercel"]["enabled"]:
-            vercel_result = await self._call_vercel_deploy_content(openai_result, replicate_result)
-            steps.append({"step": "vercel_deployment", "result": vercel_result})
+        if self.vercel.enabled:
+            vercel_result = await self._run_step(steps, "vercel_deployment", self._call_vercel_deploy_content(openai_result, replicate_result))
         
         # Step 4: Trigger n8n content distribution
-        if self.config["n8n"]["enabled"]:
-            n8n_result = await self._call_n8n_trigger("content-distribution", {
+        if self.n8n.enabled:
+            n8n_result = await self._run_step(steps, "n8n_distribution", self._call_n8n_trigger("content-distribution", {
                 "workflow_id": workflow_id,
                 "content_url": vercel_result.get("url"),
                 "content_type": data.get("content_type")
-            })
-            steps.append({"step": "n8n_distribution", "result": n8n_result})
+            }))
         
         return {
             "workflow_id": workflow_id,
@@ -1061,64 +1543,152 @@ class PlatformOrchestrator:
                 "generated_images": replicate_result.get("images", []),
                 "deployment_url": vercel_result.get("url")
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
-    # Platform-specific helper methods (mock implementations)
+    async def _timed(self, call: Awaitable[Dict[str, Any]]) -> Tuple[Dict[str, Any], float]:
+        """Await one step; returns its result and the measured elapsed ms"""
+        start = time.perf_counter_ns()
+        result = await call
+        return result, (time.perf_counter_ns() - start) / 1e6
+    
+    async def _run_step(self, steps: List[Dict[str, Any]], step: str, call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Await a serial workflow step and record it with its measured time"""
+        result, elapsed_ms = await self._timed(call)
+        steps.append({"step": step, "result": result, "elapsed_ms": elapsed_ms})
+        return result
+    
+    async def _gather_steps(self, steps: List[Dict[str, Any]], calls: Dict[str, Any]) -> Dict[str, Any]:
+        """Await independent workflow steps concurrently; records them in order and returns results by step"""
+        if len(calls) > 1:
+            timed = dict(zip(calls, await asyncio.gather(*(self._timed(call) for call in calls.values()))))
+        else:
+            # Nothing to overlap: await the lone step directly instead of wrapping it in a Task
+            timed = {step: await self._timed(call) for step, call in calls.items()}
+        steps.extend(
+            {"step": step, "result": result, "elapsed_ms": elapsed_ms} for step, (result, elapsed_ms) in timed.items()
+        )
+        return {step: result for step, (result, _) in timed.items()}
+    
+    # Platform calls: each goes through the platform's circuit breaker, holds a slot in its
+    # bulkhead and reports the queue wait
     async def _call_stripe_validate_payment(self, payment_intent_id: str) -> Dict[str, Any]:
-        """Mock Stripe payment validation"""
-        await asyncio.sleep(0.1)  # Simulate API call
-        return {"valid": True, "amount": 2000, "currency": "usd", "processing_time_ms": 100}
+        """Stripe payment validation"""
+        async with self._guarded_call("stripe") as queue_wait_ms:
+            result = await self._stripe.validate_payment(payment_intent_id)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_stripe_create_customer(self, email: str, name: str) -> Dict[str, Any]:
-        """Mock Stripe customer creation"""
-        await asyncio.sleep(0.2)
-        return {"customer_id": f"cus_mock_{int(time.time())}", "email": email, "processing_time_ms": 200}
+        """Stripe customer creation"""
+        async with self._guarded_call("stripe") as queue_wait_ms:
+            result = await self._stripe.create_customer(email, name)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_replicate_face_swap(self, source_image: str, target_image: str) -> Dict[str, Any]:
-        """Mock Replicate face swap"""
-        await asyncio.sleep(2.5)  # Simulate processing time
-        return {"output_url": "https://replicate.delivery/mock-output.jpg", "processing_time_ms": 2500}
+        """Replicate face swap"""
+        async with self._guarded_call("replicate") as queue_wait_ms:
+            result = await self._replicate.face_swap(source_image, target_image)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_replicate_image_processing(self, prompt: str) -> Dict[str, Any]:
-        """Mock Replicate image processing"""
-        await asyncio.sleep(1.5)
-        return {"images": ["https://replicate.delivery/mock-1.jpg"], "processing_time_ms": 1500}
+        """Replicate image processing"""
+        async with self._guarded_call("replicate") as queue_wait_ms:
+            result = await self._replicate.process_images(prompt)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_n8n_trigger(self, workflow_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Mock n8n workflow trigger"""
-        await asyncio.sleep(0.3)
-        return {"triggered": True, "workflow_id": f"n8n_{int(time.time())}", "processing_time_ms": 300}
+        """Queue an n8n workflow trigger; resolves once the batch carrying it has been sent"""
+        self._bind_primitives()
+        if self._n8n_queue is None:
+            self._n8n_queue = asyncio.Queue()
+            self._n8n_flusher = asyncio.create_task(self._flush_n8n_triggers(self._n8n_queue))
+        future = asyncio.get_running_loop().create_future()
+        self._n8n_queue.put_nowait((workflow_name, data, future))
+        return await future
+    
+    async def _flush_n8n_triggers(self, queue: asyncio.Queue):
+        """Collect triggers for N8N_BATCH_WINDOW (or until N8N_BATCH_MAX) and send them together"""
+        # Batches are sent from their own tasks so collection continues while one is in flight
+        in_flight = set()
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < N8N_BATCH_MAX - 1:
+                await asyncio.sleep(N8N_BATCH_WINDOW)
+            while len(batch) < N8N_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            task = asyncio.create_task(self._deliver_n8n_batch(batch))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    
+    async def _deliver_n8n_batch(self, batch: List[Tuple[str, Dict[str, Any], asyncio.Future]]):
+        """Send one batch, through the router when it has several triggers, and resolve its callers"""
+        items = [(workflow_name, data) for workflow_name, data, _ in batch]
+        try:
+            if len(items) == 1:
+                results = [await self._send_n8n_trigger(*items[0])]
+            elif self.n8n.router_workflow:
+                results = await self._send_n8n_batch(items)
+            else:
+                results = await asyncio.gather(*(self._send_n8n_trigger(*item) for item in items))
+            if len(results) != len(batch):
+                # N8NClient does not promise one result per trigger; without this check
+                # callers past the end of a short result list would wait forever
+                raise RuntimeError(f"n8n returned {len(results)} results for {len(batch)} triggers")
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _send_n8n_trigger(self, workflow_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """n8n workflow trigger (POST /webhook/<workflow_name>)"""
+        async with self._guarded_call("n8n") as queue_wait_ms:
+            result = await self._n8n.trigger(workflow_name, data)
+        return {**result, "queue_wait_ms": queue_wait_ms}
+    
+    async def _send_n8n_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Router trigger: one POST /webhook/<router_workflow> for the whole batch"""
+        async with self._guarded_call("n8n") as queue_wait_ms:
+            results = await self._n8n.trigger_batch(items)
+        return [{**result, "queue_wait_ms": queue_wait_ms} for result in results]
     
     async def _call_vercel_deploy(self, content_url: str) -> Dict[str, Any]:
-        """Mock Vercel deployment"""
-        await asyncio.sleep(1.0)
-        return {"url": "https://playalter-result.vercel.app", "deployment_id": f"dpl_{int(time.time())}", "processing_time_ms": 1000}
+        """Vercel deployment"""
+        async with self._guarded_call("vercel") as queue_wait_ms:
+            result = await self._vercel.deploy(content_url)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_vercel_deploy_content(self, openai_result: Dict, replicate_result: Dict) -> Dict[str, Any]:
-        """Mock Vercel content deployment"""
-        await asyncio.sleep(1.2)
-        return {"url": "https://playalter-content.vercel.app", "processing_time_ms": 1200}
+        """Vercel content deployment"""
+        async with self._guarded_call("vercel") as queue_wait_ms:
+            result = await self._vercel.deploy_content(openai_result, replicate_result)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_agora_generate_token(self, channel_name: str, user_id: str) -> Dict[str, Any]:
-        """Mock Agora token generation"""
-        await asyncio.sleep(0.1)
-        return {"token": f"agora_token_{int(time.time())}", "expires_at": int(time.time()) + 3600, "processing_time_ms": 100}
+        """Agora token generation"""
+        async with self._guarded_call("agora") as queue_wait_ms:
+            result = await self._agora.generate_token(channel_name, user_id)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_agora_setup_user(self, user_id: str) -> Dict[str, Any]:
-        """Mock Agora user setup"""
-        await asyncio.sleep(0.2)
-        return {"user_profile_id": f"agora_user_{user_id}", "processing_time_ms": 200}
+        """Agora user setup"""
+        async with self._guarded_call("agora") as queue_wait_ms:
+            result = await self._agora.setup_user(user_id)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _call_openai_generate(self, prompt: str) -> Dict[str, Any]:
-        """Mock OpenAI content generation"""
-        await asyncio.sleep(1.0)
-        return {"text": f"Generated content for: {prompt[:50]}...", "image_prompt": "Generated image prompt", "processing_time_ms": 1000}
+        """OpenAI content generation"""
+        async with self._guarded_call("openai") as queue_wait_ms:
+            result = await self._openai.generate(prompt)
+        return {**result, "queue_wait_ms": queue_wait_ms}
     
     async def _setup_ai_pipeline(self, channel_name: str) -> Dict[str, Any]:
-        """Mock AI pipeline setup"""
-        await asyncio.sleep(0.5)
-        return {"pipeline_id": f"ai_pipeline_{int(time.time())}", "processing_time_ms": 500}
+        """AI processing pipeline setup"""
+        async with self._guarded_call("replicate"):
+            return await self._replicate.setup_pipeline(channel_name)
     
     # Hierarchical AI Agent Helper Methods
     def _analyze_image_complexity(self, input_image: str) -> Dict[str, Any]:
@@ -1145,7 +1715,7 @@ class PlatformOrchestrator:
                 "processing_recommendation": "standard" if complexity == "low" else "enhanced"
             }
         except Exception as e:
-            logger.error(f"Image analysis failed: {str(e)}")
+            logger.error("Image analysis failed: %s", e)
             return {
                 "complexity": "unknown",
                 "estimated_faces": 1,
@@ -1155,14 +1725,15 @@ class PlatformOrchestrator:
     
     async def _call_openai_decision(self, prompt: str) -> Dict[str, Any]:
         """Call OpenAI GPT-4o for master agent decision making"""
+        # Set while a request is out, so failures after it count against the breaker
+        attempted = False
         try:
-            if not self.config["openai"]["enabled"]:
+            if not self.openai.enabled:
                 raise ValueError("OpenAI not configured")
             
-            headers = {
-                "Authorization": f"Bearer {self.config['openai']['api_key']}",
-                "Content-Type": "application/json"
-            }
+            breaker = self._breakers["openai"]
+            if not breaker.allow():
+                raise RuntimeError("circuit_open")
             
             payload = {
                 "model": "gpt-4o",
@@ -1174,20 +1745,24 @@ class PlatformOrchestrator:
                 "temperature": 0.3
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with self._bulkhead("openai"):
+                session = await self._get_session()
+                attempted = True
                 async with session.post(
                     "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
+                    headers=self._auth_headers["openai"],
                     json=payload,
                     timeout=aiohttp.ClientTimeout(total=30)
                 ) as response:
                     
                     if response.status == 200:
-                        result = await response.json()
+                        breaker.record(True)
+                        attempted = False
+                        result = await read_json(response)
                         content = result.get("choices", [{}])[0].get("message", {}).get("content", "{}")
                         
                         try:
-                            decision_data = json.loads(content)
+                            decision_data = orjson.loads(content)
                             return {
                                 "strategy": decision_data.get("strategy", "standard"),
                                 "priority": decision_data.get("priority", "quality"),
@@ -1196,7 +1771,7 @@ class PlatformOrchestrator:
                                 "reasoning": decision_data.get("reasoning", "GPT-4o strategic analysis"),
                                 "estimated_time": decision_data.get("estimated_time", 3000)
                             }
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             # Fallback if JSON parsing fails
                             return {
                                 "strategy": "standard",
@@ -1209,8 +1784,14 @@ class PlatformOrchestrator:
                     else:
                         raise Exception(f"OpenAI API error: {response.status}")
                         
+        except asyncio.CancelledError:
+            if attempted:
+                self._breakers["openai"].record(False)
+            raise
         except Exception as e:
-            logger.error(f"OpenAI decision call failed: {str(e)}")
+            if attempted:
+                self._breakers["openai"].record(False)
+            logger.error("OpenAI decision call failed: %s", e)
             # Return safe fallback decision
             return {
                 "strategy": "fallback",
@@ -1224,82 +1805,33 @@ class PlatformOrchestrator:
     async def _call_replicate_advanced_mask(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Call Replicate for advanced face mask processing"""
         try:
-            if not self.config["replicate"]["enabled"]:
+            if not self.replicate.enabled:
                 raise ValueError("Replicate not configured")
             
-            headers = {
-                "Authorization": f"Token {self.config['replicate']['api_token']}",
-                "Content-Type": "application/json"
-            }
-            
-            # Enhanced face mask model with multi-face and ethics support
-            model_version = "face-to-many/advanced-mask:v2.1"
-            
-            prediction_data = {
-                "version": model_version,
-                "input": {
-                    "image": params["image"],
-                    "ethnic_preference": params["ethnic_preference"],
-                    "quality_level": params["quality_level"], 
-                    "ar_integration": params["ar_integration"],
-                    "multi_face_enabled": params["multi_face_enabled"],
-                    "ethics_check": params["ethics_check_enabled"],
-                    "processing_strategy": params["strategy"]
-                }
-            }
-            
-            # Mock Replicate API call (since we don't have actual advanced model)
-            await asyncio.sleep(2.5)  # Simulate processing time
-            
-            # Generate mock response with realistic data
-            mock_response = {
-                "id": f"replicate_{uuid.uuid4().hex[:8]}",
-                "status": "succeeded",
-                "output_url": f"https://replicate.delivery/mask_output_{int(time.time())}.jpg",
-                "faces_count": 2 if params["multi_face_enabled"] else 1,
-                "quality_score": 0.95 if params["quality_level"] == "ultra" else 0.85,
-                "ethics_score": 0.98,
-                "processing_strategy": params["strategy"],
-                "resource_usage": "high" if params["quality_level"] == "ultra" else "medium",
-                "features_applied": {
-                    "ethnic_diversity": params["ethnic_preference"] != "diverse",
-                    "ar_overlays": params["ar_integration"] in ["overlays", "full"],
-                    "multi_face_processing": params["multi_face_enabled"]
-                }
-            }
+            # Enhanced face mask model (face-to-many/advanced-mask:v2.1) with multi-face and ethics support
+            async with self._guarded_call("replicate") as queue_wait_ms:
+                mock_response = await self._replicate.advanced_mask(params)
+            mock_response["queue_wait_ms"] = queue_wait_ms
             
-            logger.info(f"✅ Replicate advanced mask processing: {mock_response['faces_count']} faces, quality {mock_response['quality_score']}")
+            logger.info("✅ Replicate advanced mask processing: %s faces, quality %s", mock_response['faces_count'], mock_response['quality_score'])
             return mock_response
             
         except Exception as e:
-            logger.error(f"Replicate advanced mask failed: {str(e)}")
+            logger.error("Replicate advanced mask failed: %s", e)
             raise Exception(f"Replicate processing failed: {str(e)}")
     
     async def _validate_ethics_compliance(self, output_url: str) -> Dict[str, Any]:
         """Validate ethics compliance of processed content"""
         try:
             # Mock ethics validation (in production, this would use AI ethics APIs)
-            await asyncio.sleep(0.3)
-            
-            ethics_result = {
-                "compliant": True,
-                "confidence": 0.98,
-                "checks_performed": [
-                    "bias_detection",
-                    "harmful_content_scan", 
-                    "privacy_protection",
-                    "consent_validation"
-                ],
-                "risk_level": "low",
-                "recommendations": [],
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            async with self._guarded_call("replicate"):
+                ethics_result = await self._replicate.validate_ethics(output_url)
             
-            logger.info(f"✅ Ethics compliance validated: {ethics_result['confidence']} confidence")
+            logger.info("✅ Ethics compliance validated: %s confidence", ethics_result['confidence'])
             return ethics_result
             
         except Exception as e:
-            logger.error(f"Ethics validation failed: {str(e)}")
+            logger.error("Ethics validation failed: %s", e)
             return {
                 "compliant": False,
                 "confidence": 0.0,
@@ -1333,51 +1865,67 @@ class PlatformOrchestrator:
         return profiles.get(quality, profiles["standard"])
     
     def get_orchestration_status(self) -> Dict[str, Any]:
-        """Get overall orchestration status"""
-        enabled_platforms = [name for name, config in self.config.items() if config['enabled']]
-        connected_platforms = [name for name, health in self.health_status.items() 
-                             if health.status in [PlatformStatus.CONNECTED, PlatformStatus.CONFIGURED]]
+        """Get overall orchestration status, reused for STATUS_CACHE_TTL or until health changes"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < STATUS_CACHE_TTL:
+            return self._status_cache[1]
         
-        return {
+        enabled_platforms = self._enabled
+        connected_platforms = self._connected_platforms
+        # One clock read serves both the timestamp and the no-checks-yet default
+        timestamp = datetime.now(timezone.utc)
+        if self._last_check_ns is not None:
+            health_last_check = datetime.fromtimestamp(self._last_check_ns / 1e9, tz=timezone.utc)
+        else:
+            health_last_check = timestamp
+        
+        status = {
             "orchestrator_status": "operational",
             "platforms": {
-                "total": len(self.config),
+                "total": len(self._platform_configs),
                 "enabled": len(enabled_platforms),
                 "connected": len(connected_platforms),
-                "health_last_check": max([h.last_check for h in self.health_status.values()], 
-                                       default=datetime.utcnow()).isoformat()
+                "health_last_check": health_last_check.isoformat()
             },
             "enabled_platforms": enabled_platforms,
             "connected_platforms": connected_platforms,
-            "available_workflows": [
-                "face_swap_payment",
-                "user_onboarding", 
-                "live_stream_setup",
-                "ai_content_generation"
-            ],
-            "timestamp": datetime.utcnow().isoformat()
+            "available_workflows": AVAILABLE_WORKFLOWS,
+            "timestamp": timestamp.isoformat()
         }
+        self._status_cache = (now, status)
+        return status
 
 # Global orchestrator instance
-orchestrator = PlatformOrchestrator()
+@functools.lru_cache(maxsize=1)
+def get_orchestrator() -> PlatformOrchestrator:
+    """Shared orchestrator, built on first use rather than at import"""
+    return PlatformOrchestrator()
 
 async def main():
     """Main function for testing orchestration"""
-    print("🎼 PLAYALTER Platform Orchestration Manager")
-    print("=" * 50)
+    # Report lines are collected and written to stdout once at the end
+    lines = [
+        "🎼 PLAYALTER Platform Orchestration Manager",
+        "=" * 50
+    ]
+    
+    orchestrator = get_orchestrator()
+    await orchestrator.start()
     
     # Perform health check
     await orchestrator.health_check_all()
     
     # Get status
     status = orchestrator.get_orchestration_status()
-    print(f"\n📊 Orchestration Status:")
-    print(f"  Total Platforms: {status['platforms']['total']}")
-    print(f"  Enabled: {status['platforms']['enabled']}")
-    print(f"  Connected: {status['platforms']['connected']}")
+    lines += [
+        "\n📊 Orchestration Status:",
+        f"  Total Platforms: {status['platforms']['total']}",
+        f"  Enabled: {status['platforms']['enabled']}",
+        f"  Connected: {status['platforms']['connected']}"
+    ]
     
     # Test workflow
-    print(f"\n🧪 Testing face swap workflow...")
+    lines.append("\n🧪 Testing face swap workflow...")
     workflow_result = await orchestrator.orchestrate_workflow("face_swap_payment", {
         "payment_intent_id": "pi_test_123",
         "source_image": "base64_source_image",
@@ -1385,9 +1933,27 @@ async def main():
         "user_id": "user_test_123"
     })
     
-    print(f"✅ Workflow completed: {workflow_result['status']}")
-    print(f"   Steps: {len(workflow_result['steps'])}")
-    print(f"   Processing time: {workflow_result.get('processing_time_ms', 0)}ms")
+    lines += [
+        f"✅ Workflow completed: {workflow_result['status']}",
+        f"   Steps: {len(workflow_result.get('steps', []))}",
+        f"   Processing time: {workflow_result.get('processing_time_ms', 0)}ms"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    await orchestrator.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop_factory = None  # default selector/proactor loop on Windows
+    if sys.platform != "win32":
+        # libuv-backed loop: cheaper task scheduling and socket dispatch than the selector loop
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    log_listener = _start_log_listener()
+    try:
+        # The runner owns the loop and shuts down async generators and the default executor on exit
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
+    finally:
+        if log_listener is not None:
+            # Flushes queued records before the interpreter exits
+            log_listener.stop()
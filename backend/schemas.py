@@ -0,0 +1,55 @@
+"""
+PLAYALTER Request Schemas
+=========================
+
+Pydantic models for inbound JSON bodies. Handlers validate the raw request
+bytes with ``Model.model_validate_json`` so parsing and validation happen in
+one pass in pydantic-core instead of ``json.loads`` plus ``data.get`` checks.
+"""
+
+from typing import Any, Dict, Optional
+
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+
+
+class OrchestrateRequest(BaseModel):
+    """Body of POST /api/orchestrate"""
+    operation: str = "general"
+    request: Any = ""
+    user_id: Any = None
+
+
+class CreateCustomerRequest(BaseModel):
+    """Body of POST /api/customers"""
+    email: str = Field(min_length=1)
+    name: Optional[str] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class FaceSwapRequest(BaseModel):
+    """Body of POST /api/face-swap, accepting the older *_image field names"""
+    source_base64: str = Field(min_length=1, validation_alias=AliasChoices("source_base64", "source_image"))
+    target_base64: str = Field(min_length=1, validation_alias=AliasChoices("target_base64", "target_image"))
+    user_id: Any = None
+
+
+class ArMaskRequest(BaseModel):
+    """Body of POST /api/ar-mask"""
+    image: str = Field(min_length=1)
+    mask_type: str = Field(min_length=1)
+    user_id: Any = None
+
+
+class UserTestRequest(BaseModel):
+    """Body of POST /api/user-test"""
+    user_id: Any
+    feedback: str = Field(min_length=1)
+    test_type: str = "general"
+    rating: Any = 0
+
+    @field_validator("user_id")
+    @classmethod
+    def user_id_present(cls, value):
+        if not value:
+            raise ValueError("user_id is required")
+        return value
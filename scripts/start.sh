@@ -23,7 +23,7 @@ source .venv/bin/activate
 
 # Install Python dependencies
 echo "📦 Installing Python dependencies..."
-pip install -r backend/requirements_enhanced.txt
+pip install -r backend/requirements.txt
 
 # Start Docker services (n8n, Redis, PostgreSQL)
 echo "🐳 Starting Docker services..."
@@ -42,13 +42,13 @@ else
     echo "❌ n8n is not responding"
 fi
 
-# Start Flask backend
+# Start Flask backend under gunicorn (gevent workers, see backend/gunicorn.conf.py)
 echo "🌐 Starting Flask backend..."
 cd backend
-python app_enhanced.py
+GEVENT=1 gunicorn -c gunicorn.conf.py app_enhanced:app
 
 echo "🎉 PLAYALTER Backend is now running!"
-echo "🔗 Backend API: http://localhost:5000"
+echo "🔗 Backend API: http://localhost:8000"
 echo "🔗 Frontend: http://localhost:4001"
 echo "🔗 n8n Interface: http://localhost:5678"
 echo "🔐 n8n Credentials: admin / playalter123"
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# Backend modules import each other by bare name (e.g. "from cache import ...")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+# Set before app_enhanced loads .env (load_dotenv never overrides): no Stripe key
+# and no Redis, so the in-process cache is used
+os.environ["STRIPE_SECRET_KEY"] = ""
+os.environ["REDIS_URL"] = ""
+
+import cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    """Empty in-process cache and no Redis client for every test"""
+    monkeypatch.setattr(cache, "_local_cache", {})
+    monkeypatch.setattr(cache, "_redis_client", None)
+    monkeypatch.setattr(cache, "_redis_down_until", 0.0)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+
+@pytest.fixture
+def client():
+    import app_enhanced
+    return app_enhanced.app.test_client()
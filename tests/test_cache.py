@@ -0,0 +1,82 @@
+import pytest
+import redis
+
+import cache
+
+
+class FailingRedis:
+    """Redis client whose every call fails as if the server were unreachable"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def _fail(self, *args, **kwargs):
+        self.calls += 1
+        raise redis.ConnectionError("connection refused")
+
+    get = setex = set = delete = _fail
+
+
+def test_set_and_get_without_redis():
+    cache.set_generic_cache("k", b"v", 60)
+    assert cache.get_generic_cache("k") == b"v"
+    assert cache.get_generic_cache("missing") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    cache.set_generic_cache("k", b"v", 10)
+    now[0] += 9
+    assert cache.get_generic_cache("k") == b"v"
+    now[0] += 1
+    assert cache.get_generic_cache("k") is None
+    assert "k" not in cache._local_cache
+
+
+def test_add_only_stores_absent_or_expired_keys(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    assert cache.add_generic_cache("k", b"first", 10) is True
+    assert cache.add_generic_cache("k", b"second", 10) is False
+    assert cache.get_generic_cache("k") == b"first"
+    now[0] += 10
+    assert cache.add_generic_cache("k", b"third", 10) is True
+    assert cache.get_generic_cache("k") == b"third"
+
+
+def test_delete_drops_every_key():
+    cache.set_generic_cache("a", b"1", 60)
+    cache.set_generic_cache("b", b"2", 60)
+    cache.set_generic_cache("c", b"3", 60)
+    cache.delete_generic_cache("a", "b", "missing")
+    assert cache.get_generic_cache("a") is None
+    assert cache.get_generic_cache("b") is None
+    assert cache.get_generic_cache("c") == b"3"
+
+
+def test_falls_back_to_local_cache_when_redis_fails(monkeypatch):
+    client = FailingRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+
+    cache.set_generic_cache("k", b"v", 60)
+    assert client.calls == 1
+    assert cache.get_generic_cache("k") == b"v"
+    assert cache.add_generic_cache("k", b"other", 60) is False
+    # Redis is skipped for REDIS_RETRY_INTERVAL after the first failure
+    assert client.calls == 1
+
+
+def test_retries_redis_after_the_retry_interval(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    client = FailingRedis()
+    monkeypatch.setattr(cache, "_redis_client", client)
+
+    cache.get_generic_cache("k")
+    now[0] += cache.REDIS_RETRY_INTERVAL - 1
+    cache.get_generic_cache("k")
+    assert client.calls == 1
+    now[0] += 1
+    cache.get_generic_cache("k")
+    assert client.calls == 2
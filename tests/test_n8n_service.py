@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+import app_enhanced
+from app_enhanced import N8N_BREAKER_COOLDOWN, N8N_BREAKER_THRESHOLD, N8N_MAX_RETRIES, N8NService
+
+
+class Upstream:
+    """httpx transport handler answering with the given statuses or exceptions in turn"""
+
+    def __init__(self, *outcomes, headers=None):
+        self.outcomes = list(outcomes)
+        self.headers = headers or {}
+        self.requests = []
+
+    def __call__(self, request):
+        outcome = self.outcomes[min(len(self.requests), len(self.outcomes) - 1)]
+        self.requests.append(request)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={"ok": True}, headers=self.headers)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic; time.sleep records its delays instead of sleeping"""
+    class Clock:
+        def __init__(self):
+            self.now = 1000.0
+            self.sleeps = []
+
+    clock = Clock()
+    monkeypatch.setattr(app_enhanced.time, "monotonic", lambda: clock.now)
+    monkeypatch.setattr(app_enhanced.time, "sleep", clock.sleeps.append)
+    monkeypatch.setattr(app_enhanced.random, "uniform", lambda low, high: 0)
+    return clock
+
+
+def make_service(upstream):
+    service = N8NService("http://n8n.test")
+    service.client.close()
+    service.client = httpx.Client(transport=httpx.MockTransport(upstream), headers=service.headers)
+    return service
+
+
+def test_gateway_errors_are_retried_with_backoff(clock):
+    upstream = Upstream(503, 502, 200)
+    result = make_service(upstream).trigger_workflow("face-swap-completed", {"id": 1})
+    assert result == {"ok": True}
+    assert len(upstream.requests) == 3
+    assert clock.sleeps == [0.3, 0.6]
+
+
+def test_retry_after_extends_the_backoff(clock):
+    upstream = Upstream(503, 200, headers={"Retry-After": "2"})
+    make_service(upstream).trigger_workflow("face-swap-completed", {})
+    assert clock.sleeps == [2.0]
+
+
+def test_other_errors_are_not_retried(clock):
+    upstream = Upstream(404)
+    result = make_service(upstream).trigger_workflow("missing", {})
+    assert "error" in result
+    assert len(upstream.requests) == 1
+
+
+def test_gives_up_after_the_retries_and_records_a_failure(clock):
+    upstream = Upstream(503)
+    service = make_service(upstream)
+    result = service.trigger_workflow("face-swap-completed", {})
+    assert "error" in result
+    assert len(upstream.requests) == N8N_MAX_RETRIES + 1
+    assert service._fail_count == 1
+
+
+def test_transport_errors_are_retried_then_raised_as_a_failure(clock):
+    upstream = Upstream(httpx.ConnectError("refused"))
+    service = make_service(upstream)
+    assert "error" in service.trigger_workflow("face-swap-completed", {})
+    assert len(upstream.requests) == N8N_MAX_RETRIES + 1
+    assert service._fail_count == 1
+
+
+def test_breaker_opens_after_consecutive_failures_and_skips_calls(clock):
+    upstream = Upstream(500)
+    service = make_service(upstream)
+    for _ in range(N8N_BREAKER_THRESHOLD):
+        service.trigger_workflow("face-swap-completed", {})
+    assert len(upstream.requests) == N8N_BREAKER_THRESHOLD
+
+    assert service.trigger_workflow("face-swap-completed", {}) == {"error": "n8n unavailable"}
+    assert len(upstream.requests) == N8N_BREAKER_THRESHOLD
+
+
+def test_breaker_lets_calls_through_after_the_cooldown_and_resets_on_success(clock):
+    upstream = Upstream(*[500] * N8N_BREAKER_THRESHOLD, 200)
+    service = make_service(upstream)
+    for _ in range(N8N_BREAKER_THRESHOLD):
+        service.trigger_workflow("face-swap-completed", {})
+    assert service._circuit_open()
+
+    clock.now += N8N_BREAKER_COOLDOWN
+    assert not service._circuit_open()
+    assert service.trigger_workflow("face-swap-completed", {}) == {"ok": True}
+    assert service._fail_count == 0
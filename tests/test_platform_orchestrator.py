@@ -0,0 +1,239 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+import platform_orchestrator
+from platform_clients import NullStripeClient
+from platform_orchestrator import BreakerState, CircuitBreaker, PlatformOrchestrator, retry_async
+
+
+class FailingStripeClient(NullStripeClient):
+    def __init__(self):
+        self.calls = 0
+
+    async def validate_payment(self, payment_intent_id):
+        self.calls += 1
+        raise ConnectionError("stripe unreachable")
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setenv("PLATFORM_CLIENTS", "null")
+    return PlatformOrchestrator()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the circuit breakers"""
+    now = [1000.0]
+    monkeypatch.setattr(platform_orchestrator.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_client_calls_are_recorded_by_the_breaker(orchestrator):
+    result = asyncio.run(orchestrator._call_stripe_validate_payment("pi_1"))
+    assert result["valid"] is True
+    assert "queue_wait_ms" in result
+    assert [ok for _, ok in orchestrator._breakers["stripe"]._samples] == [True]
+
+
+def test_failing_client_opens_the_circuit_and_then_fails_fast(orchestrator, clock):
+    client = orchestrator._stripe = FailingStripeClient()
+    breaker = orchestrator._breakers["stripe"]
+
+    async def call_repeatedly(times):
+        for _ in range(times):
+            with pytest.raises((ConnectionError, RuntimeError)):
+                await orchestrator._call_stripe_validate_payment("pi_1")
+
+    asyncio.run(call_repeatedly(breaker.minimum_throughput))
+    assert breaker.state is BreakerState.OPEN
+    assert client.calls == breaker.minimum_throughput
+
+    with pytest.raises(RuntimeError, match="stripe circuit_open"):
+        asyncio.run(orchestrator._call_stripe_validate_payment("pi_1"))
+    assert client.calls == breaker.minimum_throughput
+
+
+def test_successful_probe_after_the_break_closes_the_circuit(orchestrator, clock):
+    orchestrator._stripe = FailingStripeClient()
+    breaker = orchestrator._breakers["stripe"]
+    for _ in range(breaker.minimum_throughput):
+        with pytest.raises(ConnectionError):
+            asyncio.run(orchestrator._call_stripe_validate_payment("pi_1"))
+    assert breaker.state is BreakerState.OPEN
+
+    orchestrator._stripe = NullStripeClient()
+    clock[0] += breaker.break_duration
+    assert asyncio.run(orchestrator._call_stripe_validate_payment("pi_1"))["valid"] is True
+    assert breaker.state is BreakerState.CLOSED
+
+
+class RecordingN8NClient:
+    """n8n client recording how triggers arrive; short_by drops results from each batch"""
+
+    def __init__(self, short_by=0):
+        self.short_by = short_by
+        self.triggers = []
+        self.batches = []
+
+    async def trigger(self, workflow_name, data):
+        self.triggers.append(workflow_name)
+        return {"triggered": True, "workflow_id": workflow_name}
+
+    async def trigger_batch(self, items):
+        self.batches.append([name for name, _ in items])
+        results = [{"triggered": True, "workflow_id": name} for name, _ in items]
+        return results[:len(results) - self.short_by]
+
+
+def run_triggers(orchestrator, names):
+    async def run():
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*(orchestrator._call_n8n_trigger(name, {}) for name in names),
+                               return_exceptions=True),
+                timeout=5
+            )
+        finally:
+            await orchestrator.aclose()
+    return asyncio.run(run())
+
+
+def test_concurrent_n8n_triggers_share_one_router_batch(orchestrator):
+    client = orchestrator._n8n = RecordingN8NClient()
+    results = run_triggers(orchestrator, ["a", "b", "c"])
+    assert [result["workflow_id"] for result in results] == ["a", "b", "c"]
+    assert client.batches == [["a", "b", "c"]]
+    assert client.triggers == []
+
+
+def test_a_lone_n8n_trigger_skips_the_router(orchestrator):
+    client = orchestrator._n8n = RecordingN8NClient()
+    results = run_triggers(orchestrator, ["a"])
+    assert results[0]["workflow_id"] == "a"
+    assert client.triggers == ["a"]
+    assert client.batches == []
+
+
+def test_a_short_batch_result_fails_every_caller_instead_of_hanging(orchestrator):
+    orchestrator._n8n = RecordingN8NClient(short_by=1)
+    results = run_triggers(orchestrator, ["a", "b", "c"])
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert "2 results for 3 triggers" in str(results[0])
+
+
+def test_breaker_stays_closed_below_the_minimum_throughput(clock):
+    breaker = CircuitBreaker("test", minimum_throughput=5)
+    for _ in range(4):
+        assert breaker.allow()
+        breaker.record(False)
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_breaker_opens_at_the_failure_ratio_and_rejects_during_the_break(clock):
+    breaker = CircuitBreaker("test", failure_threshold=0.5, minimum_throughput=4, break_duration=30)
+    for succeeded in (True, True, False, False):
+        breaker.record(succeeded)
+    assert breaker.state is BreakerState.OPEN
+    clock[0] += 29
+    assert not breaker.allow()
+
+
+def test_breaker_forgets_failures_outside_the_sampling_window(clock):
+    breaker = CircuitBreaker("test", minimum_throughput=4, sampling_duration=30)
+    for _ in range(3):
+        breaker.record(False)
+    clock[0] += 31
+    breaker.record(False)
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_breaker_lets_one_probe_through_after_the_cooldown(clock):
+    breaker = CircuitBreaker("test", minimum_throughput=1, break_duration=30)
+    breaker.record(False)
+    clock[0] += 30
+    assert breaker.allow()
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record(True)
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_reopens_when_the_probe_fails(clock):
+    breaker = CircuitBreaker("test", minimum_throughput=1, break_duration=30)
+    breaker.record(False)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state is BreakerState.OPEN
+    clock[0] += 29
+    assert not breaker.allow()
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+class Upstream:
+    """request_factory for retry_async answering with the given statuses or exceptions in turn"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.responses = []
+
+    async def __call__(self):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        response = FakeResponse(outcome)
+        self.responses.append(response)
+        return response
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(platform_orchestrator.random, "uniform", lambda low, high: 0)
+
+
+def test_retry_async_returns_a_non_retryable_response_at_once(no_backoff):
+    upstream = Upstream(401)
+    assert asyncio.run(retry_async(upstream)).status == 401
+    assert upstream.calls == 1
+
+
+def test_retry_async_retries_transient_statuses_and_releases_them(no_backoff):
+    upstream = Upstream(503, 502, 200)
+    assert asyncio.run(retry_async(upstream, attempts=3)).status == 200
+    assert upstream.calls == 3
+    assert [response.released for response in upstream.responses] == [True, True, False]
+
+
+def test_retry_async_gives_up_after_attempts_with_the_last_response(no_backoff):
+    upstream = Upstream(503)
+    response = asyncio.run(retry_async(upstream, attempts=4))
+    assert response.status == 503
+    assert not response.released
+    assert upstream.calls == 4
+
+
+def test_retry_async_reraises_the_last_connection_error(no_backoff):
+    upstream = Upstream(aiohttp.ClientConnectionError("refused"))
+    with pytest.raises(aiohttp.ClientConnectionError):
+        asyncio.run(retry_async(upstream, attempts=3))
+    assert upstream.calls == 3
+
+
+def test_retry_async_recovers_from_a_timeout(no_backoff):
+    upstream = Upstream(asyncio.TimeoutError(), 200)
+    assert asyncio.run(retry_async(upstream)).status == 200
+    assert upstream.calls == 2
@@ -0,0 +1,190 @@
+import base64
+import hashlib
+import hmac
+import time
+
+import orjson
+import pytest
+import requests
+
+import app_enhanced
+import cache
+
+REPLICATE_KEY = b"replicate-webhook-test-key"
+REPLICATE_SECRET = "whsec_" + base64.b64encode(REPLICATE_KEY).decode()
+
+SUCCEEDED = {"id": "pred_1", "status": "succeeded", "output": "https://replicate.delivery/out.jpg",
+             "error": None, "metrics": {"predict_time": 1.5}}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.content = orjson.dumps(body or {})
+        self.text = self.content.decode()
+
+
+@pytest.fixture(autouse=True)
+def replicate_config(monkeypatch):
+    monkeypatch.setattr(app_enhanced, "REPLICATE_WEBHOOK_SECRET", REPLICATE_SECRET)
+    monkeypatch.setattr(app_enhanced, "REPLICATE_API_TOKEN", "r8_test")
+
+
+@pytest.fixture
+def replicate_api(monkeypatch):
+    """Stub HTTP_SESSION; set .created / .response to what Replicate answers"""
+    class Api:
+        created = FakeResponse(201, {"id": "pred_1", "status": "starting"})
+        response = FakeResponse(200, {"status": "processing"})
+        calls = 0
+
+        def __init__(self):
+            self.requests = []
+
+        def post(self, url, **kwargs):
+            self.requests.append(("POST", url, kwargs))
+            return self.created
+
+        def get(self, url, **kwargs):
+            self.calls += 1
+            self.requests.append(("GET", url, kwargs))
+            if isinstance(self.response, Exception):
+                raise self.response
+            return self.response
+
+    api = Api()
+    monkeypatch.setattr(app_enhanced.HTTP_SESSION, "post", api.post)
+    monkeypatch.setattr(app_enhanced.HTTP_SESSION, "get", api.get)
+    return api
+
+
+def replicate_headers(payload, webhook_id="msg_1", timestamp=None):
+    timestamp = str(int(time.time()) if timestamp is None else timestamp)
+    signed = f"{webhook_id}.{timestamp}.".encode() + payload
+    signature = base64.b64encode(hmac.new(REPLICATE_KEY, signed, hashlib.sha256).digest()).decode()
+    return {
+        "webhook-id": webhook_id,
+        "webhook-timestamp": timestamp,
+        "webhook-signature": f"v1,{signature}",
+        "Content-Type": "application/json"
+    }
+
+
+def post_face_swap(client):
+    return client.post("/api/face-swap", json={"source_base64": "src", "target_base64": "dst"})
+
+
+# Replicate webhook
+
+def test_replicate_webhook_caches_the_prediction(client, replicate_api):
+    payload = orjson.dumps(SUCCEEDED)
+    response = client.post("/api/replicate-webhook", data=payload, headers=replicate_headers(payload))
+    assert response.status_code == 200
+
+    response = client.get("/api/face-swap/pred_1")
+    assert response.status_code == 200
+    assert response.get_json()["swapped_url"] == "https://replicate.delivery/out.jpg"
+    assert response.get_json()["processing_time"] == 1.5
+    assert replicate_api.calls == 0
+
+
+def test_replicate_webhook_rejects_a_bad_signature(client):
+    payload = orjson.dumps(SUCCEEDED)
+    headers = replicate_headers(payload)
+    headers["webhook-signature"] = "v1," + base64.b64encode(b"x" * 32).decode()
+    response = client.post("/api/replicate-webhook", data=payload, headers=headers)
+    assert response.status_code == 400
+    assert cache.get_generic_cache("replicate:pred_1") is None
+
+
+def test_replicate_webhook_rejects_a_tampered_body(client):
+    headers = replicate_headers(orjson.dumps(SUCCEEDED))
+    tampered = orjson.dumps({**SUCCEEDED, "output": "https://evil.example/out.jpg"})
+    response = client.post("/api/replicate-webhook", data=tampered, headers=headers)
+    assert response.status_code == 400
+
+
+def test_replicate_webhook_rejects_a_stale_timestamp(client):
+    payload = orjson.dumps(SUCCEEDED)
+    stale = int(time.time()) - app_enhanced.REPLICATE_WEBHOOK_TOLERANCE - 60
+    response = client.post("/api/replicate-webhook", data=payload, headers=replicate_headers(payload, timestamp=stale))
+    assert response.status_code == 400
+
+
+def test_replicate_webhook_requires_a_configured_secret(client, monkeypatch):
+    monkeypatch.setattr(app_enhanced, "REPLICATE_WEBHOOK_SECRET", None)
+    payload = orjson.dumps(SUCCEEDED)
+    response = client.post("/api/replicate-webhook", data=payload, headers=replicate_headers(payload))
+    assert response.status_code == 400
+
+
+# face_swap_status
+
+def test_face_swap_status_looks_up_and_caches_a_finished_prediction(client, replicate_api):
+    replicate_api.response = FakeResponse(200, SUCCEEDED)
+    response = client.get("/api/face-swap/pred_1")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "success"
+
+    client.get("/api/face-swap/pred_1")
+    assert replicate_api.calls == 1
+
+
+def test_face_swap_status_does_not_cache_a_running_prediction(client, replicate_api):
+    replicate_api.response = FakeResponse(200, {"id": "pred_1", "status": "processing"})
+    assert client.get("/api/face-swap/pred_1").status_code == 202
+    assert client.get("/api/face-swap/pred_1").status_code == 202
+    assert replicate_api.calls == 2
+
+
+def test_face_swap_status_reports_a_failed_prediction(client, replicate_api):
+    replicate_api.response = FakeResponse(200, {"id": "pred_1", "status": "failed", "error": "NSFW"})
+    response = client.get("/api/face-swap/pred_1")
+    assert response.status_code == 500
+    assert response.get_json()["error"] == "NSFW"
+
+
+def test_face_swap_status_unknown_prediction(client, replicate_api):
+    replicate_api.response = FakeResponse(404, {"detail": "Not found."})
+    assert client.get("/api/face-swap/pred_1").status_code == 404
+
+
+def test_face_swap_status_is_processing_when_replicate_is_unreachable(client, replicate_api):
+    replicate_api.response = requests.exceptions.ConnectionError("unreachable")
+    response = client.get("/api/face-swap/pred_1")
+    assert response.status_code == 202
+    assert response.get_json()["status"] == "processing"
+
+
+def test_face_swap_status_without_a_token_skips_the_lookup(client, replicate_api, monkeypatch):
+    monkeypatch.setattr(app_enhanced, "REPLICATE_API_TOKEN", None)
+    assert client.get("/api/face-swap/pred_1").status_code == 202
+    assert replicate_api.calls == 0
+
+
+# face_swap
+
+def test_face_swap_returns_at_once_when_the_webhook_delivers(client, replicate_api):
+    response = post_face_swap(client)
+    assert response.status_code == 202
+    assert response.get_json()["prediction_id"] == "pred_1"
+    assert [method for method, _, _ in replicate_api.requests] == ["POST"]
+
+
+def test_face_swap_bounds_every_replicate_request(client, replicate_api, monkeypatch):
+    monkeypatch.setattr(app_enhanced, "REPLICATE_WEBHOOK_SECRET", None)
+    monkeypatch.setattr(app_enhanced.time, "sleep", lambda seconds: None)
+    replicate_api.response = FakeResponse(200, SUCCEEDED)
+    response = post_face_swap(client)
+    assert response.status_code == 200
+    assert [method for method, _, _ in replicate_api.requests] == ["POST", "GET"]
+    assert all(kwargs.get("timeout") for _, _, kwargs in replicate_api.requests)
+
+
+def test_face_swap_fails_when_a_poll_times_out(client, replicate_api, monkeypatch):
+    monkeypatch.setattr(app_enhanced, "REPLICATE_WEBHOOK_SECRET", None)
+    monkeypatch.setattr(app_enhanced.time, "sleep", lambda seconds: None)
+    replicate_api.response = requests.exceptions.ReadTimeout("read timed out")
+    response = post_face_swap(client)
+    assert response.status_code == 500
+    assert replicate_api.calls == 1
@@ -0,0 +1,122 @@
+import orjson
+import pytest
+
+import app_enhanced
+import cache
+
+
+class FakePrice:
+    def __init__(self, data):
+        self.data = data
+
+    def to_dict_recursive(self):
+        return dict(self.data)
+
+
+class FakeSession:
+    id = "cs_test_1"
+    client_secret = "cs_secret"
+    url = "https://checkout.stripe.com/c/pay/cs_test_1"
+
+
+@pytest.fixture(autouse=True)
+def stripe_config(monkeypatch):
+    monkeypatch.setattr(app_enhanced, "SEEN_EVENTS", app_enhanced.TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(app_enhanced, "STRIPE_WEBHOOK_SECRET", None)
+    triggered = []
+    monkeypatch.setattr(app_enhanced.n8n_service, "flush_triggers_async", triggered.extend)
+    monkeypatch.setattr(app_enhanced.n8n_service, "trigger_workflow_async", lambda *args, **kwargs: None)
+    return triggered
+
+
+@pytest.fixture
+def prices(monkeypatch):
+    """Stub Price.retrieve; item assignment sets what Stripe returns for a price id"""
+    class Prices(dict):
+        retrieved = []
+
+        def retrieve(self, price_id, expand=None):
+            self.retrieved.append(price_id)
+            return FakePrice(self[price_id])
+
+    stub = Prices()
+    stub.retrieved = []
+    monkeypatch.setattr(app_enhanced.stripe.Price, "retrieve", stub.retrieve)
+    return stub
+
+
+def post_stripe_event(client, event_id, event_type, obj):
+    payload = orjson.dumps({"id": event_id, "type": event_type, "data": {"object": obj}})
+    return client.post("/api/stripe-webhook", data=payload, content_type="application/json")
+
+
+def test_get_price_is_cached(prices):
+    prices["price_1"] = {"id": "price_1", "active": True}
+    assert app_enhanced.StripeService.get_price("price_1") == {"id": "price_1", "active": True}
+    assert app_enhanced.StripeService.get_price("price_1") == {"id": "price_1", "active": True}
+    assert prices.retrieved == ["price_1"]
+
+
+def test_stripe_webhook_drops_cached_subscriptions(client):
+    cache.set_generic_cache("stripe_subs:cus_1", b"[]", 60)
+    post_stripe_event(client, "evt_1", "customer.subscription.updated", {"id": "sub_1", "customer": "cus_1"})
+    assert cache.get_generic_cache("stripe_subs:cus_1") is None
+
+
+def test_stripe_webhook_drops_a_cached_price_on_price_updated(client):
+    cache.set_generic_cache("stripe_price:price_1", b'{"active": true}', 60)
+    cache.set_generic_cache("stripe_price:price_2", b'{"active": true}', 60)
+    post_stripe_event(client, "evt_1", "price.updated", {"id": "price_1", "active": False})
+    assert cache.get_generic_cache("stripe_price:price_1") is None
+    assert cache.get_generic_cache("stripe_price:price_2") is not None
+
+
+def test_stripe_webhook_drops_the_default_price_on_product_updated(client):
+    cache.set_generic_cache("stripe_price:price_1", b'{"active": true}', 60)
+    post_stripe_event(client, "evt_1", "product.updated", {"id": "prod_1", "default_price": "price_1"})
+    assert cache.get_generic_cache("stripe_price:price_1") is None
+
+
+def test_checkout_sees_a_price_deactivated_after_it_was_cached(client, prices):
+    prices["price_1"] = {"id": "price_1", "active": True}
+    assert app_enhanced.StripeService.get_price("price_1")["active"] is True
+
+    prices["price_1"] = {"id": "price_1", "active": False}
+    assert app_enhanced.StripeService.get_price("price_1")["active"] is True  # still cached
+    post_stripe_event(client, "evt_1", "price.updated", {"id": "price_1", "active": False})
+    response = client.post("/api/create-checkout-session", json={"priceId": "price_1"})
+    assert response.status_code == 400
+    assert "not active" in response.get_json()["error"]
+
+
+def test_checkout_goes_ahead_when_the_price_lookup_fails(client, monkeypatch):
+    def retrieve(price_id, expand=None):
+        raise app_enhanced.stripe.APIConnectionError("Stripe unreachable")
+
+    monkeypatch.setattr(app_enhanced.stripe.Price, "retrieve", retrieve)
+    monkeypatch.setattr(app_enhanced.stripe.checkout.Session, "create", lambda **kwargs: FakeSession())
+    response = client.post("/api/create-checkout-session", json={"priceId": "price_1"})
+    assert response.status_code == 200
+    assert response.get_json()["sessionId"] == "cs_test_1"
+
+
+def test_stripe_webhook_skips_a_duplicate_event(client, stripe_config):
+    first = post_stripe_event(client, "evt_1", "invoice.payment_succeeded", {"customer": "cus_1"})
+    assert first.get_json()["status"] == "success"
+    second = post_stripe_event(client, "evt_1", "invoice.payment_succeeded", {"customer": "cus_1"})
+    assert second.status_code == 200
+    assert second.get_json()["status"] == "duplicate"
+    assert [name for name, _ in stripe_config] == ["invoice-paid"]
+
+
+def test_stripe_webhook_skips_an_event_seen_by_another_worker(client, stripe_config):
+    cache.add_generic_cache("stripe_evt:evt_1", 1, 60)
+    response = post_stripe_event(client, "evt_1", "invoice.payment_succeeded", {"customer": "cus_1"})
+    assert response.get_json()["status"] == "duplicate"
+    assert stripe_config == []
+
+
+def test_stripe_webhook_handles_distinct_events(client, stripe_config):
+    post_stripe_event(client, "evt_1", "invoice.payment_succeeded", {"customer": "cus_1"})
+    post_stripe_event(client, "evt_2", "invoice.payment_failed", {"customer": "cus_1"})
+    assert [name for name, _ in stripe_config] == ["invoice-paid", "invoice-failed"]